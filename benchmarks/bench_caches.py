@@ -0,0 +1,69 @@
+"""
+benchmarks for the caches
+
+run from the root of the repository:
+    python -m benchmarks.bench_caches
+
+replays zipfian key streams through a memoized function, and compares the hit
+ratio and the time per call of functools.lru_cache with memoize over LRUCache,
+LFUCache and ARCCache, for several cache sizes and skews
+"""
+
+import bisect
+import functools
+import itertools
+import random
+import timeit
+
+from congeries.src import ARCCache
+from congeries.src import LFUCache
+from congeries.src import LRUCache
+from congeries.src import memoize
+
+
+def zipf_stream(n_keys: int, skew: float, length: int, seed: int = 0) -> list:
+    """return length keys in range(n_keys), where key k is drawn with probability ~ 1 / (k + 1) ** skew"""
+    rng = random.Random(seed)
+    cumulative = list(itertools.accumulate(1 / (k + 1) ** skew for k in range(n_keys)))
+    total = cumulative[-1]
+    keys = [bisect.bisect_left(cumulative, rng.random() * total) for _ in range(length)]
+    ranks = list(range(n_keys))
+    rng.shuffle(ranks)   # popular keys are not the small ones
+    return [ranks[key] for key in keys]
+
+
+def identity(x):
+    return x
+
+
+def replay(func, stream) -> None:
+    for key in stream:
+        func(key)
+
+
+def bench_zipf(n_keys=100_000, length=200_000, sizes=(100, 1_000, 10_000), skews=(0.8, 1.0, 1.2)) -> None:
+    print(f'zipfian stream of {length} calls over {n_keys} keys')
+    print(f'{"skew":>5} {"size":>7} {"cache":>16} {"hit ratio":>10} {"us/call":>8}')
+    for skew in skews:
+        stream = zipf_stream(n_keys, skew, length)
+        for size in sizes:
+            candidates = [
+                ('lru_cache', lambda: functools.lru_cache(maxsize=size)(identity)),
+                ('LRUCache', lambda: memoize(LRUCache(size))(identity)),
+                ('LFUCache', lambda: memoize(LFUCache(size))(identity)),
+                ('ARCCache', lambda: memoize(ARCCache(size))(identity)),
+            ]
+            for name, make in candidates:
+                func = make()
+                elapsed = timeit.timeit(lambda: replay(func, stream), number=1)
+                if name == 'lru_cache':
+                    info = func.cache_info()
+                    ratio = info.hits / (info.hits + info.misses)
+                else:
+                    ratio = func.cache.hit_ratio()
+                print(f'{skew:>5} {size:>7} {name:>16} {ratio:>10.3f} {elapsed / length * 1e6:>8.2f}')
+
+
+if __name__ == '__main__':
+
+    bench_zipf()
@@ -0,0 +1,76 @@
+"""
+benchmarks for IndexablePositionalList
+
+run from the root of the repository:
+    python -m benchmarks.bench_indexablepositionallist
+
+compares the cost of the rank operations (index, at, delete_at), and of the
+positional operations (add_after, delete), between PositionalList, where
+rank queries are a linear walk, and IndexablePositionalList, where all of
+them are expected O(log n)
+"""
+
+import random
+import timeit
+
+from congeries.src import IndexablePositionalList
+from congeries.src import PositionalList
+
+
+def linear_index(pl: PositionalList, pos: PositionalList.Position) -> int:
+    idx, walk = 0, pl.first()
+    while walk != pos:
+        idx, walk = idx + 1, pl.after(walk)
+    return idx
+
+
+def linear_at(pl: PositionalList, idx: int) -> PositionalList.Position:
+    walk = pl.first()
+    for _ in range(idx):
+        walk = pl.after(walk)
+    return walk
+
+
+def bench_rank(sizes=(1_000, 10_000, 100_000), queries=200) -> None:
+    print('rank queries, microseconds per operation')
+    print(f'{"size":>8} {"list":>24} {"index":>10} {"at":>10} {"delete_at":>10}')
+    rng = random.Random(0)
+    for n in sizes:
+        for cls in (PositionalList, IndexablePositionalList):
+            pl = cls.from_iterable(range(n))
+            indices = [rng.randrange(n // 2) for _ in range(queries)]
+            if cls is IndexablePositionalList:
+                index, at, delete_at = pl.index, pl.at, pl.delete_at
+            else:
+                index = lambda pos: linear_index(pl, pos)
+                at = lambda idx: linear_at(pl, idx)
+                delete_at = lambda idx: pl.delete(linear_at(pl, idx))
+            positions = [at(idx) for idx in indices]
+            t_index = timeit.timeit(lambda: [index(pos) for pos in positions], number=1)
+            t_at = timeit.timeit(lambda: [at(idx) for idx in indices], number=1)
+            t_delete = timeit.timeit(lambda: [delete_at(idx) for idx in indices], number=1)
+            print(f'{n:>8} {cls.__name__:>24} '
+                  f'{t_index / queries * 1e6:>10.2f} {t_at / queries * 1e6:>10.2f} '
+                  f'{t_delete / queries * 1e6:>10.2f}')
+
+
+def bench_positional(sizes=(1_000, 10_000, 100_000), ops=10_000) -> None:
+    print('positional updates, microseconds per operation')
+    print(f'{"size":>8} {"list":>24} {"add_after":>10} {"delete":>10}')
+    for n in sizes:
+        for cls in (PositionalList, IndexablePositionalList):
+            pl = cls.from_iterable(range(n))
+            pos = pl.first()
+            for _ in range(n // 2):
+                pos = pl.after(pos)
+            added = []
+            t_add = timeit.timeit(lambda: added.extend(pl.add_after(pos, 0) for _ in range(ops)), number=1)
+            t_delete = timeit.timeit(lambda: [pl.delete(p) for p in added], number=1)
+            print(f'{n:>8} {cls.__name__:>24} {t_add / ops * 1e6:>10.2f} {t_delete / ops * 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+
+    bench_rank()
+    print()
+    bench_positional()
@@ -0,0 +1,67 @@
+"""
+benchmarks for NumPyUF
+
+run from the root of the repository (requires numpy):
+    python -m benchmarks.bench_numpyunionfind [max_edges]
+
+batch union:
+    connects as many sites as edges with random edges, fed to NumPyUF.union_many
+    in chunks, and to WeightedQuickUnionPathCompressionUF.union one pair at a time
+    (up to 10**7 edges); checks that both find the same number of components.
+    max_edges defaults to 10**7; 10**8 edges need a few GB of memory.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from congeries.src import NumPyUF
+from congeries.src import WeightedQuickUnionPathCompressionUF
+
+
+CHUNK = 10_000_000
+
+
+def edge_chunks(n: int, edges: int, seed: int):
+    """yields the same random edges, as (p, q) arrays of at most CHUNK edges, for a given seed"""
+    rng = np.random.default_rng(seed)
+    for offset in range(0, edges, CHUNK):
+        size = min(CHUNK, edges - offset)
+        yield rng.integers(n, size=size, dtype=np.int32), rng.integers(n, size=size, dtype=np.int32)
+
+
+def bench_union(max_edges: int = 10 ** 7, loop_max_edges: int = 10 ** 7) -> None:
+    print('random edges over as many sites, seconds')
+    print(f'{"edges":>11} {"union_many":>11} {"connected_many":>15} {"union() loop":>13} {"components":>11}')
+    edges = 10 ** 6
+    while edges <= max_edges:
+        n = edges
+        uf = NumPyUF(n)
+        start = time.perf_counter()
+        for p, q in edge_chunks(n, edges, seed=edges):
+            uf.union_many(p, q)
+        t_union = time.perf_counter() - start
+
+        p, q = next(edge_chunks(n, min(edges, CHUNK), seed=0))
+        start = time.perf_counter()
+        uf.connected_many(p, q)
+        t_connected = time.perf_counter() - start
+
+        t_loop = '-'
+        if edges <= loop_max_edges:
+            reference = WeightedQuickUnionPathCompressionUF(n)
+            union = reference.union
+            start = time.perf_counter()
+            for p, q in edge_chunks(n, edges, seed=edges):
+                for p_site, q_site in zip(p.tolist(), q.tolist()):
+                    union(p_site, q_site)
+            t_loop = f'{time.perf_counter() - start:.2f}'
+            assert reference.components_count == uf.components_count
+        print(f'{edges:>11} {t_union:>11.2f} {t_connected:>15.2f} {t_loop:>13} {uf.components_count:>11}')
+        edges *= 10
+
+
+if __name__ == '__main__':
+
+    bench_union(int(float(sys.argv[1])) if len(sys.argv) > 1 else 10 ** 7)
@@ -0,0 +1,50 @@
+"""
+benchmarks for parallel_union_find
+
+run from the root of the repository:
+    python -m benchmarks.bench_parallelunionfind [edges]
+
+scaling:
+    unions random edges over as many sites with a sequential loop over
+    WeightedQuickUnionPathCompressionUF, then with parallel_union_find on
+    1, 2, 4, ... processes up to the number of processors; checks that the
+    components are the same. edges defaults to 2 * 10**6.
+"""
+
+import os
+import random
+import sys
+import time
+
+from congeries.src import WeightedQuickUnionPathCompressionUF
+from congeries.src import parallel_union_find
+
+
+def bench_scaling(edges: int = 2 * 10 ** 6, chunk_size: int = 250_000) -> None:
+    n = edges
+    rng = random.Random(0)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(edges)]
+    print(f'{edges} random edges over {n} sites, {os.cpu_count()} processors')
+    print(f'{"workers":>10} {"seconds":>9} {"speedup":>8} {"components":>11}')
+
+    start = time.perf_counter()
+    sequential = WeightedQuickUnionPathCompressionUF(n)
+    union = sequential.union
+    for p, q in pairs:
+        union(p, q)
+    baseline = time.perf_counter() - start
+    print(f'{"sequential":>10} {baseline:>9.2f} {1:>8.2f} {sequential.components_count:>11}')
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        uf = parallel_union_find(n, pairs, workers=workers, chunk_size=chunk_size)
+        elapsed = time.perf_counter() - start
+        assert uf.components_count == sequential.components_count
+        print(f'{workers:>10} {elapsed:>9.2f} {baseline / elapsed:>8.2f} {uf.components_count:>11}')
+        workers *= 2
+
+
+if __name__ == '__main__':
+
+    bench_scaling(int(float(sys.argv[1])) if len(sys.argv) > 1 else 2 * 10 ** 6)
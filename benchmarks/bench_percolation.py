@@ -0,0 +1,57 @@
+"""
+benchmarks for percolation
+
+run from the root of the repository:
+    python -m benchmarks.bench_percolation [trials]
+
+classes:
+    runs the same trials (the same seeds, so the same sites opened) on grids of
+    growing size, with each of the four UnionFind classes, in this process, and
+    reports the time per trial and the estimated threshold. Random openings keep
+    the trees shallow: QuickUnionUF stays within about 2x of the weighted classes.
+
+pool:
+    runs the trials of the largest grid with WeightedQuickUnionPathCompressionUF
+    on 1, 2, 4, ... processes up to the number of processors.
+"""
+
+import os
+import sys
+import time
+
+from congeries.src import QuickFindUF
+from congeries.src import QuickUnionUF
+from congeries.src import WeightedQuickUnionUF
+from congeries.src import WeightedQuickUnionPathCompressionUF
+from congeries.src.percolation import percolation_threshold
+
+
+def bench_classes(sizes=(16, 32, 64, 128, 256, 512), trials: int = 20) -> None:
+    print(f'{trials} trials per grid, in this process')
+    print(f'{"grid":>9} {"class":>36} {"ms/trial":>9} {"threshold":>10}')
+    for n in sizes:
+        for cls in (QuickFindUF, QuickUnionUF, WeightedQuickUnionUF, WeightedQuickUnionPathCompressionUF):
+            start = time.perf_counter()
+            estimate = percolation_threshold(n, trials, workers=1, seed=0, uf_class=cls)
+            elapsed = time.perf_counter() - start
+            print(f'{f"{n}x{n}":>9} {cls.__name__:>36} {1000 * elapsed / trials:>9.1f} {estimate.mean:>10.4f}')
+
+
+def bench_pool(n: int = 512, trials: int = 20) -> None:
+    print(f'\n{trials} trials of {n}x{n} grids, {os.cpu_count()} processors')
+    print(f'{"workers":>9} {"seconds":>9} {"threshold":>10} {"95% confidence":>20}')
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        estimate = percolation_threshold(n, trials, workers=workers, seed=0)
+        elapsed = time.perf_counter() - start
+        low, high = estimate.confidence
+        print(f'{workers:>9} {elapsed:>9.2f} {estimate.mean:>10.4f} {f"[{low:.4f}, {high:.4f}]":>20}')
+        workers *= 2
+
+
+if __name__ == '__main__':
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    bench_classes(trials=count)
+    bench_pool(trials=count)
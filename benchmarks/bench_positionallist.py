@@ -0,0 +1,100 @@
+"""
+benchmarks for PositionalList
+
+run from the root of the repository:
+    python -m benchmarks.bench_positionallist
+
+traversal:
+    walks the list with first() / after(), and counts the Position objects
+    allocated per traversal, comparing the interned Positions of PositionalList
+    with a list that allocates a fresh Position on every call (former behavior)
+
+checked / unchecked traversal:
+    compares walking the list with first() / after(), where after() validates
+    its Position, with the same loop inside pl.unchecked(), and with the
+    positions() generator, which validates only the starting Position
+"""
+
+import timeit
+
+from congeries.src import PositionalList
+
+
+class CountingPosition(PositionalList.Position):
+    """a Position that counts its instantiations"""
+
+    __slots__ = ()
+    created = 0
+
+    def __init__(self, container, record) -> None:
+        super().__init__(container, record)
+        CountingPosition.created += 1
+
+
+class InternedPositionalList(PositionalList):
+    Position = CountingPosition
+
+
+class FreshPositionalList(PositionalList):
+    """allocates a new Position on each call, as PositionalList used to do"""
+
+    Position = CountingPosition
+
+    def _make_position(self, record):
+        if record is self._header or record is self._trailer:
+            return None
+        return self.Position(self, record)
+
+
+def traverse(pl: PositionalList) -> None:
+    pos = pl.first()
+    while pos is not None:
+        pos = pl.after(pos)
+
+
+def bench_traversal(sizes=(1_000, 10_000, 100_000), repeat=5) -> None:
+    print('traversal with first() / after()')
+    print(f'{"size":>8} {"list":>22} {"positions/pass":>15} {"best pass (ms)":>15}')
+    for n in sizes:
+        for cls in (FreshPositionalList, InternedPositionalList):
+            pl = cls.from_iterable(range(n))
+            traverse(pl)   # warm up: the interned list creates its Positions here
+            CountingPosition.created = 0
+            traverse(pl)
+            allocated = CountingPosition.created
+            best = min(timeit.repeat(lambda: traverse(pl), number=1, repeat=repeat))
+            print(f'{n:>8} {cls.__name__:>22} {allocated:>15} {best * 1000:>15.3f}')
+
+
+def traverse_positions(pl: PositionalList) -> None:
+    for _ in pl.positions():
+        pass
+
+
+def traverse_unchecked(pl: PositionalList) -> None:
+    with pl.unchecked():
+        traverse(pl)
+
+
+def bench_checked_traversal(sizes=(1_000, 10_000, 100_000), repeat=5) -> None:
+    print('checked / unchecked traversal')
+    print(f'{"size":>8} {"traversal":>22} {"best pass (ms)":>15} {"speedup":>8}')
+    for n in sizes:
+        pl = PositionalList.from_iterable(range(n))
+        traverse(pl)    # warm up: creates the interned Positions
+        baseline = None
+        for name, walk in (
+                ('first() / after()', traverse),
+                ('unchecked()', traverse_unchecked),
+                ('positions()', traverse_positions),
+        ):
+            best = min(timeit.repeat(lambda: walk(pl), number=1, repeat=repeat))
+            baseline = baseline or best
+            print(f'{n:>8} {name:>22} {best * 1000:>15.3f} {baseline / best:>8.2f}')
+
+
+if __name__ == '__main__':
+
+    bench_traversal()
+    print()
+    bench_checked_traversal()
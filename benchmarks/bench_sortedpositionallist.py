@@ -0,0 +1,41 @@
+"""
+benchmarks for SortedPositionalList
+
+run from the root of the repository:
+    python -m benchmarks.bench_sortedpositionallist
+
+compares sorted insertion and removal by value of random elements into a
+SortedPositionalList (expected O(log n) skip list search) and into a Python
+list kept sorted with bisect.insort (O(log n) search, O(n) memmove)
+"""
+
+import bisect
+import random
+import timeit
+
+from congeries.src import SortedPositionalList
+
+
+def bench_sorted(sizes=(1_000, 10_000, 100_000, 1_000_000), ops=10_000) -> None:
+    print('sorted updates, microseconds per operation')
+    print(f'{"size":>8} {"container":>22} {"add":>10} {"remove":>10}')
+    rng = random.Random(0)
+    for n in sizes:
+        values = [rng.randrange(n) for _ in range(ops)]
+
+        seq = sorted(rng.randrange(n) for _ in range(n))
+        t_add = timeit.timeit(lambda: [bisect.insort(seq, value) for value in values], number=1)
+        t_remove = timeit.timeit(
+            lambda: [seq.pop(bisect.bisect_left(seq, value)) for value in values], number=1
+        )
+        print(f'{n:>8} {"list + bisect.insort":>22} {t_add / ops * 1e6:>10.2f} {t_remove / ops * 1e6:>10.2f}')
+
+        spl = SortedPositionalList.from_iterable(rng.randrange(n) for _ in range(n))
+        t_add = timeit.timeit(lambda: [spl.add(value) for value in values], number=1)
+        t_remove = timeit.timeit(lambda: [spl.remove(value) for value in values], number=1)
+        print(f'{n:>8} {"SortedPositionalList":>22} {t_add / ops * 1e6:>10.2f} {t_remove / ops * 1e6:>10.2f}')
+
+
+if __name__ == '__main__':
+
+    bench_sorted()
@@ -0,0 +1,149 @@
+"""
+benchmarks for the UnionFind classes
+
+run from the root of the repository:
+    python -m benchmarks.bench_unionfind [trees] [read-heavy] [storage]
+
+trees:
+    connects n sites with random unions, then reports the height of the tallest
+    tree, the average path length, and the average number of array accesses of
+    union() and connected(), for the four UnionFind classes.
+    The weighted classes should stay within lg n; WeightedQuickUnionUF is also
+    compared with its former sizing (sz[root] += id[other]), which broke the bound.
+
+read-heavy:
+    interleaves n random unions with 10 or 100 times as many connected() queries,
+    for QuickFindUF, its former union (a scan of the whole of id), and
+    WeightedQuickUnionPathCompressionUF.
+
+storage:
+    builds the weighted classes over n sites with list storage, then with typed
+    array storage (typed=True), and reports the memory allocated per site, and the
+    throughput of n random unions followed by n random connected() queries.
+"""
+
+import math
+import random
+import sys
+import time
+import tracemalloc
+
+from congeries.src import QuickFindUF
+from congeries.src import QuickUnionUF
+from congeries.src import WeightedQuickUnionUF
+from congeries.src import WeightedQuickUnionPathCompressionUF
+
+
+class FormerQuickFindUF(QuickFindUF):
+    """the former quick-find union, which scanned the whole of id to relabel p's component"""
+
+    def union(self, p: int, q: int) -> None:
+        if (pid := self._find(p)) == (qid := self._find(q)):
+            return
+        for idx, id_idx in enumerate(self.id):
+            if id_idx == pid:
+                self.id[idx] = qid
+        self._link(pid, qid)
+
+
+class FormerWeightedQuickUnionUF(WeightedQuickUnionUF):
+    """the former union by "size", which added a parent id instead of a size"""
+
+    def union(self, p: int, q: int) -> None:
+        proot, qroot = self._find(p), self._find(q)
+        if proot == qroot:
+            return
+        self.components_count -= 1
+        if self.sz[proot] < self.sz[qroot]:
+            self.id[proot] = qroot
+            self.sz[qroot] += self.id[proot]
+        else:
+            self.id[qroot] = proot
+            self.sz[proot] += self.id[qroot]
+
+
+def run(cls, n: int, pairs: list, queries: list) -> None:
+    uf = cls(n).instrument()
+    start = time.perf_counter()
+    for p, q in pairs:
+        uf.union(p, q)
+    for p, q in queries:
+        uf.connected(p, q)
+    elapsed = time.perf_counter() - start
+    accesses = uf.accesses_per_operation()
+    print(f'{n:>9} {cls.__name__:>36} {uf.max_depth():>6} {uf.average_path_length():>8.2f} '
+          f'{accesses["union"]:>10.1f} {accesses["connected"]:>10.1f} {elapsed:>9.2f}')
+
+
+def bench_trees(sizes=(1_000, 10_000, 100_000, 1_000_000), queries=10_000) -> None:
+    print('random unions: tree height, average path length, array accesses per operation')
+    print(f'{"sites":>9} {"class":>36} {"height":>6} {"avg path":>8} '
+          f'{"union":>10} {"connected":>10} {"time (s)":>9}')
+    rng = random.Random(0)
+    for n in sizes:
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+        tests = [(rng.randrange(n), rng.randrange(n)) for _ in range(queries)]
+        print(f'{"":>9} {"lg n":>36} {math.log2(n):>6.1f}')
+        for cls in (QuickFindUF, QuickUnionUF, FormerWeightedQuickUnionUF,
+                    WeightedQuickUnionUF, WeightedQuickUnionPathCompressionUF):
+            if cls is QuickUnionUF and n > 10_000:    # linear trees
+                continue
+            if cls is FormerWeightedQuickUnionUF and n > 100_000:
+                continue
+            run(cls, n, pairs, tests)
+
+
+def bench_read_heavy(sizes=(10_000, 100_000), reads=(10, 100)) -> None:
+    print('read-heavy mixes: n random unions among reads * n random connected(), interleaved')
+    print(f'{"sites":>9} {"reads":>6} {"class":>36} {"time (s)":>9} {"ops/s":>12}')
+    for n in sizes:
+        for ratio in reads:
+            rng = random.Random(0)
+            ops = [(rng.random() * (ratio + 1) < 1, rng.randrange(n), rng.randrange(n))
+                   for _ in range(n * (ratio + 1))]
+            for cls in (FormerQuickFindUF, QuickFindUF, WeightedQuickUnionPathCompressionUF):
+                if cls is FormerQuickFindUF and n > 10_000:    # quadratic
+                    continue
+                uf = cls(n)
+                union, connected = uf.union, uf.connected
+                start = time.perf_counter()
+                for is_union, p, q in ops:
+                    if is_union:
+                        union(p, q)
+                    else:
+                        connected(p, q)
+                elapsed = time.perf_counter() - start
+                print(f'{n:>9} {ratio:>6} {cls.__name__:>36} {elapsed:>9.2f} {len(ops) / elapsed:>12,.0f}')
+
+
+def bench_storage(n: int = 10 ** 6) -> None:
+    print(f'list against array storage, {n} sites, {n} random unions then {n} random connected()')
+    print(f'{"class":>36} {"storage":>8} {"bytes/site":>10} {"unions/s":>12} {"connected/s":>12}')
+    rng = random.Random(0)
+    pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+    tests = [(rng.randrange(n), rng.randrange(n)) for _ in range(n)]
+    for cls in (WeightedQuickUnionUF, WeightedQuickUnionPathCompressionUF):
+        for typed in (False, True):
+            tracemalloc.start()
+            uf = cls(n, typed=typed)
+            allocated = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            union, connected = uf.union, uf.connected
+            start = time.perf_counter()
+            for p, q in pairs:
+                union(p, q)
+            unions = time.perf_counter() - start
+            start = time.perf_counter()
+            for p, q in tests:
+                connected(p, q)
+            queries = time.perf_counter() - start
+            print(f'{cls.__name__:>36} {"array" if typed else "list":>8} {allocated / n:>10.1f} '
+                  f'{n / unions:>12,.0f} {n / queries:>12,.0f}')
+            del uf, union, connected
+
+
+if __name__ == '__main__':
+
+    benches = {'trees': bench_trees, 'read-heavy': bench_read_heavy, 'storage': bench_storage}
+    for name in sys.argv[1:] or benches:
+        benches[name]()
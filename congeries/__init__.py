@@ -2,14 +2,30 @@ from .src import *
 
 
 __all__ = [
+    'ARCCache',
     'CircularList',
     'Deque',
     'DoublyLinkedList',
     'FileDict',
     'FileDotDict',
+    'IndexablePositionalList',
+    'KeyedUF',
+    'LFUCache',
+    'LRUCache',
+    'NumPyUF',
     'PositionalList',
     'QuickFindUF',
     'QuickUnionUF',
+    'RollbackUF',
+    'SnapshotPositionalList',
+    'SortedPositionalList',
+    'ValueIndexedPositionalList',
     'WeightedQuickUnionUF',
     'WeightedQuickUnionPathCompressionUF',
+    'memoize',
+    'minimum_spanning_forest',
+    'offline_dynamic_connectivity',
+    'parallel_union_find',
+    'single_linkage',
+    'streaming_minimum_spanning_forest',
 ]
@@ -1,27 +1,59 @@
 import futils
+from congeries.src.caches import ARCCache
+from congeries.src.caches import LFUCache
+from congeries.src.caches import LRUCache
+from congeries.src.caches import memoize
 from congeries.src.circularlists import CircularList
 from congeries.src.deque import Deque
 from congeries.src.doublylinkedlists import DoublyLinkedList
+from congeries.src.dynamicconnectivity import offline_dynamic_connectivity
 from congeries.src.filedict import FileDict
 from congeries.src.filedict import FileDotDict
+from congeries.src.indexablepositionallist import IndexablePositionalList
+from congeries.src.kruskal import minimum_spanning_forest
+from congeries.src.kruskal import single_linkage
+from congeries.src.kruskal import streaming_minimum_spanning_forest
+from congeries.src.numpyunionfind import NumPyUF
+from congeries.src.parallelunionfind import parallel_union_find
 from congeries.src.positionallist import PositionalList
+from congeries.src.snapshotpositionallist import SnapshotPositionalList
+from congeries.src.sortedpositionallist import SortedPositionalList
+from congeries.src.unionfind import KeyedUF
 from congeries.src.unionfind import QuickFindUF
 from congeries.src.unionfind import QuickUnionUF
+from congeries.src.unionfind import RollbackUF
 from congeries.src.unionfind import WeightedQuickUnionUF
 from congeries.src.unionfind import  WeightedQuickUnionPathCompressionUF
+from congeries.src.valueindexedpositionallist import ValueIndexedPositionalList
 
 
 __all__ = [
+    'ARCCache',
     'CircularList',
     'Deque',
     'DoublyLinkedList',
     'FileDict',
     'FileDotDict',
+    'IndexablePositionalList',
+    'KeyedUF',
+    'LFUCache',
+    'LRUCache',
+    'NumPyUF',
     'PositionalList',
     'QuickFindUF',
     'QuickUnionUF',
+    'RollbackUF',
+    'SnapshotPositionalList',
+    'SortedPositionalList',
+    'ValueIndexedPositionalList',
     'WeightedQuickUnionUF',
     'WeightedQuickUnionPathCompressionUF',
+    'memoize',
+    'minimum_spanning_forest',
+    'offline_dynamic_connectivity',
+    'parallel_union_find',
+    'single_linkage',
+    'streaming_minimum_spanning_forest',
 ]
 
 
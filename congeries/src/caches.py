@@ -0,0 +1,445 @@
+"""
+Caches with bounded capacity, built on PositionalList
+
+LRUCache    evicts the least recently used entry
+LFUCache    evicts the least frequently used entry, the least recently used on ties
+ARCCache    Adaptive Replacement Cache (Megiddo & Modha, 2003); balances recency and
+            frequency, using the keys of recently evicted entries (ghosts) to adapt
+
+    create: LRUCache(capacity), LRUCache(capacity, weigher=..., on_evict=...)
+
+the capacity counts entries, unless a weigher is given, in which case it bounds the
+sum of weigher(key, value) over the entries.
+on_evict(key, value) is called each time an entry is evicted to make room.
+hits, misses and evictions count the outcomes of get and the evictions.
+
+memoize(cache) is a decorator that caches the results of a function in cache;
+@memoize() and @memoize use an LRUCache(128)
+
+"""
+
+import functools
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator
+from congeries.src.positionallist import PositionalList
+
+
+_MISSING = object()
+
+
+@dataclass
+class Entry:
+    """a cached key value pair, and its weight"""
+    key: Hashable
+    value: Any
+    weight: float = 1
+
+
+class _Segment:
+    """
+    A PositionalList of Entry, from least to most recently used, that keeps track
+    of the total weight of its entries
+    """
+
+    def __init__(self) -> None:
+        self.order = PositionalList()
+        self.weight = 0
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __bool__(self) -> bool:
+        return bool(self.order)
+
+    def push(self, entry: Entry) -> PositionalList.Position:
+        """adds entry as the most recently used, and returns its Position"""
+        self.weight += entry.weight
+        return self.order.add_last(entry)
+
+    def remove(self, pos: PositionalList.Position) -> Entry:
+        """removes the entry at Position pos, and returns it"""
+        entry = self.order.delete(pos)
+        self.weight -= entry.weight
+        return entry
+
+    def pop_lru(self) -> Entry:
+        """removes the least recently used entry, and returns it"""
+        return self.remove(self.order.first())
+
+
+class Cache(ABC):
+    """
+    A mapping of bounded capacity, that evicts entries according to a replacement policy
+
+    Subclasses implement the policy
+    """
+
+    def __init__(
+            self,
+            capacity: float,
+            weigher: Callable[[Hashable, Any], float] or None = None,
+            on_evict: Callable[[Hashable, Any], None] or None = None,
+    ) -> None:
+        """
+        :param capacity: the maximum number of entries, or total weight if weigher is given
+        :param weigher: a function of key and value that returns the weight of an entry
+        :param on_evict: a function of key and value, called when an entry is evicted
+        """
+        if capacity <= 0:
+            raise ValueError('capacity must be positive')
+        self.capacity = capacity
+        self.weigher = weigher
+        self.on_evict = on_evict
+        self.weight = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: dict = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """True if key is cached; does not count as an access"""
+        return key in self._entries
+
+    def __iter__(self) -> Iterator:
+        """return a new iterator over the cached keys"""
+        return iter(list(self._entries))
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        if key not in self._entries:
+            raise KeyError(key)
+        entry = self._remove(key)
+        self.weight -= entry.weight
+
+    def __repr__(self) -> str:
+        return (f'{self.__class__.__name__}(capacity={self.capacity}, weight={self.weight}, '
+                f'hits={self.hits}, misses={self.misses}, evictions={self.evictions})')
+
+    def hit_ratio(self) -> float:
+        """return the ratio of hits over accesses, or 0.0 if there was no access"""
+        accesses = self.hits + self.misses
+        return self.hits / accesses if accesses else 0.0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """return the value cached for key, and count a hit; otherwise count a miss and return default
+
+        :param key: a hashable key
+        :param default: the value returned on a miss
+        :return: the cached value, or default
+        """
+        entry = self._resident(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(key)
+        return entry.value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """caches value for key, evicting entries as needed to stay within capacity
+
+        an entry heavier than the capacity is not cached
+        :param key: a hashable key
+        :param value: the value to cache
+        :return: None
+        """
+        weight = self.weigher(key, value) if self.weigher is not None else 1
+        if weight > self.capacity:
+            self.pop(key, None)
+            return
+        entry = self._resident(key)
+        if entry is None:
+            self._admit(key, value, weight)
+            return
+        self.weight += weight - entry.weight
+        entry.value, entry.weight = value, weight
+        self._touch(key)
+        self._make_room(0)
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """removes key and returns its value; return default, or raise KeyError if key is not cached"""
+        if key not in self._entries:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        entry = self._remove(key)
+        self.weight -= entry.weight
+        return entry.value
+
+    def clear(self) -> None:
+        """removes all the entries; does not reset the counters"""
+        for key in list(self._entries):
+            del self[key]
+
+    def _make_room(self, weight: float) -> None:
+        """evicts entries until an entry of weight fits within capacity"""
+        while self._entries and self.weight + weight > self.capacity:
+            self._evicted(self._evict())
+
+    def _evicted(self, entry: Entry) -> None:
+        """accounts for an entry that was evicted"""
+        self.weight -= entry.weight
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(entry.key, entry.value)
+
+    @abstractmethod
+    def _resident(self, key: Hashable) -> Entry or None:
+        """return the Entry cached for key, or None; does not count as an access"""
+
+    @abstractmethod
+    def _touch(self, key: Hashable) -> None:
+        """records an access to the cached key"""
+
+    @abstractmethod
+    def _admit(self, key: Hashable, value: Any, weight: float) -> None:
+        """makes room for, and caches a new entry; adds its weight to self.weight"""
+
+    @abstractmethod
+    def _evict(self) -> Entry:
+        """removes the entry chosen by the replacement policy, and returns it"""
+
+    @abstractmethod
+    def _remove(self, key: Hashable) -> Entry:
+        """removes the entry cached for key, and returns it"""
+
+
+class LRUCache(Cache):
+    """
+    Least Recently Used cache
+
+    a dict maps each key to its Position in a PositionalList ordered by recency;
+    a hit moves the entry to the back in O(1)
+    """
+
+    def __init__(self, capacity: float, weigher=None, on_evict=None) -> None:
+        super().__init__(capacity, weigher, on_evict)
+        self._order = _Segment()
+
+    def _resident(self, key: Hashable) -> Entry or None:
+        pos = self._entries.get(key)
+        return pos.payload() if pos is not None else None
+
+    def _touch(self, key: Hashable) -> None:
+        self._order.order.move_to_back(self._entries[key])
+
+    def _admit(self, key: Hashable, value: Any, weight: float) -> None:
+        self._make_room(weight)
+        self._entries[key] = self._order.push(Entry(key, value, weight))
+        self.weight += weight
+
+    def _evict(self) -> Entry:
+        entry = self._order.pop_lru()
+        del self._entries[entry.key]
+        return entry
+
+    def _remove(self, key: Hashable) -> Entry:
+        return self._order.remove(self._entries.pop(key))
+
+
+class _Bucket:
+    """the entries of an LFUCache that share the same access count"""
+
+    __slots__ = ('count', 'entries')
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.entries = _Segment()
+
+
+class LFUCache(Cache):
+    """
+    Least Frequently Used cache, with O(1) operations
+
+    a PositionalList of buckets, in increasing access counts, each holding a
+    PositionalList of the entries with that count, from least to most recently used
+    (Shah, Mitra & Matani, "An O(1) algorithm for implementing the LFU cache eviction scheme")
+    """
+
+    def __init__(self, capacity: float, weigher=None, on_evict=None) -> None:
+        super().__init__(capacity, weigher, on_evict)
+        self._buckets = PositionalList()
+
+    def _resident(self, key: Hashable) -> Entry or None:
+        located = self._entries.get(key)
+        return located[1].payload() if located is not None else None
+
+    def _unlink(self, key: Hashable) -> tuple:
+        """removes the entry for key from its bucket, deleting the bucket once empty
+
+        :return: a tuple of the entry, and the Position of the bucket before it, or None
+        """
+        bucket_pos, entry_pos = self._entries.pop(key)
+        bucket = bucket_pos.payload()
+        entry = bucket.entries.remove(entry_pos)
+        prev = self._buckets.before(bucket_pos)
+        if not bucket.entries:
+            self._buckets.delete(bucket_pos)
+            return entry, prev
+        return entry, bucket_pos
+
+    def _touch(self, key: Hashable) -> None:
+        bucket_pos, _ = self._entries[key]
+        count = bucket_pos.payload().count + 1
+        entry, prev = self._unlink(key)
+        succ = self._buckets.after(prev) if prev is not None else self._buckets.first()
+        if succ is None or succ.payload().count != count:
+            succ = (self._buckets.add_after(prev, _Bucket(count)) if prev is not None
+                    else self._buckets.add_first(_Bucket(count)))
+        self._entries[key] = (succ, succ.payload().entries.push(entry))
+
+    def _admit(self, key: Hashable, value: Any, weight: float) -> None:
+        self._make_room(weight)
+        first = self._buckets.first()
+        if first is None or first.payload().count != 1:
+            first = self._buckets.add_first(_Bucket(1))
+        self._entries[key] = (first, first.payload().entries.push(Entry(key, value, weight)))
+        self.weight += weight
+
+    def _evict(self) -> Entry:
+        bucket = self._buckets.first().payload()
+        return self._unlink(bucket.entries.order.first().payload().key)[0]
+
+    def _remove(self, key: Hashable) -> Entry:
+        return self._unlink(key)[0]
+
+
+class ARCCache(Cache):
+    """
+    Adaptive Replacement Cache (Megiddo & Modha, "ARC: A Self-Tuning, Low Overhead
+    Replacement Cache", FAST 2003)
+
+    t1 holds the entries seen once recently, t2 those seen at least twice;
+    b1 and b2 hold the keys (ghosts) recently evicted from t1 and t2.
+    A hit on a ghost of b1 (b2) grows (shrinks) p, the target weight of t1.
+    Sizes are measured in weight, which reduces to the original algorithm with unit weights.
+    """
+
+    def __init__(self, capacity: float, weigher=None, on_evict=None) -> None:
+        super().__init__(capacity, weigher, on_evict)
+        self._t1, self._t2, self._b1, self._b2 = _Segment(), _Segment(), _Segment(), _Segment()
+        self._ghosts: dict = {}
+        self._ghost_in_b2 = False
+        self.p = 0
+
+    def _resident(self, key: Hashable) -> Entry or None:
+        located = self._entries.get(key)
+        return located[1].payload() if located is not None else None
+
+    def _touch(self, key: Hashable) -> None:
+        segment, pos = self._entries[key]
+        self._entries[key] = (self._t2, self._t2.push(segment.remove(pos)))
+
+    def _drop_ghost(self, ghosts: _Segment) -> None:
+        """forgets the least recently evicted key of ghosts"""
+        del self._ghosts[ghosts.pop_lru().key]
+
+    def _admit(self, key: Hashable, value: Any, weight: float) -> None:
+        c = self.capacity
+        t1, t2, b1, b2 = self._t1, self._t2, self._b1, self._b2
+        ghost = self._ghosts.pop(key, None)
+        if ghost is not None:
+            ghosts, pos = ghost
+            if ghosts is b1:
+                self.p = min(c, self.p + max(b2.weight / b1.weight if b1.weight else 1, 1) * weight)
+            else:
+                self.p = max(0, self.p - max(b1.weight / b2.weight if b2.weight else 1, 1) * weight)
+            ghosts.remove(pos)
+            self._ghost_in_b2 = ghosts is b2
+            target = t2
+        else:
+            self._ghost_in_b2 = False
+            if t1.weight + b1.weight + weight > c:
+                while b1 and t1.weight + b1.weight + weight > c:
+                    self._drop_ghost(b1)
+                while t1 and t1.weight + weight > c:
+                    entry = t1.pop_lru()
+                    del self._entries[entry.key]
+                    self._evicted(entry)
+            else:
+                while b2 and t1.weight + t2.weight + b1.weight + b2.weight + weight > 2 * c:
+                    self._drop_ghost(b2)
+            target = t1
+        self._make_room(weight)
+        self._entries[key] = (target, target.push(Entry(key, value, weight)))
+        self.weight += weight
+
+    def _evict(self) -> Entry:
+        """the REPLACE subroutine: demotes the LRU entry of t1 or t2 to a ghost"""
+        t1 = self._t1
+        if t1 and (t1.weight > self.p or (self._ghost_in_b2 and t1.weight == self.p) or not self._t2):
+            source, ghosts = t1, self._b1
+        else:
+            source, ghosts = self._t2, self._b2
+        entry = source.pop_lru()
+        del self._entries[entry.key]
+        self._ghosts[entry.key] = (ghosts, ghosts.push(Entry(entry.key, None, entry.weight)))
+        return entry
+
+    def _remove(self, key: Hashable) -> Entry:
+        segment, pos = self._entries.pop(key)
+        return segment.remove(pos)
+
+    def clear(self) -> None:
+        """removes all the entries and ghosts; does not reset the counters"""
+        super().clear()
+        while self._b1:
+            self._drop_ghost(self._b1)
+        while self._b2:
+            self._drop_ghost(self._b2)
+        self.p = 0
+
+
+def memoize(cache: Cache or Callable or None = None) -> Callable:
+    """decorator that caches the results of a function in cache
+
+    used as @memoize(cache), @memoize() or bare @memoize, the last two with the default cache;
+    the arguments of the decorated function must be hashable; the cache is exposed
+    as the cache attribute of the decorated function
+    :param cache: a Cache, an LRUCache(128) by default; or the function to decorate, for bare @memoize
+    :return: a decorator, or the decorated function for bare @memoize
+    """
+    if cache is not None and not isinstance(cache, Cache):
+        if callable(cache):
+            return memoize()(cache)
+        raise TypeError(f'cache must be a Cache, not {type(cache).__name__}')
+
+    def decorator(func: Callable) -> Callable:
+        store = cache if cache is not None else LRUCache(128)
+        kwargs_mark = (_MISSING, )
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args if not kwargs else args + kwargs_mark + tuple(sorted(kwargs.items()))
+            value = store.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                store.put(key, value)
+            return value
+
+        wrapper.cache = store
+        return wrapper
+
+    return decorator
+
+
+if __name__ == '__main__':
+
+    @memoize(LRUCache(100))
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print(fib(80), fib.cache)
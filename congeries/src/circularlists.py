@@ -15,15 +15,62 @@ class CircularList(DLLBase):
     a linked list in which each node keeps an explicit reference to the node
     before it and a reference to the node after it.
 
-    maintains a reference to a cursor
+    maintains a reference to a cursor, and any number of named bookmarks
+    pinned to Records; a bookmark behaves like an extra cursor that can be
+    jumped to, inserted at, popped at, or iterated from in O(1)
     """
 
     def __init__(self) -> None:
         """
         # use from_iterable to init a CircularList from an iterable
+        # implementation detail: _bookmarks maps name -> Record, and _pinned maps
+        # id(Record) -> set of names, so removing a Record only visits its own bookmarks
         """
         super().__init__()
         self.cursor: 'CircularList.Record' or None = None
+        self._bookmarks: dict = {}
+        self._pinned: dict = {}
+
+    def _insert_after(self, record: 'CircularList.Record' or None, payload: Any) -> 'CircularList.Record':
+        """helper method that inserts payload after record, or in an empty list if record is None
+
+        :param record: a Record of this list, or None if the list is empty
+        :param payload: the value to store in the list
+        :return: the newly inserted Record
+        """
+        new_record = self.Record(payload=payload, prev=None, suiv=None)
+        if record is None:
+            assert self._size == 0
+            new_record.prev, new_record.suiv = new_record, new_record
+        else:
+            new_record.prev, new_record.suiv = record, record.suiv
+            record.suiv.prev, record.suiv = new_record, new_record
+        self._size += 1
+        return new_record
+
+    def _remove_record(self, record: 'CircularList.Record') -> Any:
+        """helper method that deletes record and returns its payload
+
+        the cursor and the bookmarks pinned to record are moved to its successor;
+        they are cleared if record was the last one in the list
+        :param record: a Record of this list
+        :return: the payload of the deleted record
+        """
+        payload = record.payload
+        succ = record.suiv if self._size > 1 else None
+        if succ is not None:
+            pred = record.prev
+            pred.suiv, succ.prev = succ, pred
+        if self.cursor is record:
+            self.cursor = succ
+        if (names := self._pinned.pop(id(record), None)) is not None:
+            for name in names:
+                self._unpin(name)
+                if succ is not None:
+                    self._pin(name, succ)
+        record.deprecate()
+        self._size -= 1
+        return payload
 
     def insert_at_cursor(self, payload: Any) -> 'CircularList.Record':
         """
@@ -33,36 +80,188 @@ class CircularList(DLLBase):
         :param payload: the value to store in the list
         :return: the new cursor at the newly inserted position
         """
-        new_record = self.Record(payload=payload, prev=None, suiv=None)
+        self.cursor = self._insert_after(self.cursor, payload)
+        return self.cursor
+
+    def insert_many_at_cursor(self, it: Iterable) -> 'CircularList.Record' or None:
+        """
+        inserts the items of it, in order, at position after cursor, assigns the last
+        inserted node to cursor, and returns it
+
+        the new nodes are chained in one pass, then spliced in with O(1) relinks
+        :param it: an iterable
+        :return: the new cursor at the last inserted position
+        """
+        Record = self.Record
+        first = last = None
+        count = 0
+        for item in it:
+            record = Record(payload=item, prev=last, suiv=None)
+            if last is None:
+                first = record
+            else:
+                last.suiv = record
+            last = record
+            count += 1
+        if first is None:
+            return self.cursor
         if self.cursor is None:
             assert self._size == 0
-            self.cursor = new_record
-            self.cursor.prev, self.cursor.suiv = self.cursor, self.cursor
+            first.prev, last.suiv = last, first
         else:
-            new_record.prev, new_record.suiv = self.cursor, self.cursor.suiv
-            self.cursor.suiv.prev, self.cursor.suiv = new_record, new_record
-            self.cursor = new_record
-        self._size += 1
+            succ = self.cursor.suiv
+            first.prev, last.suiv = self.cursor, succ
+            self.cursor.suiv, succ.prev = first, last
+        self._size += count
+        self.cursor = last
         return self.cursor
 
     def pop_at(self) -> 'CircularList.Record':
         """returns the payload of the cursor node,
         deletes the cursor node
-        assigns the previous node as the new cursor
-        Deletes the cursor node
+        assigns the next node as the new cursor
+        bookmarks pinned to the cursor node are moved to the next node
         """
         if len(self) == 0:
             raise IndexError('popping from an empty CircularList')
-        old_cursor, ret_payload = self.cursor, self.cursor.payload
-        if len(self) > 1:
-            pred = self.cursor.prev
-            succ = self.cursor.suiv
-            pred.suiv = succ
-            succ.prev = pred
-            self.cursor = succ
-        old_cursor.deprecate()
-        self._size -= 1
-        return ret_payload
+        return self._remove_record(self.cursor)
+
+    def pop_many(self, n: int) -> list:
+        """returns the payloads of the n nodes starting at cursor, and deletes them
+
+        equivalent to n successive calls to pop_at, but the run of nodes is unlinked
+        with a single relink; the cursor, and the bookmarks pinned to the run,
+        are moved to the node after the run
+        :param n: the number of nodes to pop
+        :return: a list of the popped payloads, in order
+        """
+        if n < 0:
+            raise ValueError('n must be a non negative int')
+        if n > len(self):
+            raise IndexError('popping more items than the CircularList holds')
+        if n == 0:
+            return []
+        first = self.cursor
+        pred = first.prev
+        payloads, moved = [], []
+        current = first
+        for _ in range(n):
+            payloads.append(current.payload)
+            if (names := self._pinned.pop(id(current), None)) is not None:
+                moved.extend(names)
+            current, record = current.suiv, current
+            record.deprecate()
+        self._size -= n
+        if self._size == 0:
+            self.cursor = None
+            for name in moved:
+                self._bookmarks.pop(name)
+        else:
+            pred.suiv, current.prev = current, pred
+            self.cursor = current
+            for name in moved:
+                self._pin(name, current)
+        return payloads
+
+    def _pin(self, name: str, record: 'CircularList.Record') -> None:
+        """helper method that pins bookmark name to record"""
+        self._bookmarks[name] = record
+        self._pinned.setdefault(id(record), set()).add(name)
+
+    def _unpin(self, name: str) -> 'CircularList.Record':
+        """helper method that removes bookmark name, and returns the Record it was pinned to"""
+        record = self._bookmarks.pop(name)
+        names = self._pinned.get(id(record))
+        if names is not None:
+            names.discard(name)
+            if not names:
+                del self._pinned[id(record)]
+        return record
+
+    def _bookmarked(self, name: str) -> 'CircularList.Record':
+        """helper method that returns the Record pinned by bookmark name, or raise KeyError"""
+        try:
+            return self._bookmarks[name]
+        except KeyError:
+            raise KeyError(f'no bookmark named {name!r}') from None
+
+    def set_bookmark(self, name: str) -> 'CircularList.Record':
+        """pins a bookmark called name to the cursor node, and returns it
+
+        an existing bookmark with the same name is moved
+        :param name: the name of the bookmark
+        :return: the bookmarked Record
+        """
+        if len(self) == 0:
+            raise IndexError('bookmarking an empty CircularList')
+        if name in self._bookmarks:
+            self._unpin(name)
+        self._pin(name, self.cursor)
+        return self.cursor
+
+    def del_bookmark(self, name: str) -> None:
+        """removes the bookmark called name
+
+        :param name: the name of the bookmark
+        :return: None
+        """
+        self._bookmarked(name)
+        self._unpin(name)
+
+    def bookmarks(self) -> Iterator:
+        """return a new iterator over the names of the bookmarks"""
+        return iter(list(self._bookmarks))
+
+    def jump_to(self, name: str) -> 'CircularList.Record':
+        """moves the cursor to the node pinned by bookmark name in O(1), and returns it
+
+        :param name: the name of the bookmark
+        :return: the new cursor
+        """
+        self.cursor = self._bookmarked(name)
+        return self.cursor
+
+    def insert_at_bookmark(self, name: str, payload: Any) -> 'CircularList.Record':
+        """
+        inserts payload at position after bookmark name, moves the bookmark to the
+        new node, and returns it; the cursor does not move
+
+        :param name: the name of the bookmark
+        :param payload: the value to store in the list
+        :return: the bookmarked Record at the newly inserted position
+        """
+        new_record = self._insert_after(self._bookmarked(name), payload)
+        self._unpin(name)
+        self._pin(name, new_record)
+        return new_record
+
+    def pop_at_bookmark(self, name: str) -> Any:
+        """returns the payload of the node pinned by bookmark name, and deletes it
+
+        the bookmark (and the cursor, and other bookmarks pinned to the same node)
+        move to the next node
+        :param name: the name of the bookmark
+        :return: the payload of the deleted node
+        """
+        return self._remove_record(self._bookmarked(name))
+
+    def iter_from(self, name: str) -> Iterator:
+        """return a new iterator that yields each payload once, starting at bookmark name
+
+        the cursor does not move
+        :param name: the name of the bookmark
+        """
+        return self._iter_from(self._bookmarked(name))
+
+    def _iter_from(self, start: 'CircularList.Record' or None) -> Iterator:
+        """yields each payload once, starting at Record start"""
+        if start is None:
+            return StopIteration
+        current = start
+        yield current.payload
+        while (current := current.suiv) is not start:
+            yield current.payload
+        return StopIteration
 
     def rotate(self, steps=1):
         """rotates steps numbers of steps to the right if steps > 0 and to the left if steps is < 0
@@ -88,13 +287,7 @@ class CircularList(DLLBase):
         """return a new iterator object that iterates over all the objects
         in the container to yield each payload
         """
-        if not self:
-            return StopIteration
-        current = self.cursor
-        yield current.payload
-        while (current:=current.suiv) is not self.cursor:
-            yield current.payload
-        return StopIteration
+        return self._iter_from(self.cursor)
 
     def __str__(self) -> str:
         pre, suf = [f'{self.__class__.__qualname__}('], [')']
@@ -115,8 +308,7 @@ class CircularList(DLLBase):
         of the iterable passed as a parameter
         """
         new_seq: cls = cls()
-        for item in it:
-            new_seq.insert_at_cursor(item)
+        new_seq.insert_many_at_cursor(it)
         if len(new_seq) > 0:
             new_seq.cursor = new_seq.cursor.suiv   # reset cursor to first item inserted
         return new_seq
@@ -0,0 +1,306 @@
+"""
+the dynamic connectivity filter over files of pairs p q, as a streaming pipeline
+
+reads the pairs p q of an input file, and writes to the output only those that are not
+implied by the pairs read before them: the connections that merge two components.
+
+connectivity_filter(path, out, n=None, ...) -> tuple:   filter the file, return (pairs read, pairs written)
+read_pairs(path, dtype=None, ...) -> Iterator:          yield the pairs of a file by chunks (ps, qs, position)
+filter_pairs(uf, ps, qs) -> tuple:                      the pairs of a chunk that merge two components
+
+The input is memory-mapped and cut into chunks of about chunk_bytes, at line boundaries;
+each chunk is parsed at once, with numpy.fromstring if numpy is installed, with int() over
+bytes.split() otherwise. The kept pairs of a chunk are written with one write() call.
+
+formats:
+    text:     whitespace separated integers, one pair p q per line
+              with header=True, the first integer is the number of sites (as in tinyUF.txt)
+    binary:   dtype='i4' or 'i8', consecutive pairs of native int32 or int64; the output
+              has the same format as the input
+
+With n sites, the pairs drive a WeightedQuickUnionPathCompressionUF(n); without, a KeyedUF
+that adds the sites as they are read.
+
+command line, from the root of the repository:
+    python -m congeries.src.connectivityfilter input [-o output] [-n N | --header] [--dtype i4|i8]
+or, once the package is installed:
+    congeries-filter input [-o output] [-n N | --header] [--dtype i4|i8]
+The module is not imported by the package, so that running it with -m does not import it twice:
+import connectivity_filter from congeries.src.connectivityfilter.
+
+progress and throughput are reported on stderr, unless --quiet.
+"""
+
+import argparse
+import mmap
+import sys
+import time
+import warnings
+
+from array import array
+from typing import BinaryIO
+from typing import Iterator
+from typing import TextIO
+
+try:
+    import numpy as np
+except ImportError:    # optional dependency
+    np = None
+
+from congeries.src.unionfind import KeyedUF
+from congeries.src.unionfind import UnionFind
+from congeries.src.unionfind import WeightedQuickUnionPathCompressionUF
+
+
+_TYPECODES = {'i4': 'i', 'i8': 'q'}
+
+
+def _typecode(dtype: str) -> str:
+    """Utility method that returns the array typecode of a binary dtype, 'i4' or 'i8'"""
+    typecode = _TYPECODES.get(dtype)
+    if typecode is None or array(typecode).itemsize != int(dtype[1]):
+        raise ValueError(f'unsupported dtype {dtype!r}, expected one of {sorted(_TYPECODES)}')
+    return typecode
+
+
+def _parse_text(chunk: bytes) -> list:
+    """Utility method that parses a chunk of whitespace separated integers, at once
+
+    :param chunk: bytes
+    :return: a list of int
+    """
+    if np is None:
+        return list(map(int, chunk.split()))
+    with warnings.catch_warnings():
+        # numpy warns, and stops, at the first token that is not an integer
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            return np.fromstring(chunk, dtype=np.int64, sep=' ').tolist()
+        except (DeprecationWarning, ValueError):
+            raise ValueError('the input contains tokens that are not integers') from None
+
+
+def read_header(path: str) -> tuple:
+    """return the number of sites on the first line of a text file, and the offset of the second line
+
+    :param path: str, the path of a text file
+    :return: a tuple (n, offset) of int
+    """
+    with open(path, 'rb') as f:
+        line = f.readline()
+        return int(line), f.tell()
+
+
+def read_pairs(path: str, dtype: str or None = None, offset: int = 0, chunk_bytes: int = 1 << 24) -> Iterator:
+    """yield the pairs of a file, by chunks of about chunk_bytes
+
+    :param path: str, the path of the input file
+    :param dtype: None for text, 'i4' or 'i8' for binary pairs of native int32 or int64
+    :param offset: int, the number of bytes to skip at the start of the file (a header)
+    :param chunk_bytes: int, the size of the chunks read, a line longer than that makes a larger chunk
+    :return: an iterator of tuples (ps, qs, position), the sequences of the sites p and q
+             of the chunk, and the offset in the file of the end of the chunk
+    """
+    if chunk_bytes < 1:
+        raise ValueError('chunk_bytes must be positive')
+    typecode = dtype and _typecode(dtype)
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+        if size <= offset:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if typecode:
+                pair_bytes = 2 * array(typecode).itemsize
+                if (size - offset) % pair_bytes:
+                    raise ValueError(f'the size of {path} is not a multiple of {pair_bytes} bytes')
+                chunk_bytes = max(chunk_bytes - chunk_bytes % pair_bytes, pair_bytes)
+            start = offset
+            while start < size:
+                end = min(start + chunk_bytes, size)
+                if typecode:
+                    values = array(typecode)
+                    values.frombytes(mm[start:end])
+                else:
+                    if end < size:
+                        # cut after the last complete line, or after the first one if it is longer
+                        newline = mm.rfind(b'\n', start, end)
+                        if newline < 0:
+                            newline = mm.find(b'\n', end)
+                        end = size if newline < 0 else newline + 1
+                    values = _parse_text(mm[start:end])
+                    if len(values) % 2:
+                        raise ValueError(f'odd number of sites in {path}, between bytes {start} and {end}')
+                yield values[0::2], values[1::2], end
+                start = end
+
+
+def filter_pairs(uf: UnionFind, ps, qs) -> tuple:
+    """union the pairs ps[i] qs[i] in order, and return those that merged two components
+
+    A pair merges two components when it increases the number of merges, the number of
+    sites less the number of components; this also holds for a KeyedUF that adds sites.
+    The sites are not range checked here: connectivity_filter checks them once per chunk.
+    :param uf: a UnionFind, or a KeyedUF
+    :param ps: a sequence of int, sites p
+    :param qs: a sequence of int, sites q, of the same length as ps
+    :return: a tuple (ps, qs) of lists of int, the pairs kept
+    """
+    kept_ps, kept_qs = [], []
+    union, sites = uf.union, uf.id
+    merges = len(sites) - uf.components_count
+    for p, q in zip(ps, qs):
+        union(p, q)
+        if len(sites) - uf.components_count != merges:
+            merges += 1
+            kept_ps.append(p)
+            kept_qs.append(q)
+    return kept_ps, kept_qs
+
+
+def _check_sites(ps, qs, n: int, path: str, start: int, end: int) -> None:
+    """Utility method that raises ValueError if a site of the chunk between bytes start and end is out of [0, n)"""
+    low, high = min(min(ps), min(qs)), max(max(ps), max(qs))
+    if low < 0 or high >= n:
+        site = low if low < 0 else high
+        raise ValueError(f'site {site} out of range [0, {n}) in {path}, between bytes {start} and {end}')
+
+
+def _write_pairs(out: BinaryIO, ps: list, qs: list, typecode: str or None) -> None:
+    """Utility method that writes the pairs of a chunk with one call, as text lines or as binary"""
+    if not ps:
+        return
+    if typecode is None:
+        out.write(''.join([f'{p} {q}\n' for p, q in zip(ps, qs)]).encode())
+        return
+    pairs = array(typecode, bytes(2 * len(ps) * array(typecode).itemsize))
+    pairs[0::2], pairs[1::2] = array(typecode, ps), array(typecode, qs)
+    out.write(pairs)
+
+
+def connectivity_filter(
+        path: str,
+        out: BinaryIO,
+        n: int or None = None,
+        dtype: str or None = None,
+        header: bool = False,
+        chunk_bytes: int = 1 << 24,
+        progress: TextIO or None = None,
+        interval: float = 1.0,
+) -> tuple:
+    """
+    write to out the pairs of the file at path that are not implied by the pairs before them
+
+    :param path: str, the path of the input file
+    :param out: a binary stream, for the pairs kept, in the format of the input
+    :param n: int, the number of sites; None to take it from the header, or to add the sites as they come;
+              a site out of [0, n) raises ValueError, before any pair of its chunk is written
+    :param dtype: None for text, 'i4' or 'i8' for binary pairs of native int32 or int64
+    :param header: bool, True if the first line of the text file is the number of sites
+    :param chunk_bytes: int, the size of the chunks read
+    :param progress: a text stream, for a progress line every interval seconds, and a summary; None for silence
+    :param interval: float, the number of seconds between two progress lines
+    :return: a tuple (read, kept) of int, the number of pairs read and written
+    """
+    typecode = dtype and _typecode(dtype)
+    offset = 0
+    if header:
+        if typecode:
+            raise ValueError('binary files have no header')
+        n, offset = read_header(path)
+    uf = KeyedUF() if n is None else WeightedQuickUnionPathCompressionUF(n)
+    with open(path, 'rb') as f:
+        size = f.seek(0, 2)
+    read = kept = 0
+    chunk_start = offset
+    start = last = time.perf_counter()
+    for ps, qs, position in read_pairs(path, dtype, offset, chunk_bytes):
+        if n is not None and len(ps):
+            _check_sites(ps, qs, n, path, chunk_start, position)
+        chunk_start = position
+        kept_ps, kept_qs = filter_pairs(uf, ps, qs)
+        _write_pairs(out, kept_ps, kept_qs, typecode)
+        read += len(ps)
+        kept += len(kept_ps)
+        if progress is not None and (now := time.perf_counter()) - last >= interval:
+            last = now
+            _report(progress, read, kept, position, size, now - start)
+    if progress is not None:
+        _report(progress, read, kept, size, size, time.perf_counter() - start, end='\n')
+    return read, kept
+
+
+def _report(progress: TextIO, read: int, kept: int, position: int, size: int, elapsed: float, end: str = '\r') -> None:
+    """Utility method that writes a progress line: the share of the file read, the pairs, and the throughput"""
+    elapsed = max(elapsed, 1e-9)
+    done = position / size if size else 1.0
+    print(f'{done:6.1%}  {read:,} pairs read, {kept:,} kept, '
+          f'{read / elapsed:,.0f} pairs/s, {position / elapsed / 2 ** 20:,.1f} MiB/s, {elapsed:.1f} s',
+          end=end, file=progress, flush=True)
+
+
+class _OutputFile:
+    """
+    A binary stream over the file at path, that opens (and truncates) the file at the first write
+
+    The pairs are written once the first chunk of the input is read and checked: an input
+    that is missing or invalid from the start leaves an existing output file untouched.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = None
+
+    def open(self) -> None:
+        """open the file for writing, if it is not open yet"""
+        if self.file is None:
+            self.file = open(self.path, 'wb')
+
+    def write(self, data: bytes) -> int:
+        self.open()
+        return self.file.write(data)
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+
+
+def main(argv: list or None = None, prog: str or None = None) -> int:
+    """the command line entry point
+
+    :param argv: a list of str, the arguments, defaults to sys.argv[1:]
+    :param prog: str, the name of the program in the messages, defaults to the name it was invoked with
+    :return: int, the exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='write the pairs p q of a file that are not implied by the pairs before them')
+    parser.add_argument('input', help='the file of pairs')
+    parser.add_argument('-o', '--output', help='the file for the pairs kept, defaults to stdout')
+    sites = parser.add_mutually_exclusive_group()
+    sites.add_argument('-n', '--sites', type=int, help='the number of sites, 0 .. N-1')
+    sites.add_argument('--header', action='store_true', help='the first line of the input is the number of sites')
+    parser.add_argument('--dtype', choices=sorted(_TYPECODES), help='binary input of native int32 or int64 pairs')
+    parser.add_argument('--chunk-bytes', type=int, default=1 << 24, help='the size of the chunks read')
+    parser.add_argument('-q', '--quiet', action='store_true', help='do not report progress on stderr')
+    args = parser.parse_args(argv)
+
+    out = _OutputFile(args.output) if args.output else sys.stdout.buffer
+    try:
+        connectivity_filter(args.input, out, n=args.sites, dtype=args.dtype, header=args.header,
+                            chunk_bytes=args.chunk_bytes, progress=None if args.quiet else sys.stderr)
+        if args.output:
+            out.open()    # an input without pairs to keep makes an empty output
+    except (OSError, ValueError) as error:
+        print(f'{parser.prog}: error: {error}', file=sys.stderr)
+        return 1
+    finally:
+        if args.output:
+            out.close()
+        else:
+            out.flush()
+    return 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main(prog=f'python -m {__spec__.name}' if __spec__ else None))
@@ -0,0 +1,110 @@
+"""
+offline dynamic connectivity: connectivity queries over a graph whose edges are added and removed
+
+offline_dynamic_connectivity(n, operations) -> list
+
+The whole sequence of operations is known in advance. Each edge is present over intervals
+of time, between its addition and its removal, where time is the index of the queries.
+Every interval is stored in the O(log q) nodes of a segment tree over the q queries that
+cover it; a depth first traversal of the tree unions the edges of a node on the way down,
+answers the query at each leaf, and rolls the unions of the node back on the way up, with
+a RollbackUF. Each edge is unioned O(log q) times, and each union costs O(log n): the
+whole sequence takes O(m log q log n) for m operations.
+
+operations:
+    ('add', p, q):         add the edge p - q; an edge can be added several times (a multigraph)
+    ('remove', p, q):      remove one copy of the edge p - q, raise ValueError if absent
+    ('connected', p, q):   query, answered with True if p & q are connected, False otherwise
+    ('count',):            query, answered with the number of components
+"""
+
+from typing import Iterable
+
+from congeries.src.unionfind import RollbackUF
+
+
+_QUERIES = ('connected', 'count')
+
+
+def offline_dynamic_connectivity(n: int, operations: Iterable) -> list:
+    """
+    return the answers to the queries of a sequence of additions and removals of edges
+
+    :param n: int, the number of sites
+    :param operations: an iterable of tuples, ('add', p, q), ('remove', p, q),
+                       ('connected', p, q) or ('count',), with sites in [0, n)
+    :return: a list, the answer of each query, in order
+    """
+    queries, intervals, opened = [], [], {}
+    for operation in operations:
+        kind = operation[0]
+        if kind in ('add', 'remove', 'connected'):
+            _, p, q = operation
+            if not (0 <= p < n and 0 <= q < n):
+                raise IndexError(f'site index out of range in {operation}')
+        if kind in _QUERIES:
+            queries.append(operation)
+        elif kind in ('add', 'remove'):
+            edge = (p, q) if p <= q else (q, p)
+            if kind == 'add':
+                opened.setdefault(edge, []).append(len(queries))
+            elif opened.get(edge):
+                intervals.append((opened[edge].pop(), len(queries), edge))
+            else:
+                raise ValueError(f'cannot remove the absent edge {p} - {q}')
+        else:
+            raise ValueError(f'unknown operation {operation!r}')
+    for edge, starts in opened.items():
+        intervals.extend((start, len(queries), edge) for start in starts)
+    if not queries:
+        return []
+
+    # the segment tree over [0, len(queries)): node 1 is the root, the children of node k are 2k and 2k + 1
+    size = 1
+    while size < len(queries):
+        size *= 2
+    edges = [[] for _ in range(2 * size)]
+    for start, stop, edge in intervals:
+        # the O(log q) nodes covering [start, stop), bottom-up
+        lo, hi = start + size, stop + size
+        while lo < hi:
+            if lo & 1:
+                edges[lo].append(edge)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                edges[hi].append(edge)
+            lo, hi = lo // 2, hi // 2
+
+    uf = RollbackUF(n)
+    answers = [None] * len(queries)
+    # a negative node marks the rollback of the node, once its subtree is done
+    stack = [1]
+    marks = [0] * (2 * size)
+    while stack:
+        node = stack.pop()
+        if node < 0:
+            uf.rollback(marks[-node])
+            continue
+        marks[node] = uf.checkpoint()
+        for p, q in edges[node]:
+            uf.union(p, q)
+        if node >= size:
+            time = node - size
+            if time < len(queries):
+                query = queries[time]
+                answers[time] = uf.components_count if query[0] == 'count' else uf.connected(query[1], query[2])
+            uf.rollback(marks[node])
+        else:
+            stack.append(-node)
+            stack.append(2 * node + 1)
+            stack.append(2 * node)
+    return answers
+
+
+if __name__ == '__main__':
+
+    print(offline_dynamic_connectivity(4, [
+        ('add', 0, 1), ('add', 1, 2), ('connected', 0, 2), ('count',),
+        ('remove', 1, 2), ('connected', 0, 2), ('add', 2, 3), ('add', 0, 3), ('connected', 0, 2),
+    ]))
@@ -0,0 +1,352 @@
+"""
+a PositionalList that also knows the rank (index) of its Positions
+
+IndexablePositionalList
+    create: IndexablePositionalList() or IndexablePositionalList.from_iterable(iterable)
+
+"""
+
+import random
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+from congeries.src.positionallist import PositionalList
+
+
+class IndexablePositionalList(PositionalList):
+    """
+    A PositionalList augmented with an indexable skip list
+
+    The doubly linked Records form level 0 of the skip list; a Record of height h
+    also carries h - 1 express lanes, each with a link to the previous and next
+    Record at that level, and the width (number of level 0 links) it spans.
+
+    index(pos), at(idx) and delete_at(idx) run in expected O(log n) time.
+    add_*, move_*, delete and replace keep their semantics, but adding, moving
+    or deleting now costs expected O(log n) instead of O(1), to maintain the
+    express lanes.
+    """
+
+    _MAX_HEIGHT = 32
+
+    def __init__(self) -> None:
+        """
+        # implementation detail: the sentinel Records carry express lanes on every level
+        # in use; _height is the number of levels, including level 0
+        """
+        super().__init__()
+        self._height = 1
+        for sentinel in (self._header, self._trailer):
+            sentinel.lanes_prev, sentinel.lanes_suiv, sentinel.lanes_width = [], [], []
+
+    @dataclass(eq=False, repr=False)
+    class Record(PositionalList.Record):
+        """
+        a PositionalList.Record with express lanes; lane k links the Records at level k + 1
+
+        lanes_width[k] is the number of level 0 links between this Record and lanes_suiv[k]
+        """
+        lanes_prev: list or tuple = ()
+        lanes_suiv: list or tuple = ()
+        lanes_width: list or tuple = ()
+
+        def deprecate(self) -> None:
+            """avoid loitering by overwriting all references attached to the record,
+            including the express lanes
+
+            :return: None
+            """
+            super().deprecate()
+            self.lanes_prev, self.lanes_suiv, self.lanes_width = (), (), ()
+
+    def _random_height(self) -> int:
+        """
+        Utility method that draws a height from a geometric distribution of parameter 1/2
+
+        :return: an int in [1, _MAX_HEIGHT]
+        """
+        bits = random.getrandbits(self._MAX_HEIGHT - 1)
+        return (~bits & (bits + 1)).bit_length()    # 1 + number of trailing ones
+
+    def _grow(self, height: int) -> None:
+        """
+        Utility method that adds express lanes to the sentinels, up to height levels
+
+        Only called while linking a Record that is counted in the size, but not yet in the lanes
+        :param height: the new number of levels
+        :return: None
+        """
+        header, trailer = self._header, self._trailer
+        for _ in range(self._height, height):
+            header.lanes_prev.append(None)
+            header.lanes_suiv.append(trailer)
+            header.lanes_width.append(self._size)
+            trailer.lanes_prev.append(header)
+            trailer.lanes_suiv.append(None)
+            trailer.lanes_width.append(0)
+        self._height = height
+
+    def _link_lanes(self, record: 'IndexablePositionalList.Record') -> None:
+        """
+        Utility method that links a Record, already linked at level 0, in the express lanes
+
+        Climbs back from the record to find its predecessor at each level, and updates
+        the widths of the lanes that span it
+        :param record: an IndexablePositionalList.Record, without express lanes
+        :return: None
+        """
+        height = self._random_height()
+        if height > self._height:
+            self._grow(height)
+        lanes_prev, lanes_suiv, lanes_width = [], [], []
+        node, dist = record.prev, 1    # dist is rank(record) - rank(node)
+        for level in range(1, self._height):
+            lane = level - 1
+            while (top := len(node.lanes_suiv)) < level:
+                if top == 0:
+                    node, dist = node.prev, dist + 1
+                else:
+                    node = node.lanes_prev[top - 1]
+                    dist += node.lanes_width[top - 1]
+            if level < height:
+                succ = node.lanes_suiv[lane]
+                lanes_prev.append(node)
+                lanes_suiv.append(succ)
+                lanes_width.append(node.lanes_width[lane] + 1 - dist)
+                node.lanes_suiv[lane], node.lanes_width[lane] = record, dist
+                succ.lanes_prev[lane] = record
+            else:
+                node.lanes_width[lane] += 1
+        if height > 1:
+            record.lanes_prev, record.lanes_suiv, record.lanes_width = lanes_prev, lanes_suiv, lanes_width
+
+    def _unlink_lanes(self, record: 'IndexablePositionalList.Record') -> None:
+        """
+        Utility method that unlinks a Record from the express lanes; it stays linked at level 0
+
+        :param record: an IndexablePositionalList.Record
+        :return: None
+        """
+        height = len(record.lanes_suiv) + 1
+        for lane in range(height - 1):
+            pred, succ = record.lanes_prev[lane], record.lanes_suiv[lane]
+            pred.lanes_suiv[lane], succ.lanes_prev[lane] = succ, pred
+            pred.lanes_width[lane] += record.lanes_width[lane] - 1
+        node = record.lanes_prev[-1] if height > 1 else record.prev
+        for level in range(height, self._height):
+            while (top := len(node.lanes_suiv)) < level:
+                node = node.lanes_prev[top - 1] if top > 0 else node.prev
+            node.lanes_width[level - 1] -= 1
+        if height > 1:
+            record.lanes_prev, record.lanes_suiv, record.lanes_width = (), (), ()
+
+    def _insert_between(
+            self,
+            payload: Any,
+            prev_rec: 'IndexablePositionalList.Record',
+            succ_rec: 'IndexablePositionalList.Record',
+    ) -> 'IndexablePositionalList.Position':
+        """
+        Utility method; override inherited version to link the new Record in the express lanes
+
+        :param payload: Any object or value
+        :param prev_rec: IndexablePositionalList.Record
+        :param succ_rec: IndexablePositionalList.Record
+        :return: an IndexablePositionalList.Position carrying the corresponding Record
+        """
+        position = super()._insert_between(payload, prev_rec, succ_rec)
+        self._link_lanes(position.record)
+        return position
+
+    def _delete_record(self, record: 'IndexablePositionalList.Record') -> Any:
+        """
+        Utility method; override inherited version to unlink the Record from the express lanes
+
+        :param record: the IndexablePositionalList.Record to be deleted
+        :return: payload
+        """
+        self._unlink_lanes(record)
+        return super()._delete_record(record)
+
+    def _insert_many_between(
+            self,
+            it: Iterable,
+            prev_rec: 'IndexablePositionalList.Record',
+            succ_rec: 'IndexablePositionalList.Record',
+    ) -> list:
+        """
+        Utility method; override inherited version to link the new Records in the express lanes
+
+        :param it: an iterable of payloads
+        :param prev_rec: IndexablePositionalList.Record
+        :param succ_rec: IndexablePositionalList.Record
+        :return: the list of the new IndexablePositionalList.Record, in order
+        """
+        records = super()._insert_many_between(it, prev_rec, succ_rec)
+        # the lanes (and _grow) only account for the records already linked in them
+        self._size -= len(records)
+        for record in records:
+            self._size += 1
+            self._link_lanes(record)
+        return records
+
+    def _delete_run(
+            self,
+            first: 'IndexablePositionalList.Record',
+            last: 'IndexablePositionalList.Record',
+    ) -> list:
+        """
+        Utility method; override inherited version to unlink the Records from the express lanes
+
+        :param first: IndexablePositionalList.Record
+        :param last: IndexablePositionalList.Record, first or a record after it
+        :return: the list of the payloads of the deleted records, in order
+        """
+        stop, current = last.suiv, first
+        while current is not stop:
+            self._unlink_lanes(current)
+            current = current.suiv
+        return super()._delete_run(first, last)
+
+    def _relink_between(
+            self,
+            record: 'IndexablePositionalList.Record',
+            prev_rec: 'IndexablePositionalList.Record',
+            succ_rec: 'IndexablePositionalList.Record',
+    ) -> None:
+        """
+        Utility method; override inherited version to move the Record in the express lanes
+
+        :param record: the IndexablePositionalList.Record to move
+        :param prev_rec: IndexablePositionalList.Record
+        :param succ_rec: IndexablePositionalList.Record
+        :return: None
+        """
+        if prev_rec is record or succ_rec is record:
+            return
+        self._unlink_lanes(record)
+        super()._relink_between(record, prev_rec, succ_rec)
+        self._link_lanes(record)
+
+    def _rebuild_lanes(self) -> None:
+        """
+        Utility method that draws new express lanes for every Record, in one pass, in O(n)
+
+        :return: None
+        """
+        header, trailer = self._header, self._trailer
+        header.lanes_prev, header.lanes_suiv, header.lanes_width = [], [], []
+        lasts, ranks = [], []   # for each lane, the last Record linked in it, and its rank
+        rank, current = 0, header
+        while (current := current.suiv) is not trailer:
+            rank += 1
+            height = self._random_height()
+            for _ in range(len(lasts), height - 1):
+                header.lanes_prev.append(None)
+                header.lanes_suiv.append(None)
+                header.lanes_width.append(0)
+                lasts.append(header)
+                ranks.append(0)
+            if height == 1:
+                current.lanes_prev, current.lanes_suiv, current.lanes_width = (), (), ()
+                continue
+            current.lanes_prev = lasts[:height - 1]
+            current.lanes_suiv, current.lanes_width = [None] * (height - 1), [0] * (height - 1)
+            for lane in range(height - 1):
+                prev = lasts[lane]
+                prev.lanes_suiv[lane], prev.lanes_width[lane] = current, rank - ranks[lane]
+                lasts[lane], ranks[lane] = current, rank
+        trailer.lanes_prev = list(lasts)
+        trailer.lanes_suiv, trailer.lanes_width = [None] * len(lasts), [0] * len(lasts)
+        for lane, prev in enumerate(lasts):
+            prev.lanes_suiv[lane], prev.lanes_width[lane] = trailer, rank + 1 - ranks[lane]
+        self._height = len(lasts) + 1
+
+    def merge_all(self, others: Iterable, key: Callable or None = None) -> None:
+        """
+        Merge the sorted IndexablePositionalLists others into this one, in O(n log k)
+
+        override inherited version to redraw the express lanes of the merged list, in O(n)
+        :param others: an iterable of IndexablePositionalList, sorted by key
+        :param key: a function of one argument that extracts a comparison key from a payload
+        :return: None
+        """
+        others = list(others)
+        super().merge_all(others, key=key)
+        for other in others:
+            other._rebuild_lanes()
+        self._rebuild_lanes()
+
+    def _normalize_index(self, idx: int) -> int:
+        """
+        Utility method that checks idx, and maps a negative idx to its positive equivalent
+
+        :param idx: an int, negative values count from the back
+        :return: an int in [0, len(self))
+        """
+        if not isinstance(idx, int):
+            raise TypeError('idx must be an int')
+        if idx < 0:
+            idx += self._size
+        if not 0 <= idx < self._size:
+            raise IndexError('IndexablePositionalList index out of range')
+        return idx
+
+    def _record_at(self, idx: int) -> 'IndexablePositionalList.Record':
+        """
+        Utility method that descends the express lanes to the Record at index idx
+
+        :param idx: an int in [0, len(self))
+        :return: the IndexablePositionalList.Record at index idx
+        """
+        target = idx + 1    # the header has rank 0
+        node, rank = self._header, 0
+        for lane in range(self._height - 2, -1, -1):
+            while rank + node.lanes_width[lane] <= target:
+                rank += node.lanes_width[lane]
+                node = node.lanes_suiv[lane]
+        while rank < target:
+            node, rank = node.suiv, rank + 1
+        return node
+
+    def index(self, pos: 'IndexablePositionalList.Position') -> int:
+        """
+        return the index of Position pos in the list, in expected O(log n)
+
+        :param pos: an IndexablePositionalList.Position
+        :return: an int, the number of Positions before pos
+        """
+        node = self._validate(pos)
+        header, rank = self._header, 0
+        while node is not header:
+            if (top := len(node.lanes_suiv)) == 0:
+                node, rank = node.prev, rank + 1
+            else:
+                node = node.lanes_prev[top - 1]
+                rank += node.lanes_width[top - 1]
+        return rank - 1
+
+    def at(self, idx: int) -> 'IndexablePositionalList.Position':
+        """
+        return the Position at index idx, in expected O(log n)
+
+        :param idx: an int, negative values count from the back
+        :return: the IndexablePositionalList.Position at index idx
+        """
+        return self._make_position(self._record_at(self._normalize_index(idx)))
+
+    def delete_at(self, idx: int) -> Any:
+        """
+        remove and return the element at index idx, in expected O(log n)
+
+        :param idx: an int, negative values count from the back
+        :return: the payload formerly stored at index idx
+        """
+        return self._delete_record(self._record_at(self._normalize_index(idx)))
+
+
+if __name__ == '__main__':
+
+    ipl = IndexablePositionalList.from_iterable('abcdef')
+    print(ipl, ipl.at(2).payload(), ipl.index(ipl.last()))
+    print(ipl.delete_at(-1), ipl)
@@ -0,0 +1,232 @@
+"""
+minimum spanning forests of weighted graphs, with Kruskal's algorithm over a UnionFind
+
+minimum_spanning_forest(n, p, q, weights, k=1) -> tuple:          from arrays of edges held in memory
+streaming_minimum_spanning_forest(n, edges, k=1, ...) -> tuple:   from a stream of edges, sorted externally
+single_linkage(n, p, q, weights, k) -> list:                      the k clusters of single-linkage clustering
+
+The edges are taken by increasing weight, and an edge is kept in the forest when it
+connects two components, as the UnionFind tells; the forest is complete when the number
+of components reaches k: 1 for a minimum spanning tree (or as many as the graph has
+connected components), more to stop early, as single-linkage clustering does.
+
+The edges in memory are ordered with numpy.argsort if numpy is installed, with sorted()
+otherwise; the stream is cut into runs of chunk_size edges, sorted in memory and spilled
+to temporary files, then merged with heapq.merge. Both sorts are stable: among edges of
+the same weight, the first one given comes first.
+"""
+
+import heapq
+import pickle
+import tempfile
+
+from itertools import islice
+from operator import itemgetter
+from typing import Iterable
+from typing import Iterator
+
+try:
+    import numpy as np
+except ImportError:    # optional dependency
+    np = None
+
+from congeries.src.unionfind import UnionFind
+from congeries.src.unionfind import WeightedQuickUnionPathCompressionUF
+
+
+_BLOCK = 1 << 16    # the number of edges per pickle in the run files
+
+
+def _kruskal(uf: UnionFind, edges: Iterable, k: int) -> tuple:
+    """Utility function that unions the edges, by increasing weight, until k components are left
+
+    :param uf: a UnionFind
+    :param edges: an iterable of (p, q, weight), by increasing weight
+    :param k: int, the number of components to stop at
+    :return: a tuple (forest, total), the list of the edges (p, q, weight) kept, and the sum of their weights
+    """
+    forest, total = [], 0
+    union, count = uf.union, uf.components_count
+    if count <= k:
+        return forest, total
+    for p, q, weight in edges:
+        union(p, q)
+        if uf.components_count != count:
+            count -= 1
+            forest.append((p, q, weight))
+            total += weight
+            if count <= k:
+                break
+    return forest, total
+
+
+def _check_edge(n: int, p: int, q: int) -> None:
+    """Utility function that raises IndexError if p or q is out of [0, n)"""
+    if not (0 <= p < n and 0 <= q < n):
+        raise IndexError(f'site index out of range in the edge ({p}, {q}), for {n} sites')
+
+
+def _sorted_edges(n: int, p, q, weights) -> Iterator:
+    """Utility function that yields the edges (p, q, weight) of the arrays, by increasing weight
+
+    the sites are range checked at once, before any edge is yielded
+    """
+    if not len(p) == len(q) == len(weights):
+        raise ValueError('p, q and weights must have the same length')
+    if np is not None:
+        order = np.argsort(np.asarray(weights), kind='stable').tolist()
+    else:
+        order = sorted(range(len(weights)), key=weights.__getitem__)
+    p, q, weights = (values.tolist() if hasattr(values, 'tolist') else values for values in (p, q, weights))
+    if p and (min(min(p), min(q)) < 0 or max(max(p), max(q)) >= n):
+        for edge in zip(p, q):
+            _check_edge(n, *edge)
+    return ((p[idx], q[idx], weights[idx]) for idx in order)
+
+
+def _checked_edges(n: int, edges: Iterable) -> Iterator:
+    """Utility function that yields the edges (p, q, weight), raising IndexError at the first site out of [0, n)"""
+    for edge in edges:
+        _check_edge(n, edge[0], edge[1])
+        yield edge
+
+
+def minimum_spanning_forest(
+        n: int,
+        p,
+        q,
+        weights,
+        k: int = 1,
+        uf_class: type = WeightedQuickUnionPathCompressionUF,
+) -> tuple:
+    """
+    return a minimum spanning forest of the graph of n sites and the edges p[i] - q[i] of weights[i]
+
+    :param n: int, the number of sites
+    :param p: a sequence (list, array, ndarray) of int, sites in [0, n)
+    :param q: a sequence of int, sites in [0, n), of the same length as p
+    :param weights: a sequence of numbers, of the same length as p
+    :param k: int, the number of components to stop at, 1 for a complete forest
+    :param uf_class: the UnionFind class to use, built as uf_class(n)
+    :return: a tuple (forest, total), the list of the edges (p, q, weight) of the forest,
+             by increasing weight, and the sum of their weights;
+             raise IndexError if a site is out of [0, n)
+    """
+    return _kruskal(uf_class(n), _sorted_edges(n, p, q, weights), k)
+
+
+def single_linkage(
+        n: int,
+        p,
+        q,
+        weights,
+        k: int,
+        uf_class: type = WeightedQuickUnionPathCompressionUF,
+) -> list:
+    """
+    return the k clusters of the single-linkage clustering of n sites, with the distances of the edges
+
+    merges the two closest clusters until k are left: Kruskal's algorithm, stopped at k components.
+    There are more than k clusters when the edges do not connect the sites enough.
+    :param n: int, the number of sites
+    :param p: a sequence of int, sites in [0, n)
+    :param q: a sequence of int, sites in [0, n), of the same length as p
+    :param weights: a sequence of numbers, the distances between p[i] and q[i]
+    :param k: int, the number of clusters, at least 1
+    :param uf_class: the UnionFind class to use, built as uf_class(n)
+    :return: a list of lists of int, the sites of each cluster; raise IndexError if a site is out of [0, n)
+    """
+    if k < 1:
+        raise ValueError('k must be positive')
+    uf = uf_class(n)
+    _kruskal(uf, _sorted_edges(n, p, q, weights), k)
+    return list(uf.components())
+
+
+def _write_run(directory: str, run: list) -> str:
+    """Utility function that writes a sorted run of edges to a temporary file, by blocks
+
+    :return: str, the path of the file
+    """
+    with tempfile.NamedTemporaryFile('wb', dir=directory, suffix='.run', delete=False) as f:
+        for start in range(0, len(run), _BLOCK):
+            pickle.dump(run[start:start + _BLOCK], f, protocol=pickle.HIGHEST_PROTOCOL)
+        return f.name
+
+
+def _read_run(path: str) -> Iterator:
+    """Utility function that yields the edges of a run file, one block in memory at a time"""
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                yield from pickle.load(f)
+            except EOFError:
+                return
+
+
+def sorted_edges(edges: Iterable, chunk_size: int = 1_000_000, directory: str or None = None) -> Iterator:
+    """
+    yield the edges by increasing weight, with an external merge sort
+
+    the edges are read by chunks of chunk_size, each sorted in memory and written to a
+    temporary file (a run), unless it is the only one; the runs are then merged, holding
+    one block of each in memory. The files are removed once the iterator is exhausted or closed.
+    :param edges: an iterable of tuples (p, q, weight)
+    :param chunk_size: int, the number of edges sorted in memory at once
+    :param directory: str, the directory of the temporary files, defaults to the system's
+    :return: an iterator of tuples (p, q, weight)
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive')
+    weight = itemgetter(2)
+    edges = iter(edges)
+    with tempfile.TemporaryDirectory(dir=directory) as runs_directory:
+        runs = []
+        while run := list(islice(edges, chunk_size)):
+            run.sort(key=weight)
+            if not runs and len(run) < chunk_size:
+                # it all fits in memory
+                yield from run
+                return
+            runs.append(_write_run(runs_directory, run))
+            del run
+        yield from heapq.merge(*(_read_run(path) for path in runs), key=weight)
+
+
+def streaming_minimum_spanning_forest(
+        n: int,
+        edges: Iterable,
+        k: int = 1,
+        chunk_size: int = 1_000_000,
+        directory: str or None = None,
+        uf_class: type = WeightedQuickUnionPathCompressionUF,
+) -> tuple:
+    """
+    return a minimum spanning forest of the graph of n sites and a stream of edges that may not fit in memory
+
+    :param n: int, the number of sites
+    :param edges: an iterable of tuples (p, q, weight), sites in [0, n)
+    :param k: int, the number of components to stop at, 1 for a complete forest
+    :param chunk_size: int, the number of edges sorted in memory at once
+    :param directory: str, the directory of the temporary files, defaults to the system's
+    :param uf_class: the UnionFind class to use, built as uf_class(n)
+    :return: a tuple (forest, total), the list of the edges (p, q, weight) of the forest,
+             by increasing weight, and the sum of their weights;
+             raise IndexError if a site is out of [0, n)
+    """
+    # checked while the runs are sorted, before the first union
+    ordered = sorted_edges(_checked_edges(n, edges), chunk_size, directory)
+    try:
+        return _kruskal(uf_class(n), ordered, k)
+    finally:
+        ordered.close()
+
+
+if __name__ == '__main__':
+
+    # tinyEWG.txt
+    tiny = [(4, 5, .35), (4, 7, .37), (5, 7, .28), (0, 7, .16), (1, 5, .32), (0, 4, .38), (2, 3, .17), (1, 7, .19),
+            (0, 2, .26), (1, 2, .36), (1, 3, .29), (2, 7, .34), (6, 2, .40), (3, 6, .52), (6, 0, .58), (6, 4, .93)]
+    forest, total = minimum_spanning_forest(8, *zip(*tiny))
+    print(forest, round(total, 2))
+    print(single_linkage(8, *zip(*tiny), k=3))
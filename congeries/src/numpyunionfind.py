@@ -0,0 +1,256 @@
+"""
+a union-find over NumPy arrays, with batched (vectorized) operations
+
+NumPyUF
+    create: NumPyUF(n)
+
+requires numpy, an optional dependency: pip install congeries[numpy]
+
+:API:
+=====
+
+    union_many(p, q) -> None:            add the connections p[i] - q[i]
+    find_many(sites) -> ndarray:         return the component identifiers of sites
+    connected_many(p, q) -> ndarray:     return a boolean array, True where p[i] & q[i] are connected
+    size(p), members(p), components():   as UnionFind
+    save(path), load(path, mmap=True):   as UnionFind, the mapped arrays are ndarrays over the map
+
+"""
+
+try:
+    import numpy as np
+except ImportError:    # optional dependency
+    np = None
+
+from typing import Iterator
+from congeries.src.unionfind import WeightedQuickUnionPathCompressionUF
+
+
+class NumPyUF(WeightedQuickUnionPathCompressionUF):
+    """
+    A weighted quick-union with path compression, storing id (parents) and sz (sizes)
+    in int32 NumPy arrays (int64 beyond 2**31 - 1 sites)
+
+    The batch operations process whole arrays of sites in vectorized passes:
+
+    - find_many halves the paths of all the sites at once, pointing each visited
+      site to its grandparent, as WeightedQuickUnionPathCompressionUF._find does
+    - union_many runs rounds of union by size: in each round, the lesser root of
+      every pair of distinct roots (by size, then by id) is hooked to the other one;
+      chains of hooked roots are resolved by pointer jumping, then the sizes of the
+      surviving roots are updated and the member rings of the hooked roots spliced
+      into theirs; the pairs not yet connected go to the next round
+
+    As with the other weighted classes, the depth of any site stays within lg n.
+    union() and connected() are inherited, and work on the arrays one site at a time; _find()
+    and size() read the arrays with item(), so that they return Python ints, as the other
+    UnionFind classes do, rather than NumPy scalars.
+    """
+
+    def __init__(self, n: int) -> None:
+        """initializes the arrays of parents and sizes
+
+        :param n: int, the number of sites
+        """
+        if np is None:
+            raise ImportError('NumPyUF requires numpy: pip install congeries[numpy]')
+        dtype = np.int32 if n <= np.iinfo(np.int32).max else np.int64
+        self.components_count = n
+        self.id = np.arange(n, dtype=dtype)
+        self.sz = np.ones(n, dtype=dtype)
+        self.ring = np.arange(n, dtype=dtype)
+
+    def _sites(self, sites) -> 'np.ndarray':
+        """Utility method that converts sites to a flat array of indices, and checks their range
+
+        :param sites: an array-like of int
+        :return: a 1-D ndarray of the id dtype
+        """
+        sites = np.asarray(sites).ravel()
+        if sites.size and (sites.min() < 0 or sites.max() >= self.id.size):
+            raise IndexError('site index out of range')
+        return sites.astype(self.id.dtype, copy=False)
+
+    def find_many(self, sites) -> 'np.ndarray':
+        """return the component identifiers of sites, halving the paths traversed
+
+        :param sites: an array-like of int, sites in [0, n)
+        :return: an ndarray of int, the component identifier of each site
+        """
+        parent = self.id
+        current = self._sites(sites)
+        while True:
+            up = parent[current]
+            grand = parent[up]
+            if np.array_equal(up, grand):
+                return up
+            # make every other node in the paths point to its grandparent
+            parent[current] = grand
+            current = grand
+
+    def connected_many(self, p, q) -> 'np.ndarray':
+        """return a boolean array, True where p[i] & q[i] are in the same component
+
+        :param p: an array-like of int, sites in [0, n)
+        :param q: an array-like of int, sites in [0, n), of the same length as p
+        :return: an ndarray of bool
+        """
+        p, q = self._sites(p), self._sites(q)
+        if p.shape != q.shape:
+            raise ValueError('p and q must have the same length')
+        return self.find_many(p) == self.find_many(q)
+
+    def union_many(self, p, q) -> None:
+        """add the connections between sites p[i] and q[i], for every i
+
+        :param p: an array-like of int, sites in [0, n)
+        :param q: an array-like of int, sites in [0, n), of the same length as p
+        :return: None
+        """
+        p, q = self._sites(p), self._sites(q)
+        if p.shape != q.shape:
+            raise ValueError('p and q must have the same length')
+        parent, sz = self.id, self.sz
+        while p.size:
+            proots, qroots = self.find_many(p), self.find_many(q)
+            distinct = proots != qroots
+            if not distinct.all():
+                p, q, proots, qroots = p[distinct], q[distinct], proots[distinct], qroots[distinct]
+                if not p.size:
+                    return
+            # order each pair of roots by (size, id): the lesser root is hooked to the other,
+            # so that the hooked roots form chains of increasing (size, id), without cycles
+            psz, qsz = sz[proots], sz[qroots]
+            swap = (psz > qsz) | ((psz == qsz) & (proots > qroots))
+            small, big = np.where(swap, qroots, proots), np.where(swap, proots, qroots)
+            parent[small] = big    # any of the candidates of a root is a valid parent
+            hooked = np.sort(small)    # deduplicated below; faster than np.unique
+            hooked = hooked[np.concatenate(([True], hooked[1:] != hooked[:-1]))]
+            # the chains only go through hooked roots: point them to the surviving roots
+            while True:
+                up = parent[parent[hooked]]
+                if np.array_equal(up, parent[hooked]):
+                    break
+                parent[hooked] = up
+            tops = parent[hooked]
+            np.add.at(sz, tops, sz[hooked])
+            self._splice_rings(hooked, tops)
+            self.components_count -= hooked.size
+
+    def _splice_rings(self, hooked: 'np.ndarray', tops: 'np.ndarray') -> None:
+        """Utility method that splices the rings of the hooked roots into the rings of their roots
+
+        For a root r, with hooked roots h1 ... hk: r -> (ring of hk) -> ... -> (ring of h1) -> r,
+        as k successive splices would do, in vectorized passes
+        :param hooked: an ndarray of distinct former roots
+        :param tops: an ndarray, the root each of them is now linked to (none of them hooked)
+        :return: None
+        """
+        ring = self.ring
+        order = np.argsort(tops, kind='stable')
+        hooked, tops = hooked[order], tops[order]
+        hooked_next, tops_next = ring[hooked], ring[tops]
+        new_group = np.concatenate(([True], tops[1:] != tops[:-1]))
+        last_of_group = np.concatenate((new_group[1:], [True]))
+        spliced = np.empty_like(hooked_next)
+        spliced[1:] = hooked_next[:-1]
+        spliced[new_group] = tops_next[new_group]
+        ring[hooked] = spliced
+        ring[tops[last_of_group]] = hooked_next[last_of_group]
+
+    def _find(self, p: int) -> int:
+        """return component identifier for p, halving the path traversed
+
+        override inherited version: walks id with item(), and returns an int
+        :param p: int, site p
+        :return: int, component identifier for p
+        """
+        parent, p = self.id, int(p)
+        while p != (up := parent.item(p)):
+            # make every other node in path point to its grandparent
+            grand = parent.item(up)
+            parent[p] = grand
+            p = grand
+        return p
+
+    def size(self, p: int) -> int:
+        """return the number of sites in the component of p
+
+        :param p: int, site p
+        :return: int
+        """
+        return self.sz.item(self._find(p))
+
+    def members(self, p: int) -> list:
+        """return the sites in the component of p, in O(size of the component)
+
+        :param p: int, site p
+        :return: a list of int, starting with p
+        """
+        ring, members = self.ring, [int(p)]
+        site = ring.item(p)
+        while site != p:
+            members.append(site)
+            site = ring.item(site)
+        return members
+
+    _members = members
+
+    def components(self) -> Iterator:
+        """yield the list of the sites of each component
+
+        override inherited version: the roots are found with a vectorized scan of id
+        :return: an iterator of lists of int
+        """
+        for root in np.flatnonzero(self.id == np.arange(self.id.size)).tolist():
+            yield self.members(root)
+
+    def _depths(self) -> 'np.ndarray':
+        """Utility method; override inherited version to compute the depths in vectorized passes
+
+        :return: an ndarray of int, the number of links from each site to its root
+        """
+        parent = self.id
+        depths = np.zeros(parent.size, dtype=np.int64)
+        current = np.arange(parent.size, dtype=parent.dtype)
+        while True:
+            up = parent[current]
+            moving = up != current
+            if not moving.any():
+                return depths
+            depths += moving
+            current = up
+
+    def max_depth(self) -> int:
+        """return the height of the tallest tree: the largest number of links from a site to its root
+
+        :return: int
+        """
+        return int(self._depths().max(initial=0))
+
+    def average_path_length(self) -> float:
+        """return the average number of links from a site to its root
+
+        :return: float, 0.0 if there are no sites
+        """
+        return float(self._depths().mean()) if self.id.size else 0.0
+
+    def _packed(self, values: 'np.ndarray', typecode: str) -> 'np.ndarray':
+        """Utility method; override inherited version to save the arrays without iterating them"""
+        return np.ascontiguousarray(values, dtype=np.dtype(typecode))
+
+    def _unpacked(self, buffer: memoryview, typecode: str, mapped: bool) -> 'np.ndarray':
+        """Utility method; override inherited version to load ndarrays, over the map if mapped"""
+        values = np.frombuffer(buffer, dtype=np.dtype(typecode))
+        return values if mapped else values.copy()
+
+    def instrument(self) -> 'NumPyUF':
+        """the accesses to NumPy arrays are not counted"""
+        raise TypeError('NumPyUF cannot be instrumented')
+
+
+if __name__ == '__main__':
+
+    uf = NumPyUF(10)
+    uf.union_many([4, 3, 6, 9, 2, 8, 5, 7, 6, 1, 6], [3, 8, 5, 4, 1, 9, 0, 2, 1, 0, 7])
+    print(uf.components_count, uf.connected_many([0, 3], [7, 9]))
@@ -0,0 +1,159 @@
+"""
+connected components of large edge streams, computed by a pool of processes
+
+parallel_union_find(n, edges, workers=None, chunk_size=1_000_000) -> UnionFind
+
+The stream of edges (p, q) is split into chunks; each chunk is reduced to a local
+forest in a worker process, then the forests are merged pairwise (hierarchically),
+also in the pool, and the last one is applied to a UnionFind of n sites.
+
+A forest is the compact form of a union-find over the sites touched by its edges:
+the pairs (site, root) for every site that is not the root of its component.
+Unioning each site with its root reproduces the same components; so the result has
+exactly the components of the sequential union of all the edges.
+
+The workers reduce the chunks with a NumPyUF over the touched sites when numpy is
+installed, and with a KeyedUF otherwise.
+"""
+
+import os
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable
+
+from congeries.src.numpyunionfind import NumPyUF
+from congeries.src.numpyunionfind import np
+from congeries.src.unionfind import KeyedUF
+from congeries.src.unionfind import UnionFind
+from congeries.src.unionfind import WeightedQuickUnionPathCompressionUF
+
+
+def _forest(uf: KeyedUF) -> tuple:
+    """the forest of uf: two arrays, the sites that are not roots, and their roots
+
+    :param uf: a KeyedUF over int sites
+    :return: a tuple (sites, roots) of array('q')
+    """
+    sites, roots, keys = array('q'), array('q'), uf.keys
+    for idx, site in enumerate(keys):
+        root = keys[uf._find(idx)]
+        if root != site:
+            sites.append(site)
+            roots.append(root)
+    return sites, roots
+
+
+def _chunk_forest(ps: array, qs: array) -> tuple:
+    """reduces a chunk of edges to its forest, in a worker
+
+    :param ps: array('q') of sites p
+    :param qs: array('q') of sites q, of the same length
+    :return: a tuple (sites, roots) of array('q')
+    """
+    if np is not None:
+        return _chunk_forest_numpy(ps, qs)
+    uf = KeyedUF()
+    union = uf.union
+    for p, q in zip(ps, qs):
+        union(p, q)
+    return _forest(uf)
+
+
+def _chunk_forest_numpy(ps: array, qs: array) -> tuple:
+    """_chunk_forest with a NumPyUF over the touched sites, renumbered densely"""
+    ps, qs = np.frombuffer(ps, dtype=np.int64), np.frombuffer(qs, dtype=np.int64)
+    sites, dense = np.unique(np.concatenate((ps, qs)), return_inverse=True)
+    uf = NumPyUF(sites.size)
+    uf.union_many(dense[:ps.size], dense[ps.size:])
+    roots = uf.find_many(np.arange(sites.size))
+    linked = roots != np.arange(sites.size)
+    forest = array('q'), array('q')
+    forest[0].frombytes(sites[linked].tobytes())
+    forest[1].frombytes(sites[roots[linked]].tobytes())
+    return forest
+
+
+def _merge_forests(first: tuple, second: tuple) -> tuple:
+    """merges two forests into one, in a worker
+
+    :param first: a tuple (sites, roots) of array('q')
+    :param second: a tuple (sites, roots) of array('q')
+    :return: a tuple (sites, roots) of array('q'), with the components of both
+    """
+    return _chunk_forest(first[0] + second[0], first[1] + second[1])
+
+
+def _check_sites(ps: array, qs: array, n: int) -> None:
+    """Utility function that raises IndexError if a site of the chunk is out of [0, n), naming the first such edge"""
+    if min(min(ps), min(qs)) < 0 or max(max(ps), max(qs)) >= n:
+        p, q = next((p, q) for p, q in zip(ps, qs) if not (0 <= p < n and 0 <= q < n))
+        raise IndexError(f'site index out of range in the edge ({p}, {q}), for {n} sites')
+
+
+def _chunks(edges: Iterable, chunk_size: int) -> Iterable:
+    """yields the edges as tuples (ps, qs) of array('q'), of at most chunk_size edges"""
+    edges = iter(edges)
+    while True:
+        ps, qs = array('q'), array('q')
+        for p, q in islice(edges, chunk_size):
+            ps.append(p)
+            qs.append(q)
+        if not ps:
+            return
+        yield ps, qs
+
+
+def parallel_union_find(
+        n: int,
+        edges: Iterable,
+        workers: int or None = None,
+        chunk_size: int = 1_000_000,
+        uf_class: type = WeightedQuickUnionPathCompressionUF,
+) -> UnionFind:
+    """
+    return a UnionFind of n sites where all the edges are unioned, computed by a process pool
+
+    At most 2 * workers chunks are in flight, so that the stream is consumed as the
+    workers progress. The components (and components_count) are those of the sequential
+    union of the edges; the component identifiers may differ.
+    :param n: int, the number of sites
+    :param edges: an iterable of pairs (p, q) of int sites in [0, n)
+    :param workers: int, the number of processes, defaults to the number of processors
+    :param chunk_size: int, the number of edges per chunk
+    :param uf_class: the UnionFind class of the result, built as uf_class(n)
+    :return: a uf_class instance; raise IndexError if a site is out of [0, n)
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be positive')
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = 2 * workers
+        pending, forests = [], []
+        for ps, qs in _chunks(edges, chunk_size):
+            _check_sites(ps, qs, n)
+            if len(pending) >= in_flight:
+                forests.append(pending.pop(0).result())
+            pending.append(executor.submit(_chunk_forest, ps, qs))
+        forests.extend(future.result() for future in pending)
+        while len(forests) > 1:
+            merged = [executor.submit(_merge_forests, forests[idx], forests[idx + 1])
+                      for idx in range(0, len(forests) - 1, 2)]
+            leftover = forests[-1:] if len(forests) % 2 else []
+            forests = [future.result() for future in merged] + leftover
+    uf = uf_class(n)
+    if forests and isinstance(uf, NumPyUF):
+        uf.union_many(*(np.frombuffer(sites, dtype=np.int64) for sites in forests[0]))
+    elif forests:
+        union = uf.union
+        for site, root in zip(*forests[0]):
+            union(site, root)
+    return uf
+
+
+if __name__ == '__main__':
+
+    uf = parallel_union_find(10, [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1), (8, 9),
+                                  (5, 0), (7, 2), (6, 1), (1, 0), (6, 7)], workers=2, chunk_size=3)
+    print(uf.components_count, sorted(sorted(members) for members in uf.components()))
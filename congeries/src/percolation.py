@@ -0,0 +1,240 @@
+"""
+percolation: a Monte Carlo estimate of the percolation threshold, with a UnionFind
+
+Percolation
+    create: Percolation(n, uf_class=WeightedQuickUnionPathCompressionUF)
+
+An n-by-n grid of sites, all blocked at first. A site is full if it is open and connected to
+an open site of the top row by a chain of open neighbours (left, right, up, down); the grid
+percolates if a site of the bottom row is full. Two virtual sites, top and bottom, connected
+to the open sites of the first and last rows, make percolates() a single connected() query.
+
+:API:
+=====
+
+    open(row: int, col: int) -> None:    open the site (row, col), 0-based, if it is not open already
+    is_open(row: int, col: int) -> bool: return True if the site is open
+    is_full(row: int, col: int) -> bool: return True if the site is connected to the top row
+    percolates() -> bool:                return True if the grid percolates
+    open_count:                          the number of open sites
+
+percolation_threshold(n, trials, workers=None, seed=None, ...) -> ThresholdEstimate
+
+Each trial opens the sites of an n-by-n grid in a random order until the grid percolates:
+the fraction of open sites is an estimate of the threshold (about 0.593 for large grids).
+The trials run in a process pool, each with a seed of its own drawn from seed.
+
+command line, from the root of the repository:
+    python -m congeries.src.percolation n trials [workers] [--seed seed]
+The module is not imported by the package, so that running it with -m does not import it twice:
+import Percolation and percolation_threshold from congeries.src.percolation.
+"""
+
+import argparse
+import math
+import os
+import random
+import statistics
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from itertools import repeat
+
+from congeries.src.unionfind import WeightedQuickUnionPathCompressionUF
+
+
+class Percolation:
+    """
+    An n-by-n grid of sites, opened one at a time, over a UnionFind of n * n + 2 sites
+
+    The virtual bottom site lets a full site of the bottom row connect to the whole bottom
+    row (backwash): is_full() queries a second UnionFind, without the bottom site, that
+    full=False leaves out, halving the cost of open() when only percolates() matters.
+    """
+
+    def __init__(self, n: int, uf_class: type = WeightedQuickUnionPathCompressionUF, full: bool = True) -> None:
+        """initializes an n-by-n grid of blocked sites
+
+        :param n: int, the number of rows and columns, at least 1
+        :param uf_class: the UnionFind class to use
+        :param full: bool, False to leave out the UnionFind of is_full()
+        """
+        if n < 1:
+            raise ValueError('n must be positive')
+        self.n = n
+        self.top, self.bottom = n * n, n * n + 1
+        self.uf = uf_class(n * n + 2)
+        self.full = uf_class(n * n + 1) if full else None
+        self.opened = bytearray(n * n)
+        self.open_count = 0
+
+    def _site(self, row: int, col: int) -> int:
+        """Utility method that returns the site of (row, col), raise IndexError out of the grid"""
+        if not (0 <= row < self.n and 0 <= col < self.n):
+            raise IndexError(f'site ({row}, {col}) out of a {self.n}-by-{self.n} grid')
+        return row * self.n + col
+
+    def open(self, row: int, col: int) -> None:
+        """open the site (row, col), and connect it to its open neighbours
+
+        :param row: int, in [0, n)
+        :param col: int, in [0, n)
+        :return: None
+        """
+        site = self._site(row, col)
+        if self.opened[site]:
+            return
+        self.opened[site] = 1
+        self.open_count += 1
+        n, opened, ufs = self.n, self.opened, [self.uf] if self.full is None else [self.uf, self.full]
+        neighbours = []
+        if row == 0:
+            neighbours.append(self.top)
+        elif opened[site - n]:
+            neighbours.append(site - n)
+        if row < n - 1 and opened[site + n]:
+            neighbours.append(site + n)
+        if col > 0 and opened[site - 1]:
+            neighbours.append(site - 1)
+        if col < n - 1 and opened[site + 1]:
+            neighbours.append(site + 1)
+        for uf in ufs:
+            for neighbour in neighbours:
+                uf.union(site, neighbour)
+        if row == n - 1:
+            self.uf.union(site, self.bottom)
+
+    def is_open(self, row: int, col: int) -> bool:
+        """return True if the site (row, col) is open
+
+        :param row: int, in [0, n)
+        :param col: int, in [0, n)
+        :return: bool
+        """
+        return bool(self.opened[self._site(row, col)])
+
+    def is_full(self, row: int, col: int) -> bool:
+        """return True if the site (row, col) is open and connected to the top row
+
+        :param row: int, in [0, n)
+        :param col: int, in [0, n)
+        :return: bool, raise ValueError if the grid was created with full=False
+        """
+        if self.full is None:
+            raise ValueError('is_full() requires a Percolation created with full=True')
+        site = self._site(row, col)
+        return bool(self.opened[site]) and self.full.connected(site, self.top)
+
+    def percolates(self) -> bool:
+        """return True if a site of the bottom row is connected to the top row
+
+        :return: bool
+        """
+        return self.uf.connected(self.top, self.bottom)
+
+
+def percolation_trial(n: int, seed: int, uf_class: type = WeightedQuickUnionPathCompressionUF) -> float:
+    """
+    open the sites of an n-by-n grid in a random order until it percolates
+
+    :param n: int, the number of rows and columns
+    :param seed: int, the seed of the random order
+    :param uf_class: the UnionFind class to use
+    :return: float, the fraction of the sites open when the grid percolates
+    """
+    sites = list(range(n * n))
+    random.Random(seed).shuffle(sites)
+    grid = Percolation(n, uf_class, full=False)
+    for site in sites:
+        grid.open(*divmod(site, n))
+        if grid.percolates():
+            break
+    return grid.open_count / (n * n)
+
+
+@dataclass
+class ThresholdEstimate:
+    """the thresholds found by the trials over n-by-n grids, and their statistics"""
+    n: int
+    thresholds: list = field(default_factory=list)
+
+    @property
+    def mean(self) -> float:
+        """the estimate of the percolation threshold"""
+        return statistics.fmean(self.thresholds)
+
+    @property
+    def stddev(self) -> float:
+        """the sample standard deviation of the thresholds, nan for a single trial"""
+        return statistics.stdev(self.thresholds) if len(self.thresholds) > 1 else math.nan
+
+    @property
+    def confidence(self) -> tuple:
+        """the 95% confidence interval of the threshold, (low, high)"""
+        margin = 1.96 * self.stddev / math.sqrt(len(self.thresholds))
+        return self.mean - margin, self.mean + margin
+
+
+def percolation_threshold(
+        n: int,
+        trials: int,
+        workers: int or None = None,
+        seed: int or None = None,
+        uf_class: type = WeightedQuickUnionPathCompressionUF,
+) -> ThresholdEstimate:
+    """
+    return an estimate of the percolation threshold of n-by-n grids, from independent trials
+
+    the seed of each trial is drawn from a generator seeded with seed, so that the estimate
+    is reproducible for a given seed, whatever the number of workers
+    :param n: int, the number of rows and columns
+    :param trials: int, the number of trials, at least 1
+    :param workers: int, the number of processes, defaults to the number of processors;
+                    1 runs the trials in this process
+    :param seed: int, the seed of the seeds of the trials, None for a random one
+    :param uf_class: the UnionFind class to use, must be importable by the workers
+    :return: a ThresholdEstimate
+    """
+    if trials < 1:
+        raise ValueError('trials must be positive')
+    rng = random.Random(seed)
+    seeds = [rng.getrandbits(64) for _ in range(trials)]
+    if workers == 1:
+        return ThresholdEstimate(n, [percolation_trial(n, trial_seed, uf_class) for trial_seed in seeds])
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, trials // (4 * workers))
+        thresholds = list(executor.map(percolation_trial, repeat(n), seeds, repeat(uf_class), chunksize=chunksize))
+    return ThresholdEstimate(n, thresholds)
+
+
+def main(argv: list or None = None, prog: str or None = None) -> int:
+    """the command line entry point: print the estimate of the threshold, and its confidence interval
+
+    :param argv: a list of str, the arguments, defaults to sys.argv[1:]
+    :param prog: str, the name of the program in the messages, defaults to the name it was invoked with
+    :return: int, the exit status
+    """
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description='estimate the percolation threshold of n-by-n grids, with a Monte Carlo simulation')
+    parser.add_argument('n', type=int, help='the number of rows and columns of the grids')
+    parser.add_argument('trials', type=int, help='the number of trials')
+    parser.add_argument('workers', type=int, nargs='?', help='the number of processes, defaults to the number of processors')
+    parser.add_argument('--seed', type=int, help='the seed of the trials, for a reproducible estimate')
+    args = parser.parse_args(argv)
+    if args.n < 1 or args.trials < 1 or (args.workers is not None and args.workers < 1):
+        parser.error('n, trials and workers must be positive')
+
+    estimate = percolation_threshold(args.n, args.trials, workers=args.workers, seed=args.seed)
+    low, high = estimate.confidence
+    print(f'mean                    = {estimate.mean}')
+    print(f'stddev                  = {estimate.stddev}')
+    print(f'95% confidence interval = [{low}, {high}]')
+    return 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main(prog=f'python -m {__spec__.name}' if __spec__ else None))
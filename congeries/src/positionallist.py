@@ -3,7 +3,12 @@ general abstraction of a sequence of elements with the ability
 to identify the location of an element
 """
 
-from typing import Any, Iterator
+import heapq
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator
 from congeries.src.doublylinkedlists import DoublyLinkedList
 
 
@@ -18,7 +23,31 @@ class PositionalList(DoublyLinkedList):
     We rely on DoublyLinkedList class for our low-level representation.
     The primary responsibility of PositionalList is to provide a public interface
     in accordance with the positional list ADT
+
+    Each Record hands out a single, cached Position: walking the list by positions
+    allocates at most one Position per Record over the lifetime of the Record
+
+    Records also carry an order-maintenance label (Bender et al., "Two simplified
+    algorithms for maintaining order in a list"): labels increase from front to
+    back, so that comparing two Positions is O(1); inserting costs amortized
+    O(log n) label updates
     """
+
+    # labels live in [0, 2**_LABEL_BITS]; the header is labelled 0 and the trailer 2**_LABEL_BITS
+    _LABEL_BITS = 64
+    # density threshold T, with 1 < T < 2: a label range of size 2**i may hold at most
+    # (2 / T)**i records before it is relabelled; supports up to ~(2 / T)**_LABEL_BITS records
+    _LABEL_DENSITY = 1.3
+    # labels handed out at either end of the list are _LABEL_STEP apart, so that
+    # repeated appends (or prepends) do not exhaust the gap by halving it
+    _LABEL_STEP = 1 << 32
+
+    def __init__(self) -> None:
+        """
+        # implementation detail: the sentinel Records carry the extreme labels
+        """
+        super().__init__()
+        self._trailer.label = 1 << self._LABEL_BITS
     # def __iter__(self) -> Iterator:
     #     pass
 
@@ -31,15 +60,35 @@ class PositionalList(DoublyLinkedList):
                  of the iterable passed as a parameter
         """
         new_seq: cls = cls()
-        for item in it:
-            cursor = new_seq.add_last(item)
+        new_seq._insert_many_between(it, new_seq._header, new_seq._trailer)
         return new_seq
 
+    @dataclass(eq=False, repr=False)
+    class Record(DoublyLinkedList.Record):
+        """
+        a DoublyLinkedList.Record that also caches the Position representing it
+
+        position is created lazily, the first time the Record is handed out
+        """
+        position: 'PositionalList.Position' or None = None
+        label: int = 0
+
+        def deprecate(self) -> None:
+            """avoid loitering by overwriting all references attached to the record,
+            including the cached Position
+
+            :return: None
+            """
+            super().deprecate()
+            self.position = None
+
     class Position:
         """
         An abstraction representing the location of a single element
         """
 
+        __slots__ = ('container', 'record')
+
         def __init__(self, container, record) -> None:
             self.container: 'PositionalList' = container
             self.record: 'PositionalList.Record' = record
@@ -71,6 +120,30 @@ class PositionalList(DoublyLinkedList):
             """
             return not (self == other)
 
+        def __lt__(self, other: 'PositionalList.Position') -> bool:
+            """True if self comes before other in their container, in O(1)"""
+            if not isinstance(other, PositionalList.Position):
+                return NotImplemented
+            return self.container.precedes(self, other)
+
+        def __le__(self, other: 'PositionalList.Position') -> bool:
+            """True if self is other, or comes before other in their container, in O(1)"""
+            if not isinstance(other, PositionalList.Position):
+                return NotImplemented
+            return self == other or self.container.precedes(self, other)
+
+        def __gt__(self, other: 'PositionalList.Position') -> bool:
+            """True if self comes after other in their container, in O(1)"""
+            if not isinstance(other, PositionalList.Position):
+                return NotImplemented
+            return self.container.precedes(other, self)
+
+        def __ge__(self, other: 'PositionalList.Position') -> bool:
+            """True if self is other, or comes after other in their container, in O(1)"""
+            if not isinstance(other, PositionalList.Position):
+                return NotImplemented
+            return self == other or self.container.precedes(other, self)
+
     def _validate(self, pos: 'PositionalList.Position') -> 'PositionalList.Record':
         """
         Utility method that verifies that pos is a valid PositionalList.Position.
@@ -90,15 +163,18 @@ class PositionalList(DoublyLinkedList):
 
     def _make_position(self, record: 'PositionalList.Record') -> 'PositionalList.Position':
         """
-        Utility method return a Position instance for a given record, or None if sentinel
+        Utility method return the Position instance for a given record, or None if sentinel
 
+        The Position is cached on the record, so that only one is ever created per record
         :param record: a Record
         :return: Position for a given record, or None if record is sentinel
         """
         if record is self._header or record is self._trailer:
             return None
-        else:
-            return self.Position(self, record)
+        position = record.position
+        if position is None:
+            position = record.position = self.Position(self, record)
+        return position
 
     def _insert_between(
             self,
@@ -114,7 +190,160 @@ class PositionalList(DoublyLinkedList):
         :param succ_rec: PositionalList.Record
         :return: a PositionalList.Position carrying the corresponding Record
         """
-        return self._make_position(super()._insert_between(payload, prev_rec, succ_rec))
+        record = super()._insert_between(payload, prev_rec, succ_rec)
+        self._assign_label(record)
+        return self._make_position(record)
+
+    def _assign_label(self, record: 'PositionalList.Record') -> None:
+        """
+        Utility method that labels a newly linked record, between the labels of its neighbors
+
+        :param record: a PositionalList.Record, already linked in the list
+        :return: None
+        """
+        lo, hi = record.prev.label, record.suiv.label
+        gap = hi - lo
+        if gap > 2 * self._LABEL_STEP:
+            if record.suiv is self._trailer:
+                record.label = lo + self._LABEL_STEP
+            elif record.prev is self._header:
+                record.label = hi - self._LABEL_STEP
+            else:
+                record.label = (lo + hi) >> 1
+        elif gap > 1:
+            record.label = (lo + hi) >> 1
+        else:
+            self._relabel(record, record, 1)
+
+    def _label_run(self, records: list) -> None:
+        """
+        Utility method that labels a run of newly linked, successive records
+
+        :param records: a non empty list of successive PositionalList.Record, already linked
+        :return: None
+        """
+        lo, hi = records[0].prev.label, records[-1].suiv.label
+        step = (hi - lo) // (len(records) + 1)
+        if step == 0:
+            self._relabel(records[0], records[-1], len(records))
+            return
+        if records[-1].suiv is self._trailer:
+            step = min(step, self._LABEL_STEP)
+        label = lo
+        for record in records:
+            label += step
+            record.label = label
+
+    def _relabel(
+            self,
+            first: 'PositionalList.Record',
+            last: 'PositionalList.Record',
+            count: int,
+    ) -> None:
+        """
+        Utility method that makes room for the labels of a run of newly linked records
+
+        Finds the smallest aligned label range of size 2**i around the run that
+        is sparse enough, and spreads the labels of all the records it holds evenly
+        :param first: the first PositionalList.Record of the run, already linked in the list
+        :param last: the last PositionalList.Record of the run, already linked in the list
+        :param count: the number of records in the run
+        :return: None
+        """
+        header, trailer = self._header, self._trailer
+        anchor = first.prev.label
+        left, right = first.prev, last.suiv   # closest records not yet counted
+        ratio = 2 / self._LABEL_DENSITY
+        for bits in range(1, self._LABEL_BITS + 1):
+            range_lo = anchor >> bits << bits
+            range_hi = range_lo + (1 << bits)
+            while left is not header and left.label >= range_lo:
+                count, left = count + 1, left.prev
+            while right is not trailer and right.label < range_hi:
+                count, right = count + 1, right.suiv
+            if count <= ratio ** bits:
+                break
+        else:
+            if count >= 1 << self._LABEL_BITS:
+                raise OverflowError('too many elements for the PositionalList labels')
+        gap = (1 << bits) // (count + 1)
+        label, current = range_lo, left.suiv
+        while current is not right:
+            label += gap
+            current.label = label
+            current = current.suiv
+
+    def _insert_many_between(
+            self,
+            it: Iterable,
+            prev_rec: 'PositionalList.Record',
+            succ_rec: 'PositionalList.Record',
+    ) -> list:
+        """
+        Utility method that chains new records for the items of it in one pass,
+        splices the chain between two successive records, and labels it
+
+        :param it: an iterable of payloads
+        :param prev_rec: PositionalList.Record
+        :param succ_rec: PositionalList.Record
+        :return: the list of the new PositionalList.Record, in order
+        """
+        Record, records, last = self.Record, [], prev_rec
+        for item in it:
+            record = Record(payload=item, prev=last, suiv=succ_rec)
+            if records:
+                last.suiv = record
+            records.append(record)
+            last = record
+        if records:
+            prev_rec.suiv, succ_rec.prev = records[0], last
+            self._size += len(records)
+            self._label_run(records)
+        return records
+
+    def _delete_run(
+            self,
+            first: 'PositionalList.Record',
+            last: 'PositionalList.Record',
+    ) -> list:
+        """
+        Utility method that unlinks the records from first to last, both included, in one pass
+
+        :param first: PositionalList.Record
+        :param last: PositionalList.Record, first or a record after it
+        :return: the list of the payloads of the deleted records, in order
+        """
+        pred, succ = first.prev, last.suiv
+        payloads, current = [], first
+        while current is not succ:
+            record, current = current, current.suiv
+            payloads.append(record.payload)
+            record.deprecate()
+        pred.suiv, succ.prev = succ, pred
+        self._size -= len(payloads)
+        return payloads
+
+    def _relink_between(
+            self,
+            record: 'PositionalList.Record',
+            prev_rec: 'PositionalList.Record',
+            succ_rec: 'PositionalList.Record',
+    ) -> None:
+        """
+        Utility method that moves a record between two successive records, and relabels it
+
+        The record is relinked, not reallocated; nothing happens if it is already in place
+        :param record: the PositionalList.Record to move
+        :param prev_rec: PositionalList.Record
+        :param succ_rec: PositionalList.Record
+        :return: None
+        """
+        if prev_rec is record or succ_rec is record:
+            return
+        record.prev.suiv, record.suiv.prev = record.suiv, record.prev
+        record.prev, record.suiv = prev_rec, succ_rec
+        prev_rec.suiv, succ_rec.prev = record, record
+        self._assign_label(record)
 
     def add_first(self, elt: Any) -> 'PositionalList.Position':
         """
@@ -184,6 +413,164 @@ class PositionalList(DoublyLinkedList):
         pos_record = self._validate(pos)
         return self._make_position(pos_record.suiv)
 
+    def positions(self, start: 'PositionalList.Position' or None = None, reverse: bool = False) -> Iterator:
+        """
+        yield the Positions of the list, from start included, front to back (or back to front)
+
+        Only start is validated, when positions() is called rather than at the first next();
+        the traversal then follows the links of the Records, at the cost of one attribute
+        lookup per Position instead of a call to after().
+        The structure of the list must not be modified during the traversal.
+        :param start: a PositionalList.Position, or None to start at the first (or last) Position
+        :param reverse: if True, walk towards the front of the list
+        :return: an iterator of PositionalList.Position
+        """
+        if start is None:
+            current = self._trailer.prev if reverse else self._header.suiv
+        else:
+            current = self._validate(start)
+        return self._walk(current, reverse)
+
+    def _walk(self, current: 'PositionalList.Record', reverse: bool) -> Iterator:
+        """Utility method that yields the Positions from the Record current to the end (or the front)"""
+        stop = self._header if reverse else self._trailer
+        make_position = self._make_position
+        if reverse:
+            while current is not stop:
+                yield current.position or make_position(current)
+                current = current.prev
+        else:
+            while current is not stop:
+                yield current.position or make_position(current)
+                current = current.suiv
+
+    @contextmanager
+    def unchecked(self) -> Iterator:
+        """
+        context manager that disables the validation of Positions, for trusted hot loops
+
+        Within the block, before(), after(), delete() and the other methods taking a
+        Position no longer check its type, container, or whether it was deleted:
+        passing a foreign or deleted Position corrupts the list. Nested blocks are allowed.
+
+            with pl.unchecked():
+                pos = pl.first()
+                while pos is not None:
+                    pos = pl.after(pos)
+
+        :return: an iterator yielding this PositionalList
+        """
+        # do not look into self.__dict__: materializing it slows down every method lookup
+        if isinstance(self._validate, attrgetter):    # already unchecked
+            yield self
+            return
+        self._validate = attrgetter('record')
+        try:
+            yield self
+        finally:
+            del self._validate
+
+    def add_many_after(self, pos: 'PositionalList.Position', it: Iterable) -> Iterator:
+        """
+        Insert the items of it, in order, after the element at position pos
+
+        pos is validated once, and the new elements are linked in a single pass
+        :param pos: a PositionalList.Position
+        :param it: an iterable
+        :return: an iterator over the new PositionalList.Position, created lazily
+        """
+        pos_record = self._validate(pos)
+        return map(self._make_position, self._insert_many_between(it, pos_record, pos_record.suiv))
+
+    def add_many_before(self, pos: 'PositionalList.Position', it: Iterable) -> Iterator:
+        """
+        Insert the items of it, in order, before the element at position pos
+
+        pos is validated once, and the new elements are linked in a single pass
+        :param pos: a PositionalList.Position
+        :param it: an iterable
+        :return: an iterator over the new PositionalList.Position, created lazily
+        """
+        pos_record = self._validate(pos)
+        return map(self._make_position, self._insert_many_between(it, pos_record.prev, pos_record))
+
+    def delete_range(self, start_pos: 'PositionalList.Position', end_pos: 'PositionalList.Position') -> list:
+        """
+        remove the elements from start_pos to end_pos, both included, and return them
+
+        :param start_pos: a PositionalList.Position
+        :param end_pos: a PositionalList.Position, start_pos or a Position after it
+        :return: the list of the payloads formerly stored from start_pos to end_pos
+        """
+        first, last = self._validate(start_pos), self._validate(end_pos)
+        if last.label < first.label:
+            raise ValueError('end_pos comes before start_pos')
+        return self._delete_run(first, last)
+
+    def move_to_front(self, pos: 'PositionalList.Position') -> 'PositionalList.Position':
+        """
+        Move the element at position pos to the front of the list, in O(1)
+
+        The element keeps its Record, so pos, and all other Positions, stay valid
+        :param pos: a PositionalList.Position
+        :return: pos
+        """
+        pos_record = self._validate(pos)
+        self._relink_between(pos_record, self._header, self._header.suiv)
+        return pos
+
+    def move_to_back(self, pos: 'PositionalList.Position') -> 'PositionalList.Position':
+        """
+        Move the element at position pos to the back of the list, in O(1)
+
+        The element keeps its Record, so pos, and all other Positions, stay valid
+        :param pos: a PositionalList.Position
+        :return: pos
+        """
+        pos_record = self._validate(pos)
+        self._relink_between(pos_record, self._trailer.prev, self._trailer)
+        return pos
+
+    def move_before(self, pos: 'PositionalList.Position', target: 'PositionalList.Position') -> 'PositionalList.Position':
+        """
+        Move the element at position pos just before the element at position target, in O(1)
+
+        The element keeps its Record, so pos, and all other Positions, stay valid
+        :param pos: a PositionalList.Position
+        :param target: a PositionalList.Position, other than pos
+        :return: pos
+        """
+        pos_record, target_record = self._validate(pos), self._validate(target)
+        if pos_record is target_record:
+            raise ValueError('cannot move pos relative to itself')
+        self._relink_between(pos_record, target_record.prev, target_record)
+        return pos
+
+    def move_after(self, pos: 'PositionalList.Position', target: 'PositionalList.Position') -> 'PositionalList.Position':
+        """
+        Move the element at position pos just after the element at position target, in O(1)
+
+        The element keeps its Record, so pos, and all other Positions, stay valid
+        :param pos: a PositionalList.Position
+        :param target: a PositionalList.Position, other than pos
+        :return: pos
+        """
+        pos_record, target_record = self._validate(pos), self._validate(target)
+        if pos_record is target_record:
+            raise ValueError('cannot move pos relative to itself')
+        self._relink_between(pos_record, target_record, target_record.suiv)
+        return pos
+
+    def precedes(self, pos: 'PositionalList.Position', other: 'PositionalList.Position') -> bool:
+        """
+        return True if pos comes before other in the list, in O(1)
+
+        :param pos: a PositionalList.Position
+        :param other: a PositionalList.Position
+        :return: True if pos is located before other
+        """
+        return self._validate(pos).label < self._validate(other).label
+
     def delete(self, pos) -> 'PositionalList.Record':
         """remove and return the pelement at position pos
 
@@ -229,6 +616,73 @@ class PositionalList(DoublyLinkedList):
                     self.delete(pivot)
                     self.add_before(walk, value)
 
+    def _label_all(self) -> None:
+        """
+        Utility method that relabels every record, evenly spaced, in O(n)
+
+        :return: None
+        """
+        step = min((1 << self._LABEL_BITS) // (self._size + 1), self._LABEL_STEP)
+        label, current = 0, self._header
+        while (current := current.suiv) is not self._trailer:
+            label += step
+            current.label = label
+
+    def merge(self, other: 'PositionalList', key: Callable or None = None) -> None:
+        """
+        Merge the sorted PositionalList other into this sorted PositionalList, in O(n)
+
+        The records of other are relinked, not copied: other is emptied, and its
+        Positions are transferred to this container. The merge is stable; on ties,
+        the elements of this list come first.
+        :param other: a PositionalList of the same type, sorted by key
+        :param key: a function of one argument that extracts a comparison key from a payload
+        :return: None
+        """
+        self.merge_all([other], key=key)
+
+    def merge_all(self, others: Iterable, key: Callable or None = None) -> None:
+        """
+        Merge the sorted PositionalLists others into this sorted PositionalList, in O(n log k)
+
+        k-way merge over this list and others: the records are relinked, not copied;
+        the lists in others are emptied, and their Positions are transferred to this
+        container. The merge is stable, in the order this list, then others.
+        :param others: an iterable of PositionalList of the same type, sorted by key
+        :param key: a function of one argument that extracts a comparison key from a payload
+        :return: None
+        """
+        others = list(others)
+        for other in others:
+            if type(other) is not type(self):
+                raise TypeError(f'can only merge a {self.__class__.__qualname__}')
+        if len({id(pl) for pl in [self] + others}) != len(others) + 1:
+            raise ValueError('cannot merge a PositionalList with itself')
+        if key is None:
+            key = lambda payload: payload
+        heap = []
+        for rank, source in enumerate([self] + others):
+            first, stop = source._header.suiv, source._trailer
+            if first is not stop:
+                heap.append((key(first.payload), rank, first, stop))
+            if source is not self:
+                self._size += source._size
+                source._size = 0
+            source._header.suiv, source._trailer.prev = source._trailer, source._header
+        heapq.heapify(heap)
+        last = self._header
+        while heap:
+            _, rank, record, stop = heap[0]
+            last.suiv, record.prev, last = record, last, record
+            if (position := record.position) is not None:
+                position.container = self
+            if (succ := record.suiv) is not stop:
+                heapq.heapreplace(heap, (key(succ.payload), rank, succ, stop))
+            else:
+                heapq.heappop(heap)
+        last.suiv, self._trailer.prev = self._trailer, last
+        self._label_all()
+
 
 if __name__ == '__main__':
     pl = PositionalList()
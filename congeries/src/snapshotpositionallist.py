@@ -0,0 +1,250 @@
+"""
+a PositionalList that offers O(1) read-only snapshots, for concurrent readers
+
+SnapshotPositionalList
+    create: SnapshotPositionalList() or SnapshotPositionalList.from_iterable(iterable)
+
+"""
+
+import bisect
+import threading
+import weakref
+
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator
+from congeries.src.positionallist import PositionalList
+
+
+_VERSIONED = frozenset(('prev', 'suiv', 'payload'))
+
+
+class _Clock:
+    """
+    The versions of one SnapshotPositionalList, shared by its Records and its snapshots
+
+    epoch is the version the writers are currently writing; taking a snapshot
+    freezes the current epoch and opens the next one.
+    live counts the snapshots still held, per epoch; logged holds the records
+    that keep older states (history) for them.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.epoch = 0
+        self.newest = -1
+        self.readers = 0
+        self.live: dict = {}
+        self.logged: list = []
+        self.dirty = False
+
+    def take(self) -> int:
+        """registers a new snapshot, and returns the epoch it reads"""
+        with self.lock:
+            epoch = self.epoch
+            self.epoch += 1
+            self.live[epoch] = self.live.get(epoch, 0) + 1
+            self.readers += 1
+            self.newest = epoch
+            return epoch
+
+    def release(self, epoch: int) -> None:
+        """unregisters a snapshot of epoch; the states it needed are collected lazily"""
+        with self.lock:
+            self.live[epoch] -= 1
+            if not self.live[epoch]:
+                del self.live[epoch]
+            self.readers -= 1
+            self.dirty = True
+
+    def sweep(self) -> None:
+        """forgets the older states that no live snapshot can read anymore"""
+        with self.lock:
+            live = sorted(self.live)
+            self.dirty = False
+        if not live:
+            for record in self.logged:
+                record.history = None
+            self.logged = []
+            return
+        logged = []
+        for record in self.logged:
+            history, kept = record.history, []
+            for idx, entry in enumerate(history):
+                # entry is the state of record from epoch entry[0] until the next state
+                until = history[idx + 1][0] if idx + 1 < len(history) else record.stamp
+                first_reader = bisect.bisect_left(live, entry[0])
+                if first_reader < len(live) and live[first_reader] < until:
+                    kept.append(entry)
+            record.history = kept or None
+            if kept:
+                logged.append(record)
+        self.logged = logged
+
+
+class SnapshotPositionalList(PositionalList):
+    """
+    A PositionalList with O(1) copy-on-write snapshots
+
+    snapshot() returns a read-only view of the list as it is when the snapshot is taken;
+    it can be iterated from another thread while the writer keeps mutating the list.
+
+    Records are versioned lazily (fat nodes): while a snapshot is held, the first write
+    to a Record in a new epoch appends its former links and payload to the Record's
+    history; readers of older epochs follow these states instead of the current ones.
+    Writes that no live snapshot can observe are not logged, and the states of
+    released snapshots are garbage collected at the next write.
+
+    Each list has its own clock: a snapshot of one list does not make the writes to
+    another one log their history. merge() moves the records of the other lists to the
+    clock of this one, so the other lists must not have live snapshots.
+
+    snapshot() must not run concurrently with a mutation of the list: take it under
+    the lock that serializes the writer, then iterate it outside of that lock.
+    """
+
+    def __init__(self) -> None:
+        """
+        # implementation detail: the Records of the list, sentinels included, are created
+        # with its clock, by an instance attribute Record that shadows the class
+        """
+        self._clock = _Clock()
+        self.Record = partial(type(self).Record, clock=self._clock)
+        super().__init__()
+
+    @dataclass(eq=False, repr=False)
+    class Record(PositionalList.Record):
+        """
+        a PositionalList.Record that keeps the former states (prev, suiv, payload) that
+        live snapshots may read
+
+        clock is the _Clock of the list the record belongs to;
+        stamp is the epoch in which the current state was written;
+        history is a list of (stamp, prev, suiv, payload) former states, oldest first, or None
+        """
+        clock: _Clock or None = None
+        stamp: int or None = None
+        history: list or None = None
+
+        def __post_init__(self) -> None:
+            object.__setattr__(self, 'stamp', self.clock.epoch)
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            if name in _VERSIONED:
+                stamp = self.__dict__.get('stamp')    # None while the record is initialized
+                clock = self.clock if stamp is not None else None
+                if clock is not None and clock.dirty:
+                    clock.sweep()
+                if clock is not None and stamp != clock.epoch:
+                    if clock.readers and stamp <= clock.newest:
+                        state = (stamp, self.prev, self.suiv, self.payload)
+                        if self.history is None:
+                            object.__setattr__(self, 'history', [state])
+                            clock.logged.append(self)
+                        else:
+                            self.history.append(state)
+                    # order matters for readers: history first, then stamp, then the field
+                    object.__setattr__(self, 'stamp', clock.epoch)
+            object.__setattr__(self, name, value)
+
+        def state_at(self, epoch: int) -> tuple:
+            """return the state (prev, suiv, payload) of the record, as of epoch
+
+            :param epoch: the epoch of a live snapshot
+            :return: a tuple (prev, suiv, payload)
+            """
+            # read the fields before the stamp, as the writer sets the stamp before the fields
+            state = (self.prev, self.suiv, self.payload)
+            if self.stamp <= epoch:
+                return state
+            for entry in reversed(self.history):
+                if entry[0] <= epoch:
+                    return entry[1:]
+            raise RuntimeError('snapshot state was collected')
+
+    class Snapshot:
+        """
+        A read-only view of a SnapshotPositionalList, as it was when the snapshot was taken
+
+        Iterating is safe while the list is mutated. The states kept for the snapshot are
+        released by close(), at the end of a with statement, or when it is garbage collected.
+        """
+
+        def __init__(self, container: 'SnapshotPositionalList') -> None:
+            self._header, self._trailer = container._header, container._trailer
+            self._size = len(container)
+            self.epoch = container._clock.take()
+            self._finalizer = weakref.finalize(self, container._clock.release, self.epoch)
+
+        def __len__(self) -> int:
+            return self._size
+
+        def __iter__(self) -> Iterator:
+            """yields the payloads, front to back, as of the snapshot"""
+            epoch, trailer = self.epoch, self._trailer
+            current = self._header.state_at(epoch)[1]
+            while current is not trailer:
+                _, suiv, payload = current.state_at(epoch)
+                yield payload
+                current = suiv
+
+        def __reversed__(self) -> Iterator:
+            """yields the payloads, back to front, as of the snapshot"""
+            epoch, header = self.epoch, self._header
+            current = self._trailer.state_at(epoch)[0]
+            while current is not header:
+                prev, _, payload = current.state_at(epoch)
+                yield payload
+                current = prev
+
+        def __enter__(self) -> 'SnapshotPositionalList.Snapshot':
+            return self
+
+        def __exit__(self, *exc_info) -> None:
+            self.close()
+
+        def close(self) -> None:
+            """releases the snapshot; it must not be iterated afterwards"""
+            self._finalizer()
+
+    def snapshot(self) -> 'SnapshotPositionalList.Snapshot':
+        """
+        return a read-only, consistent view of the list as it is now, in O(1)
+
+        :return: a SnapshotPositionalList.Snapshot
+        """
+        if self._clock.dirty:
+            self._clock.sweep()
+        return self.Snapshot(self)
+
+    def merge_all(self, others: Iterable, key: Callable or None = None) -> None:
+        """
+        override inherited version: the records of others are moved to the clock of this list
+
+        the moved records are restamped in the current epoch, with no history: the live snapshots
+        of this list never read them, and the lists in others must not have live snapshots
+        :param others: an iterable of SnapshotPositionalList, sorted by key, without live snapshots
+        :param key: a function of one argument that extracts a comparison key from a payload
+        :return: None
+        """
+        others = list(others)
+        for other in others:
+            if isinstance(other, SnapshotPositionalList) and other is not self and other._clock.readers:
+                raise ValueError('cannot merge a SnapshotPositionalList that has live snapshots')
+        super().merge_all(others, key=key)
+        for other in others:
+            other._clock.sweep()    # without readers, forgets all the states logged
+        clock, current = self._clock, self._header.suiv
+        while current is not self._trailer:
+            if current.clock is not clock:
+                current.clock, current.stamp, current.history = clock, clock.epoch, None
+            current = current.suiv
+
+
+if __name__ == '__main__':
+
+    spl = SnapshotPositionalList.from_iterable('abc')
+    with spl.snapshot() as snap:
+        spl.delete(spl.first())
+        spl.add_last('d')
+        print(spl, list(snap))
@@ -0,0 +1,172 @@
+"""
+a PositionalList that keeps its elements sorted
+
+SortedPositionalList
+    create: SortedPositionalList() or SortedPositionalList.from_iterable(iterable)
+
+"""
+
+import operator
+
+from typing import Any, Iterable, Iterator
+from congeries.src.indexablepositionallist import IndexablePositionalList
+
+
+class SortedPositionalList(IndexablePositionalList):
+    """
+    A PositionalList whose elements are kept in non-decreasing order
+
+    The express lanes of IndexablePositionalList are searched by value: add, bisect_left,
+    bisect_right, find, remove and discard run in expected O(log n), irange in expected
+    O(log n + k) for k Positions yielded.
+    Elements must be comparable; equal elements are kept in insertion order.
+
+    The Positions returned stay valid until their element is deleted; as the order is
+    determined by the values, the operations that place or overwrite an element at a
+    given Position (add_first, add_after, move_to_front, replace, ...) are not supported.
+    """
+
+    @classmethod
+    def from_iterable(cls, it: Iterable) -> 'SortedPositionalList':
+        """creates, populates and return a SortedPositionalList/cls object, in O(n log n)
+
+        :param it: an iterable of comparable elements
+        :return: an object of class cls, populated with the sorted items
+                 of the iterable passed as a parameter
+        """
+        new_seq: cls = cls()
+        new_seq._insert_many_between(sorted(it), new_seq._header, new_seq._trailer)
+        return new_seq
+
+    def _search(self, value: Any, right: bool = False) -> tuple:
+        """
+        Utility method that descends the express lanes to the last Record before value
+
+        :param value: a comparable element
+        :param right: if True, the Records equal to value come before it
+        :return: a tuple (record, rank): the last Record whose payload is less than value
+                 (less than or equal, if right), or the header, and its rank (the header has rank 0)
+        """
+        before = operator.le if right else operator.lt
+        trailer = self._trailer
+        node, rank = self._header, 0
+        for lane in range(self._height - 2, -1, -1):
+            while (succ := node.lanes_suiv[lane]) is not trailer and before(succ.payload, value):
+                rank += node.lanes_width[lane]
+                node = succ
+        while (succ := node.suiv) is not trailer and before(succ.payload, value):
+            node, rank = succ, rank + 1
+        return node, rank
+
+    def add(self, value: Any) -> 'SortedPositionalList.Position':
+        """
+        Insert value in sorted order, after the elements equal to it, in expected O(log n)
+
+        :param value: a comparable element
+        :return: the SortedPositionalList.Position of value
+        """
+        node, _ = self._search(value, right=True)
+        return self._insert_between(value, node, node.suiv)
+
+    def bisect_left(self, value: Any) -> int:
+        """
+        return the index where value would be inserted, before the elements equal to it
+
+        :param value: a comparable element
+        :return: an int in [0, len(self)]
+        """
+        return self._search(value)[1]
+
+    def bisect_right(self, value: Any) -> int:
+        """
+        return the index where value would be inserted, after the elements equal to it
+
+        :param value: a comparable element
+        :return: an int in [0, len(self)]
+        """
+        return self._search(value, right=True)[1]
+
+    def irange(self, lo: Any = None, hi: Any = None) -> Iterator:
+        """
+        yield the Positions whose elements are in [lo, hi], in order
+
+        :param lo: a comparable element, or None for no lower bound
+        :param hi: a comparable element, or None for no upper bound
+        :return: an iterator of SortedPositionalList.Position
+        """
+        node = self._header if lo is None else self._search(lo)[0]
+        trailer = self._trailer
+        while (node := node.suiv) is not trailer and (hi is None or node.payload <= hi):
+            yield self._make_position(node)
+
+    def find(self, value: Any) -> 'SortedPositionalList.Position' or None:
+        """
+        return the Position of the first element equal to value, or None
+
+        :param value: a comparable element
+        :return: a SortedPositionalList.Position, or None
+        """
+        record = self._search(value)[0].suiv
+        if record is self._trailer or record.payload != value:
+            return None
+        return self._make_position(record)
+
+    def __contains__(self, value: Any) -> bool:
+        return self.find(value) is not None
+
+    def remove(self, value: Any) -> None:
+        """
+        Remove the first element equal to value; raise ValueError if there is none
+
+        :param value: a comparable element
+        :return: None
+        """
+        if not self.discard(value):
+            raise ValueError(f'{value!r} not in {self.__class__.__name__}')
+
+    def discard(self, value: Any) -> bool:
+        """
+        Remove the first element equal to value, if any
+
+        :param value: a comparable element
+        :return: True if an element was removed
+        """
+        record = self._search(value)[0].suiv
+        if record is self._trailer or record.payload != value:
+            return False
+        self._delete_record(record)
+        return True
+
+    def sort(self) -> None:
+        """a SortedPositionalList is always sorted
+
+        :return: None
+        """
+
+    def merge_all(self, others: Iterable, key: None = None) -> None:
+        """
+        Merge the SortedPositionalLists others into this one, in O(n log k)
+
+        override inherited version: the lists are ordered by value, key must be None
+        :param others: an iterable of SortedPositionalList
+        :param key: None
+        :return: None
+        """
+        if key is not None:
+            raise ValueError(f'{self.__class__.__name__} is ordered by value, key must be None')
+        super().merge_all(others)
+
+    def _unsupported(self, *args, **kwargs) -> None:
+        raise TypeError(f'{self.__class__.__name__} orders its elements by value, use add()')
+
+    add_first = add_last = add_before = add_after = _unsupported
+    add_many_after = add_many_before = _unsupported
+    move_to_front = move_to_back = move_before = move_after = _unsupported
+    replace = _unsupported
+
+
+if __name__ == '__main__':
+
+    spl = SortedPositionalList.from_iterable([5, 1, 4])
+    spl.add(3)
+    print(spl, spl.bisect_left(4), [pos.payload() for pos in spl.irange(2, 4)])
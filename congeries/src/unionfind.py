@@ -40,31 +40,213 @@ connections that connect that pair
 =====
 
     UnionFind(n: int) -> None:           Initialize n sites with integer names 0 -> n-1
+    UnionFind(n: int, typed=True):       the same, with id, sz and ring stored as typed arrays
     union(p: int, q: int) -> None:       add connection between sites p and q
     _find(p: int) -> int:                return component identifier for p (0 -> n-1)
     connected(p: int, q: int) -> bool:   return True if p & q are in the same component
     count() -> int:                      return the number of components
 
+membership:
+    size(p: int) -> int:                 return the number of sites in the component of p
+    members(p: int) -> list:             return the sites in the component of p
+    components() -> Iterator:            yield the list of sites of each component
+
+rollback (RollbackUF):
+    checkpoint() -> int:                 return a mark of the current state
+    rollback(to: int) -> None:           undo the unions made since checkpoint() returned to
+    undo() -> bool:                      undo the last union that linked two components
+
+persistence:
+    save(path: str) -> None:             write the state to a compact binary file
+    load(path: str, mmap=True):          classmethod, return a UnionFind with the state of the file
+
+instrumentation:
+    max_depth() -> int:                  the height of the tallest tree
+    average_path_length() -> float:      the average number of links from a site to its root
+    instrument() -> UnionFind:           count the array accesses of union() and connected()
+    accesses_per_operation() -> dict:    the average number of array accesses, per operation
+
 we start with n components and each `union()` that merges two different components
 decrements the number of components by 1
 
 """
 
+import mmap as mmap_module
+import os
+import struct
+import sys
+
 from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+from typing import Hashable, Iterable, Iterator
+
+
+# the header of the files written by UnionFind.save(): magic, version, byte order of the
+# arrays ('<' or '>'), array typecode ('i' or 'q'), flat trees (QuickFindUF), n, components_count;
+# 32 bytes, so that the arrays that follow are aligned
+_HEADER = struct.Struct('<4sBcc?8xqq')
+_MAGIC = b'CGUF'
+_VERSION = 1
+_BYTEORDER = b'<' if sys.byteorder == 'little' else b'>'
+
+
+class _CountingList(list):
+    """
+    A list that counts the accesses to its items; iterating counts one access per item
+    """
+
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.accesses = 0
+
+    def __getitem__(self, idx):
+        self.accesses += 1
+        return super().__getitem__(idx)
+
+    def __setitem__(self, idx, value) -> None:
+        self.accesses += 1
+        super().__setitem__(idx, value)
+
+    def __iter__(self):
+        self.accesses += len(self)
+        return super().__iter__()
+
+
+def _typecode(n: int) -> str:
+    """Utility function that returns the typecode of the arrays of n sites: 'i' (int32), or 'q' (int64)"""
+    return 'i' if n <= 2 ** 31 - 1 else 'q'
+
+
+def _tolist(values) -> list:
+    """Utility function that returns a list copy of an array of sites, without counting accesses
+
+    :param values: a list (possibly a _CountingList), an array, a memoryview or an ndarray
+    :return: a list of int
+    """
+    return list.copy(values) if isinstance(values, list) else values.tolist()
+
+
+def _create_aside(path: str) -> tuple:
+    """Utility function that creates a new file next to path, with the permissions of a new file
+
+    unlike tempfile.mkstemp, that creates its files with mode 0o600, the file is created with
+    mode 0o666, less the umask applied by the system
+    :param path: str, the path of the file to be replaced
+    :return: a tuple (fd, temporary), the file descriptor, open for writing, and the path of the file
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, 'O_BINARY', 0)
+    while True:
+        temporary = os.path.join(directory, f'.{name}.{os.urandom(6).hex()}.tmp')
+        try:
+            return os.open(temporary, flags, 0o666), temporary
+        except FileExistsError:
+            continue
 
 
 class UnionFind(ABC):
     """
     Determines if sites are connected, and if not, connects them.
+
+    Besides id, every UnionFind keeps, for the membership queries:
+
+    - sz, the number of sites in the component of each root (component identifier)
+    - ring, the successor of each site in a circular list of the sites of its component;
+      linking two components splices their rings in O(1)
     """
 
-    def __init__(self, n: int) -> None:
+    # the arrays (list attributes) instrument() counts the accesses to;
+    # the membership bookkeeping (ring) is not counted
+    _ARRAYS = ('id', 'sz')
+
+    def __init__(self, n: int, typed: bool = False) -> None:
         """initializes an array (list) where each value is equal to its index
 
+        with typed, id, sz and ring are arrays of C ints rather than lists of Python ints:
+        4 bytes per site for each of them (8 beyond 2**31 - 1 sites), against 8 for the
+        pointers of a list plus 32 for each distinct int object. Every access boxes or
+        unboxes an int: the operations are slower while the lists fit in the CPU caches
+        (1.7x at 10**4 sites), faster beyond, when the int objects scattered in memory
+        miss them (1.8x at 10**6 sites)
         :param n: int, the number of sites
+        :param typed: bool, True to store the arrays as array('i') (array('q') for larger n)
         """
         self.components_count = n
+        if typed:
+            self.id = array(_typecode(n), range(n))
+            self.sz = array(self.id.typecode, [1]) * n
+            self.ring = array(self.id.typecode, self.id)
+            return
         self.id = [idx for idx in range(n)]
+        self.sz = [1] * n
+        self.ring = list(range(n))
+
+    def _add_site(self) -> int:
+        """Utility method that adds a new site, in its own component, in amortized O(1)
+
+        :return: int, the new site
+        """
+        site = len(self.id)
+        self.id.append(site)
+        self.sz.append(1)
+        self.ring.append(site)
+        self.components_count += 1
+        return site
+
+    def _link(self, child: int, root: int) -> None:
+        """Utility method that accounts for the component of child joining the component of root
+
+        updates the count of components and the size of root, and splices the rings
+        of the two components, in O(1). The caller updates id.
+        :param child: int, the component identifier that disappears
+        :param root: int, the component identifier of the union
+        :return: None
+        """
+        self.components_count -= 1
+        sz, ring = self.sz, self.ring
+        sz[root] += sz[child]
+        ring[child], ring[root] = ring[root], ring[child]
+
+    def size(self, p: int) -> int:
+        """return the number of sites in the component of p
+
+        :param p: int, site p
+        :return: int
+        """
+        return self.sz[self._find(p)]
+
+    def _members(self, p: int) -> list:
+        """Utility method that walks the ring of p, in O(size of the component)
+
+        :param p: int, site p
+        :return: the list of the sites in the component of p, starting with p
+        """
+        ring, members = self.ring, [p]
+        site = ring[p]
+        while site != p:
+            members.append(site)
+            site = ring[site]
+        return members
+
+    def members(self, p: int) -> list:
+        """return the sites in the component of p, in O(size of the component)
+
+        :param p: int, site p
+        :return: a list of int, starting with p
+        """
+        return self._members(p)
+
+    def components(self) -> Iterator:
+        """yield the list of the sites of each component, in O(n) overall
+
+        the component identifiers are the sites s with id[s] == s: they are recognized
+        without any find, and each component is then listed from its ring
+        :return: an iterator of lists of int
+        """
+        for root, parent in enumerate(_tolist(self.id)):
+            if root == parent:
+                yield self._members(root)
 
     def connected(self, p: int, q: int) -> bool:
         """return True if p & q are in the same component
@@ -75,6 +257,157 @@ class UnionFind(ABC):
         """
         return self._find(p) == self._find(q)
 
+    def _depths(self) -> list:
+        """Utility method that computes the depth of every site in its tree, in O(n)
+
+        does not compress paths, nor count array accesses
+        :return: a list of int, the number of links from each site to its root
+        """
+        parent = _tolist(self.id)
+        depths = [-1] * len(parent)
+        for site in range(len(parent)):
+            path = []
+            while depths[site] < 0 and parent[site] != site:
+                path.append(site)
+                site = parent[site]
+            depth = max(depths[site], 0)
+            depths[site] = depth
+            for node in reversed(path):
+                depth += 1
+                depths[node] = depth
+        return depths
+
+    def max_depth(self) -> int:
+        """return the height of the tallest tree: the largest number of links from a site to its root
+
+        :return: int
+        """
+        return max(self._depths(), default=0)
+
+    def average_path_length(self) -> float:
+        """return the average number of links from a site to its root
+
+        :return: float, 0.0 if there are no sites
+        """
+        depths = self._depths()
+        return sum(depths) / len(depths) if depths else 0.0
+
+    def save(self, path: str) -> None:
+        """write the state (id, sz, ring and the count) to a compact binary file
+
+        a 32 bytes header, then the three arrays of int32 (int64 beyond 2**31 - 1 sites),
+        in the native byte order: 12 bytes per site. The file is replaced atomically, so that
+        it can be saved over while loaded with mmap, here or in other processes
+        :param path: str, the path of the file, overwritten; it keeps its permissions,
+                     a new file gets the default ones (0o666 less the umask)
+        :return: None
+        """
+        n = len(self.id)
+        typecode = _typecode(n)
+        # written aside, then renamed: the processes that map the previous file keep it intact
+        fd, temporary = _create_aside(path)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, _VERSION, _BYTEORDER, typecode.encode(),
+                                     isinstance(self, QuickFindUF), n, self.components_count))
+                for name in ('id', 'sz', 'ring'):
+                    f.write(self._packed(getattr(self, name), typecode))
+            try:
+                os.chmod(temporary, os.stat(path).st_mode & 0o7777)
+            except FileNotFoundError:
+                pass    # a new file: the permissions given at creation
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'UnionFind':
+        """return an instance of cls with the state written by save()
+
+        with mmap, the arrays are memoryviews over a copy-on-write map of the file: the file
+        is never modified, and the pages that are not written (by unions, or path compression)
+        are shared by all the processes that load it, without being read or copied up front
+        :param path: str, the path of a file written by save()
+        :param mmap: bool, True to map the file, False to read it into the arrays of cls
+        :return: a cls instance
+        """
+        with open(path, 'rb') as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError(f'{path} is not a UnionFind file, shorter than its header')
+            magic, version, byteorder, typecode, flat, n, count = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f'{path} is not a UnionFind file, or of an unsupported version')
+            if byteorder != _BYTEORDER:
+                raise ValueError(f'{path} was written on a machine of another byte order')
+            if issubclass(cls, QuickFindUF) and not flat:
+                raise ValueError(f'{path} holds trees, not the flat components of a QuickFindUF')
+            typecode = typecode.decode()
+            width = array(typecode).itemsize
+            if f.seek(0, 2) != _HEADER.size + 3 * n * width:
+                raise ValueError(f'{path} is truncated')
+            if mmap:
+                buffer = memoryview(mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_COPY))
+            else:
+                f.seek(0)
+                buffer = memoryview(f.read())
+        uf = cls(0)
+        uf.components_count = count
+        for idx, name in enumerate(('id', 'sz', 'ring')):
+            start = _HEADER.size + idx * n * width
+            setattr(uf, name, uf._unpacked(buffer[start:start + n * width], typecode, mmap))
+        return uf
+
+    def _packed(self, values, typecode: str):
+        """Utility method that returns values as a buffer of typecode items, for save()"""
+        if getattr(values, 'typecode', getattr(values, 'format', None)) == typecode:
+            return values
+        return array(typecode, values)
+
+    def _unpacked(self, buffer: memoryview, typecode: str, mapped: bool):
+        """Utility method that returns the array of a buffer of typecode items, for load()
+
+        :param buffer: a memoryview of bytes
+        :param typecode: str, 'i' or 'q'
+        :param mapped: bool, True if buffer is a memory map, to be used in place
+        :return: a memoryview of mapped, a list otherwise
+        """
+        return buffer.cast(typecode) if mapped else buffer.cast(typecode).tolist()
+
+    def instrument(self) -> 'UnionFind':
+        """start counting the array accesses of union() and connected()
+
+        the arrays are replaced with lists that count the accesses to their items,
+        which slows down every operation; meant for analysis and benchmarks
+        :return: self
+        """
+        for name in self._ARRAYS:
+            setattr(self, name, _CountingList(getattr(self, name)))
+        self.operations, self.array_accesses = Counter(), Counter()
+        for name in ('union', 'connected'):
+            setattr(self, name, self._counted(name, getattr(self, name)))
+        return self
+
+    def _counted(self, name: str, operation):
+        """Utility method that wraps operation to count its calls and array accesses under name"""
+        arrays = [getattr(self, array) for array in self._ARRAYS]
+
+        def counted_operation(*args):
+            before = sum(array.accesses for array in arrays)
+            result = operation(*args)
+            self.operations[name] += 1
+            self.array_accesses[name] += sum(array.accesses for array in arrays) - before
+            return result
+        return counted_operation
+
+    def accesses_per_operation(self) -> dict:
+        """return the average number of array accesses per call, for each operation
+
+        :return: a dict {operation name: float}, requires instrument()
+        """
+        return {name: self.array_accesses[name] / calls for name, calls in self.operations.items()}
+
     @abstractmethod
     def _find(self, p: int) -> int:
         """return component identifier for p (0 -> n-1)
@@ -105,6 +438,11 @@ class QuickFindUF(UnionFind):
     which immediately implies that `connected(p, q)` reduces to the test
     `id[p] == id[q]` and returns true if and only if `p` and `q` are in the same
     component
+
+    union relabels the smaller of the two components only, walking its member ring
+    instead of scanning the whole of id: a site is relabelled only when the size of
+    its component at least doubles, so at most lg n times, and n - 1 unions take
+    O(n log n) overall, instead of O(n^2)
     """
 
     def _find(self, p: int) -> int:
@@ -121,7 +459,8 @@ class QuickFindUF(UnionFind):
 
         maintains the invariant that the component identifier is the same
         integer for every site in each connected component
-        Ensures that all connected sites share the same id
+        Ensures that all connected sites share the same id: the sites of the smaller
+        component (of p's, for components of the same size) take the id of the other
         :param p: int, site p
         :param q: int, site q
         :return: None
@@ -129,10 +468,15 @@ class QuickFindUF(UnionFind):
         if (pid := self._find(p)) == (qid := self._find(q)):
             # p and q already in the same component
             return
-        self.components_count -= 1
-        for idx, id_idx in enumerate(self.id):
-            if id_idx == pid:
-                self.id[idx] = qid
+        if self.sz[pid] > self.sz[qid]:
+            pid, qid = qid, pid
+        ids, ring, site = self.id, self.ring, pid
+        while True:
+            ids[site] = qid
+            site = ring[site]
+            if site == pid:
+                break
+        self._link(pid, qid)
 
 
 class QuickUnionUF(UnionFind):
@@ -147,27 +491,26 @@ class QuickUnionUF(UnionFind):
     def union(self, p: int, q: int) -> None:
         proot, qroot = self._find(p), self._find(q)
         if proot != qroot:
-            self.components_count -= 1
             self.id[proot] = qroot
+            self._link(proot, qroot)
 
 
 class WeightedQuickUnionUF(QuickUnionUF):
-
-    def __init__(self, n: int) -> None:
-        super().__init__(n)
-        self.sz = [1] * n
+    """
+    union by size: links the root of the smaller tree to the root of the larger one,
+    so that the depth of any site is at most lg n
+    """
 
     def union(self, p: int, q: int) -> None:
         proot, qroot = self._find(p), self._find(q)
         if proot == qroot:
             return
-        self.components_count -= 1
         if self.sz[proot] < self.sz[qroot]:
             self.id[proot] = qroot
-            self.sz[qroot] += self.id[proot]
+            self._link(proot, qroot)
         else:
             self.id[qroot] = proot
-            self.sz[proot] += self.id[qroot]
+            self._link(qroot, proot)
 
 
 class WeightedQuickUnionPathCompressionUF(WeightedQuickUnionUF):
@@ -179,17 +522,175 @@ class WeightedQuickUnionPathCompressionUF(WeightedQuickUnionUF):
             p = self.id[p]
         return p
 
-    def union(self, p: int, q: int) -> None:
-        proot, qroot = self._find(p), self._find(q)
-        if proot == qroot:
-            return
-        self.components_count -= 1
-        if self.sz[proot] < self.sz[qroot]:
-            self.id[proot] = qroot
-            self.sz[qroot] += self.id[proot]
-        else:
-            self.id[qroot] = proot
-            self.sz[proot] += self.id[qroot]
+
+class RollbackUF(WeightedQuickUnionUF):
+    """
+    A weighted quick-union without path compression, whose unions can be undone
+
+    Every union that links two components logs the root it hooked; undoing it restores
+    id, sz, the rings and the count in O(1), since nothing else has changed the trees
+    since (unions are undone in reverse order, and _find never modifies id). With union
+    by size, _find stays O(log n). Meant for offline and backtracking algorithms:
+
+        mark = uf.checkpoint()
+        ...    # unions
+        uf.rollback(mark)    # back to the components at checkpoint time
+    """
+
+    def __init__(self, n: int, typed: bool = False) -> None:
+        """initializes n sites, and an empty log of links
+
+        :param n: int, the number of sites
+        :param typed: bool, True to store the arrays as array('i') (array('q') for larger n)
+        """
+        super().__init__(n, typed)
+        self.history = []
+
+    def _link(self, child: int, root: int) -> None:
+        """Utility method; extend inherited version to log the hooked root"""
+        super()._link(child, root)
+        self.history.append(child)
+
+    def checkpoint(self) -> int:
+        """return a mark of the current state, for rollback()
+
+        :return: int, the number of links logged
+        """
+        return len(self.history)
+
+    def undo(self) -> bool:
+        """undo the last union that linked two components
+
+        :return: True if a union was undone, False if there was none to undo
+        """
+        if not self.history:
+            return False
+        child = self.history.pop()
+        root, sz, ring = self.id[child], self.sz, self.ring
+        self.id[child] = child
+        sz[root] -= sz[child]
+        # swapping the successors again splits the spliced rings
+        ring[child], ring[root] = ring[root], ring[child]
+        self.components_count += 1
+        return True
+
+    def rollback(self, to: int = 0) -> None:
+        """undo the unions made since checkpoint() returned to, latest first
+
+        :param to: int, a mark returned by checkpoint(), defaults to the initial state
+        :return: None
+        """
+        if not 0 <= to <= len(self.history):
+            raise ValueError(f'invalid checkpoint {to}, expected 0 <= to <= {len(self.history)}')
+        while len(self.history) > to:
+            self.undo()
+
+
+class KeyedUF(WeightedQuickUnionPathCompressionUF):
+    """
+    A WeightedQuickUnionPathCompressionUF over arbitrary hashable keys, added over time
+
+    Each key is interned to a dense integer site, its index in keys; the id and sz
+    lists grow by one site per new key, in amortized O(1). Every operation costs one
+    dict lookup per key on top of the integer algorithms.
+    """
+
+    def __init__(self, keys: Iterable = ()) -> None:
+        """initializes one site per key
+
+        :param keys: an iterable of hashable keys, duplicates are ignored
+        """
+        super().__init__(0)
+        self.keys = []
+        self._sites = {}
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._sites
+
+    def add(self, key: Hashable) -> int:
+        """add key as a new site, in its own component, unless it is already present
+
+        :param key: a hashable key
+        :return: int, the site of key
+        """
+        if (site := self._sites.get(key)) is None:
+            site = self._sites[key] = self._add_site()
+            self.keys.append(key)
+        return site
+
+    make_set = add
+
+    def save(self, path: str) -> None:
+        """the keys are arbitrary hashable objects, without a compact binary form"""
+        raise TypeError('KeyedUF cannot be saved')
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'KeyedUF':
+        """the keys are arbitrary hashable objects, without a compact binary form"""
+        raise TypeError('KeyedUF cannot be loaded')
+
+    def find(self, key: Hashable) -> Hashable:
+        """return the key representing the component of key
+
+        :param key: a key, raise KeyError if it was never added
+        :return: the key of the root of the component of key
+        """
+        return self.keys[self._find(self._sites[key])]
+
+    def size(self, key: Hashable) -> int:
+        """return the number of keys in the component of key
+
+        :param key: a key, raise KeyError if it was never added
+        :return: int
+        """
+        return super().size(self._sites[key])
+
+    def members(self, key: Hashable) -> list:
+        """return the keys in the component of key, in O(size of the component)
+
+        :param key: a key, raise KeyError if it was never added
+        :return: a list of keys, starting with key
+        """
+        keys = self.keys
+        return [keys[site] for site in self._members(self._sites[key])]
+
+    def components(self) -> Iterator:
+        """yield the list of the keys of each component, in O(n) overall
+
+        :return: an iterator of lists of keys
+        """
+        keys = self.keys
+        for members in super().components():
+            yield [keys[site] for site in members]
+
+    def connected(self, p: Hashable, q: Hashable) -> bool:
+        """return True if keys p & q are in the same component
+
+        :param p: a key, raise KeyError if it was never added
+        :param q: a key, raise KeyError if it was never added
+        :return: True if p & q are connected, False otherwise
+        """
+        return super().connected(self._sites[p], self._sites[q])
+
+    def union(self, p: Hashable, q: Hashable) -> None:
+        """add connection between keys p and q, adding the keys that are not present yet
+
+        :param p: a hashable key
+        :param q: a hashable key
+        :return: None
+        """
+        sites = self._sites
+        psite, qsite = sites.get(p), sites.get(q)
+        if psite is None:
+            psite = self.add(p)
+        if qsite is None:
+            qsite = self.add(q)
+        super().union(psite, qsite)
 
 
 if __name__ == '__main__':
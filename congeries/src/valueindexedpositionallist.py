@@ -0,0 +1,217 @@
+"""
+a PositionalList that indexes its Positions by payload
+
+ValueIndexedPositionalList
+    create: ValueIndexedPositionalList() or ValueIndexedPositionalList.from_iterable(iterable)
+
+"""
+
+from typing import Any, Callable, Iterable
+from congeries.src.positionallist import PositionalList
+
+
+class ValueIndexedPositionalList(PositionalList):
+    """
+    A PositionalList that maintains a hash index (a multimap) from payload to Positions
+
+    find(value), find_all(value), `value in pl`, count(value) and remove(value) run in
+    O(1) average time instead of a linear scan, O(k) for a value held k times: find and
+    find_all follow the list order, which the order labels of the Records give.
+    The index is maintained by add_*, replace and delete; payloads must be hashable.
+
+    The index maps each payload to a dict of the Records holding it, keyed by their id,
+    in the order they were indexed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._index: dict = {}
+
+    def _index_record(self, record: 'ValueIndexedPositionalList.Record') -> None:
+        """
+        Utility method that adds record to the index, under its payload
+
+        :param record: a ValueIndexedPositionalList.Record
+        :return: None
+        """
+        records = self._index.get(record.payload)
+        if records is None:
+            records = self._index[record.payload] = {}
+        records[id(record)] = record
+
+    def _unindex_record(self, record: 'ValueIndexedPositionalList.Record') -> None:
+        """
+        Utility method that removes record from the index
+
+        :param record: a ValueIndexedPositionalList.Record
+        :return: None
+        """
+        records = self._index[record.payload]
+        del records[id(record)]
+        if not records:
+            del self._index[record.payload]
+
+    def _insert_between(
+            self,
+            payload: Any,
+            prev_rec: 'ValueIndexedPositionalList.Record',
+            succ_rec: 'ValueIndexedPositionalList.Record',
+    ) -> 'ValueIndexedPositionalList.Position':
+        """
+        Utility method; override inherited version to index the new Record
+
+        :param payload: a hashable object or value
+        :param prev_rec: ValueIndexedPositionalList.Record
+        :param succ_rec: ValueIndexedPositionalList.Record
+        :return: a ValueIndexedPositionalList.Position carrying the corresponding Record
+        """
+        hash(payload)   # fail before linking an unhashable payload
+        position = super()._insert_between(payload, prev_rec, succ_rec)
+        self._index_record(position.record)
+        return position
+
+    def _insert_many_between(
+            self,
+            it: Iterable,
+            prev_rec: 'ValueIndexedPositionalList.Record',
+            succ_rec: 'ValueIndexedPositionalList.Record',
+    ) -> list:
+        """
+        Utility method; override inherited version to index the new Records
+
+        :param it: an iterable of hashable payloads
+        :param prev_rec: ValueIndexedPositionalList.Record
+        :param succ_rec: ValueIndexedPositionalList.Record
+        :return: the list of the new ValueIndexedPositionalList.Record, in order
+        """
+        items = list(it)
+        for item in items:
+            hash(item)   # fail before linking an unhashable payload
+        records = super()._insert_many_between(items, prev_rec, succ_rec)
+        for record in records:
+            self._index_record(record)
+        return records
+
+    def _delete_record(self, record: 'ValueIndexedPositionalList.Record') -> Any:
+        """
+        Utility method; override inherited version to remove the Record from the index
+
+        :param record: the ValueIndexedPositionalList.Record to be deleted
+        :return: payload
+        """
+        self._unindex_record(record)
+        return super()._delete_record(record)
+
+    def _delete_run(
+            self,
+            first: 'ValueIndexedPositionalList.Record',
+            last: 'ValueIndexedPositionalList.Record',
+    ) -> list:
+        """
+        Utility method; override inherited version to remove the Records from the index
+
+        :param first: ValueIndexedPositionalList.Record
+        :param last: ValueIndexedPositionalList.Record, first or a record after it
+        :return: the list of the payloads of the deleted records, in order
+        """
+        stop, current = last.suiv, first
+        while current is not stop:
+            self._unindex_record(current)
+            current = current.suiv
+        return super()._delete_run(first, last)
+
+    def replace(self, pos: 'ValueIndexedPositionalList.Position', elt: Any) -> Any:
+        """
+        Replace the element at Position pos with elt, and update the index
+
+        Return the element formerly at Position pos
+        :param pos: a ValueIndexedPositionalList.Position
+        :param elt: a hashable value payload
+        :return: the value payload formerly stored at Position pos
+        """
+        pos_record = self._validate(pos)
+        hash(elt)
+        self._unindex_record(pos_record)
+        old_value = super().replace(pos, elt)
+        self._index_record(pos_record)
+        return old_value
+
+    def merge_all(self, others: Iterable, key: Callable or None = None) -> None:
+        """
+        Merge the sorted ValueIndexedPositionalLists others into this one, in O(n log k)
+
+        override inherited version to move the index entries of others to this list
+        :param others: an iterable of ValueIndexedPositionalList, sorted by key
+        :param key: a function of one argument that extracts a comparison key from a payload
+        :return: None
+        """
+        others = list(others)
+        super().merge_all(others, key=key)
+        for other in others:
+            for value, records in other._index.items():
+                self._index.setdefault(value, {}).update(records)
+            other._index = {}
+
+    def _records(self, value: Any) -> dict:
+        """
+        Utility method that returns the Records holding value, keyed by their id, in the order they were indexed
+
+        :param value: any object; an unhashable one cannot be stored, and is held by no Record
+        :return: a dict of ValueIndexedPositionalList.Record, empty if value is not in the list
+        """
+        try:
+            return self._index.get(value, {})
+        except TypeError:   # unhashable values cannot be stored
+            return {}
+
+    def __contains__(self, value: Any) -> bool:
+        """True if value is stored in the list, in O(1) average time"""
+        return bool(self._records(value))
+
+    def find(self, value: Any) -> 'ValueIndexedPositionalList.Position':
+        """
+        return the first Position holding value, in list order, or None
+
+        O(1) average time when value is held once, O(k) for k copies: the order labels
+        of their Records tell which comes first
+        :param value: any object
+        :return: a ValueIndexedPositionalList.Position, or None if value is not in the list
+        """
+        records = self._records(value)
+        if not records:
+            return None
+        return self._make_position(min(records.values(), key=lambda record: record.label))
+
+    def find_all(self, value: Any) -> list:
+        """
+        return the Positions holding value, in list order, in O(k log k) for k copies
+
+        :param value: any object
+        :return: a list of ValueIndexedPositionalList.Position, empty if value is not in the list
+        """
+        records = sorted(self._records(value).values(), key=lambda record: record.label)
+        return [self._make_position(record) for record in records]
+
+    def count(self, value: Any) -> int:
+        """return the number of elements equal to value, in O(1) average time"""
+        return len(self._records(value))
+
+    def remove(self, value: Any) -> None:
+        """
+        remove the first element equal to value, in list order, in O(1) average time for a single copy
+
+        :param value: any object
+        :return: None; raise ValueError if value is not in the list
+        """
+        position = self.find(value)
+        if position is None:
+            raise ValueError(f'{value!r} is not in the {self.__class__.__qualname__}')
+        self.delete(position)
+
+
+if __name__ == '__main__':
+
+    vpl = ValueIndexedPositionalList.from_iterable('abcab')
+    print(vpl, 'a' in vpl, vpl.count('a'), vpl.find('c').payload())
+    vpl.remove('a')
+    print(vpl)
@@ -0,0 +1,197 @@
+import unittest
+
+from congeries.src import ARCCache
+from congeries.src import LFUCache
+from congeries.src import LRUCache
+from congeries.src import memoize
+
+
+class CacheContract:
+    """tests shared by every Cache policy"""
+
+    cache_class = None
+
+    def test_capacity_positive(self):
+        with self.assertRaises(ValueError):
+            self.cache_class(0)
+
+    def test_get_put(self):
+        cache = self.cache_class(2)
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('b', 42), 42)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_mapping_interface(self):
+        cache = self.cache_class(3)
+        cache['a'] = 1
+        self.assertIn('a', cache)
+        self.assertEqual(cache['a'], 1)
+        with self.assertRaises(KeyError):
+            cache['b']
+        del cache['a']
+        self.assertNotIn('a', cache)
+        with self.assertRaises(KeyError):
+            del cache['a']
+        self.assertEqual(len(cache), 0)
+
+    def test_update_value(self):
+        cache = self.cache_class(2)
+        cache.put('a', 1)
+        cache.put('a', 2)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('a'), 2)
+
+    def test_stays_within_capacity(self):
+        cache = self.cache_class(10)
+        for key in range(100):
+            cache.put(key, key)
+            cache.get(key // 2)
+        self.assertEqual(len(cache), 10)
+        self.assertEqual(cache.weight, 10)
+        self.assertEqual(cache.evictions, 90)
+
+    def test_on_evict(self):
+        evicted = []
+        cache = self.cache_class(2, on_evict=lambda key, value: evicted.append((key, value)))
+        for key in range(5):
+            cache.put(key, str(key))
+        self.assertEqual(len(evicted), 3)
+        self.assertEqual(sorted(evicted + [(key, cache[key]) for key in cache]),
+                         [(key, str(key)) for key in range(5)])
+
+    def test_weigher(self):
+        cache = self.cache_class(10, weigher=lambda key, value: len(value))
+        cache.put('a', 'xxxx')
+        cache.put('b', 'xxxx')
+        self.assertEqual(cache.weight, 8)
+        cache.put('c', 'xxxx')
+        self.assertEqual(len(cache), 2)
+        self.assertLessEqual(cache.weight, 10)
+
+    def test_too_heavy(self):
+        cache = self.cache_class(3, weigher=lambda key, value: value)
+        cache.put('a', 1)
+        cache.put('b', 4)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.weight, 1)
+
+    def test_pop_clear(self):
+        cache = self.cache_class(3)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.pop('a'), 1)
+        self.assertIsNone(cache.pop('a', None))
+        with self.assertRaises(KeyError):
+            cache.pop('a')
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.weight, 0)
+
+    def test_memoize(self):
+        calls = []
+
+        @memoize(self.cache_class(10))
+        def square(x, offset=0):
+            calls.append(x)
+            return x * x + offset
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3, offset=1), 10)
+        self.assertEqual(calls, [3, 3])
+        self.assertEqual(square.cache.hits, 1)
+
+
+class TestLRUCache(CacheContract, unittest.TestCase):
+
+    cache_class = LRUCache
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(3)
+        for key in 'abc':
+            cache.put(key, key)
+        cache.get('a')
+        cache.put('d', 'd')
+        self.assertEqual(sorted(cache), ['a', 'c', 'd'])
+
+    def test_memoize_default_cache(self):
+        @memoize()
+        def identity(x):
+            return x
+
+        identity(1)
+        self.assertIsInstance(identity.cache, LRUCache)
+        self.assertEqual(identity.cache.capacity, 128)
+
+    def test_memoize_bare(self):
+        calls = []
+
+        @memoize
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(calls, [3])
+        self.assertEqual(square.__name__, 'square')
+        self.assertIsInstance(square.cache, LRUCache)
+        self.assertEqual(square.cache.capacity, 128)
+        with self.assertRaises(TypeError):
+            memoize({})
+
+
+class TestLFUCache(CacheContract, unittest.TestCase):
+
+    cache_class = LFUCache
+
+    def test_evicts_least_frequently_used(self):
+        cache = LFUCache(3)
+        for key in 'abc':
+            cache.put(key, key)
+        for key in 'aabbc':
+            cache.get(key)
+        cache.put('d', 'd')
+        self.assertEqual(sorted(cache), ['a', 'b', 'd'])
+
+    def test_ties_evict_least_recently_used(self):
+        cache = LFUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('b')
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(sorted(cache), ['a', 'c'])
+
+
+class TestARCCache(CacheContract, unittest.TestCase):
+
+    cache_class = ARCCache
+
+    def test_scan_resistant(self):
+        cache = ARCCache(4)
+        for _ in range(2):
+            for key in 'ab':
+                if cache.get(key) is None:
+                    cache.put(key, key)
+        for key in range(100):
+            if cache.get(key) is None:
+                cache.put(key, key)
+        self.assertIn('a', cache)
+        self.assertIn('b', cache)
+
+    def test_ghost_hit_adapts(self):
+        cache = ARCCache(2)
+        cache.put('a', 'a')
+        cache.get('a')
+        cache.put('b', 'b')
+        cache.put('c', 'c')
+        self.assertNotIn('b', cache)
+        cache.put('b', 'b')
+        self.assertGreater(cache.p, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -148,5 +148,152 @@ class TestCircularList(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestCircularListBookmarks(unittest.TestCase):
+
+    def test_set_bookmark_empty(self):
+        cl = CircularList()
+        with self.assertRaises(IndexError):
+            cl.set_bookmark('a')
+
+    def test_jump_to(self):
+        cl = CircularList.from_iterable(range(5))
+        cl.rotate(-3)
+        cl.set_bookmark('three')
+        cl.rotate(-1)
+        self.assertEqual(cl.jump_to('three').payload, 3)
+        self.assertEqual(list(cl), [3, 4, 0, 1, 2])
+
+    def test_jump_to_unknown(self):
+        cl = CircularList.from_iterable(range(5))
+        with self.assertRaises(KeyError):
+            cl.jump_to('nope')
+
+    def test_del_bookmark(self):
+        cl = CircularList.from_iterable(range(5))
+        cl.set_bookmark('a')
+        cl.del_bookmark('a')
+        self.assertEqual(list(cl.bookmarks()), [])
+        with self.assertRaises(KeyError):
+            cl.del_bookmark('a')
+
+    def test_iter_from_does_not_move_cursor(self):
+        cl = CircularList.from_iterable(range(5))
+        cl.rotate(-2)
+        cl.set_bookmark('two')
+        cl.rotate(2)
+        self.assertEqual(list(cl.iter_from('two')), [2, 3, 4, 0, 1])
+        self.assertEqual(cl.cursor.payload, 0)
+
+    def test_insert_at_bookmark(self):
+        cl = CircularList.from_iterable(range(5))
+        cl.rotate(-2)
+        cl.set_bookmark('two')
+        cl.rotate(2)
+        cl.insert_at_bookmark('two', 'x')
+        cl.insert_at_bookmark('two', 'y')
+        self.assertEqual(list(cl), [0, 1, 2, 'x', 'y', 3, 4])
+        self.assertEqual(list(cl.iter_from('two')), ['y', 3, 4, 0, 1, 2, 'x'])
+        self.assertEqual(cl.cursor.payload, 0)
+
+    def test_pop_at_bookmark(self):
+        cl = CircularList.from_iterable(range(5))
+        cl.rotate(-2)
+        cl.set_bookmark('two')
+        cl.rotate(2)
+        self.assertEqual(cl.pop_at_bookmark('two'), 2)
+        self.assertEqual(list(cl), [0, 1, 3, 4])
+        self.assertEqual(cl.jump_to('two').payload, 3)
+
+    def test_pop_at_cursor_moves_bookmarks(self):
+        cl = CircularList.from_iterable(range(5))
+        cl.set_bookmark('a')
+        cl.set_bookmark('b')
+        cl.rotate(-1)
+        cl.set_bookmark('c')
+        cl.rotate(1)
+        cl.pop_at()
+        self.assertEqual(cl.jump_to('a').payload, 1)
+        self.assertEqual(cl.jump_to('b').payload, 1)
+        cl.pop_at()
+        self.assertEqual(cl.jump_to('c').payload, 2)
+        self.assertEqual(list(cl.iter_from('a')), [2, 3, 4])
+
+    def test_pop_last_clears_bookmarks(self):
+        cl = CircularList.from_iterable([1])
+        cl.set_bookmark('a')
+        self.assertEqual(cl.pop_at_bookmark('a'), 1)
+        self.assertIsNone(cl.cursor)
+        self.assertEqual(list(cl.bookmarks()), [])
+        cl.insert_at_cursor(2)
+        self.assertEqual(list(cl), [2])
+
+
+class TestCircularListBulk(unittest.TestCase):
+
+    def test_insert_many_at_cursor_empty_list(self):
+        cl = CircularList()
+        last = cl.insert_many_at_cursor(range(4))
+        self.assertEqual(last.payload, 3)
+        self.assertEqual(len(cl), 4)
+        self.assertEqual(list(cl), [3, 0, 1, 2])
+
+    def test_insert_many_at_cursor_empty_iterable(self):
+        cl = CircularList.from_iterable(range(3))
+        cl.insert_many_at_cursor([])
+        self.assertEqual(list(cl), [0, 1, 2])
+
+    def test_insert_many_at_cursor_splice(self):
+        expected = CircularList.from_iterable([1, 2, 3, 4, 5, 6])
+        cl = CircularList.from_iterable([1, 2, 6])
+        cl.rotate(-1)
+        cl.insert_many_at_cursor([3, 4, 5])
+        cl.rotate(4)
+        self.assertEqual(cl, expected)
+        self.assertEqual(list(reversed(list(cl))), [6, 5, 4, 3, 2, 1])
+
+    def test_insert_many_links_backwards(self):
+        cl = CircularList.from_iterable(range(5))
+        current, seen = cl.cursor, []
+        for _ in range(len(cl)):
+            current = current.prev
+            seen.append(current.payload)
+        self.assertEqual(seen, [4, 3, 2, 1, 0])
+
+    def test_pop_many(self):
+        cl = CircularList.from_iterable(range(6))
+        cl.rotate(-1)
+        self.assertEqual(cl.pop_many(3), [1, 2, 3])
+        self.assertEqual(len(cl), 3)
+        self.assertEqual(list(cl), [4, 5, 0])
+        self.assertEqual(cl.cursor.prev.payload, 0)
+
+    def test_pop_many_wraps_around(self):
+        cl = CircularList.from_iterable(range(5))
+        cl.rotate(1)
+        self.assertEqual(cl.pop_many(3), [4, 0, 1])
+        self.assertEqual(list(cl), [2, 3])
+
+    def test_pop_many_all(self):
+        cl = CircularList.from_iterable(range(5))
+        cl.set_bookmark('a')
+        self.assertEqual(cl.pop_many(5), [0, 1, 2, 3, 4])
+        self.assertFalse(cl)
+        self.assertIsNone(cl.cursor)
+        self.assertEqual(list(cl.bookmarks()), [])
+
+    def test_pop_many_too_many(self):
+        cl = CircularList.from_iterable(range(2))
+        with self.assertRaises(IndexError):
+            cl.pop_many(3)
+
+    def test_pop_many_moves_bookmarks(self):
+        cl = CircularList.from_iterable(range(6))
+        cl.rotate(-2)
+        cl.set_bookmark('two')
+        cl.rotate(2)
+        cl.pop_many(3)
+        self.assertEqual(cl.jump_to('two').payload, 3)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,179 @@
+import io
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from array import array
+from unittest import mock
+
+from congeries.src import connectivityfilter
+from congeries.src import KeyedUF
+from congeries.src import WeightedQuickUnionPathCompressionUF
+from congeries.src.connectivityfilter import connectivity_filter
+from congeries.src.connectivityfilter import filter_pairs
+from congeries.src.connectivityfilter import main
+from congeries.src.connectivityfilter import read_pairs
+
+
+TINY = [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1), (8, 9), (5, 0), (7, 2), (6, 1), (1, 0), (6, 7)]
+TINY_KEPT = [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1), (5, 0), (7, 2), (6, 1)]
+
+
+def text_pairs(data: bytes) -> list:
+    values = list(map(int, data.split()))
+    return list(zip(values[0::2], values[1::2]))
+
+
+class TestConnectivityFilter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, name, data: bytes) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def tiny(self, header=True) -> str:
+        lines = (['10'] if header else []) + [f'{p} {q}' for p, q in TINY]
+        return self.write('tinyUF.txt', ('\n'.join(lines) + '\n').encode())
+
+    def test_header(self):
+        out = io.BytesIO()
+        self.assertEqual(connectivity_filter(self.tiny(), out, header=True), (11, 8))
+        self.assertEqual(text_pairs(out.getvalue()), TINY_KEPT)
+        self.assertEqual(out.getvalue().splitlines()[0], b'4 3')
+
+    def test_sites(self):
+        out = io.BytesIO()
+        connectivity_filter(self.tiny(header=False), out, n=10)
+        self.assertEqual(text_pairs(out.getvalue()), TINY_KEPT)
+        with self.assertRaisesRegex(ValueError, r'site 9 out of range \[0, 5\)'):
+            connectivity_filter(self.tiny(header=False), io.BytesIO(), n=5)
+
+    def test_sites_out_of_range(self):
+        path = self.write('negative.txt', b'0 1\n1 2\n2 -1\n')
+        with self.assertRaisesRegex(ValueError, r'site -1 out of range \[0, 3\) .* between bytes 0 and 13'):
+            connectivity_filter(path, io.BytesIO(), n=3)
+        out = io.BytesIO()
+        path = self.write('large.txt', b'0 1\n1 2\n2 3\n')
+        with self.assertRaisesRegex(ValueError, r'site 3 out of range \[0, 3\) .* between bytes 8 and 12'):
+            connectivity_filter(path, out, n=3, chunk_bytes=4)
+        self.assertEqual(text_pairs(out.getvalue()), [(0, 1), (1, 2)])
+        path = self.write('negative.i4', array('i', [0, 1, -2, 1]).tobytes())
+        with self.assertRaisesRegex(ValueError, r'site -2 out of range \[0, 3\)'):
+            connectivity_filter(path, io.BytesIO(), n=3, dtype='i4')
+
+    def test_keyed(self):
+        out = io.BytesIO()
+        self.assertEqual(connectivity_filter(self.tiny(header=False), out), (11, 8))
+        self.assertEqual(text_pairs(out.getvalue()), TINY_KEPT)
+
+    def test_chunks_match_sequential(self):
+        rng = random.Random(44)
+        n = 200
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(500)]
+        uf, expected = WeightedQuickUnionPathCompressionUF(n), []
+        for p, q in pairs:
+            if not uf.connected(p, q):
+                uf.union(p, q)
+                expected.append((p, q))
+        path = self.write('random.txt', ''.join(f'{p}  {q}\r\n' for p, q in pairs).encode())
+        for chunk_bytes in (1, 5, 64, 1 << 20):
+            out = io.BytesIO()
+            self.assertEqual(connectivity_filter(path, out, n=n, chunk_bytes=chunk_bytes), (500, len(expected)))
+            self.assertEqual(text_pairs(out.getvalue()), expected)
+
+    def test_binary(self):
+        for dtype, typecode in (('i4', 'i'), ('i8', 'q')):
+            pairs = array(typecode, [site for pair in TINY for site in pair])
+            path = self.write(f'tiny.{dtype}', pairs.tobytes())
+            for chunk_bytes in (1, 24, 1 << 20):
+                out = io.BytesIO()
+                self.assertEqual(connectivity_filter(path, out, n=10, dtype=dtype, chunk_bytes=chunk_bytes), (11, 8))
+                kept = array(typecode, out.getvalue())
+                self.assertEqual(list(zip(kept[0::2], kept[1::2])), TINY_KEPT)
+
+    def test_read_pairs(self):
+        chunks = list(read_pairs(self.tiny(header=False), chunk_bytes=10))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual([pair for ps, qs, _ in chunks for pair in zip(ps, qs)], TINY)
+        self.assertEqual(chunks[-1][2], os.path.getsize(self.tiny(header=False)))
+
+    def test_parse_without_numpy(self):
+        with mock.patch.object(connectivityfilter, 'np', None):
+            chunks = list(read_pairs(self.tiny(header=False), chunk_bytes=16))
+        self.assertEqual([pair for ps, qs, _ in chunks for pair in zip(ps, qs)], TINY)
+
+    def test_filter_pairs_keyed(self):
+        uf = KeyedUF()
+        self.assertEqual(filter_pairs(uf, [1, 2, 1, 3], [2, 1, 1, 1]), ([1, 3], [2, 1]))
+        self.assertEqual(filter_pairs(uf, [4, 2, 5], [3, 4, 5]), ([4], [3]))
+        self.assertEqual(uf.components_count, 2)
+
+    def test_empty(self):
+        out = io.BytesIO()
+        self.assertEqual(connectivity_filter(self.write('empty.txt', b''), out, n=3), (0, 0))
+        self.assertEqual(out.getvalue(), b'')
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            connectivity_filter(self.write('bad.txt', b'1 2\n3 x\n'), io.BytesIO(), n=5)
+        with self.assertRaises(ValueError):
+            connectivity_filter(self.write('odd.txt', b'1 2\n3\n'), io.BytesIO(), n=5)
+        with self.assertRaises(ValueError):
+            connectivity_filter(self.write('odd.i4', b'\0' * 12), io.BytesIO(), n=5, dtype='i4')
+        with self.assertRaises(ValueError):
+            connectivity_filter(self.tiny(), io.BytesIO(), dtype='i2')
+        with self.assertRaises(ValueError):
+            list(read_pairs(self.tiny(), chunk_bytes=0))
+
+    def test_progress(self):
+        progress = io.StringIO()
+        connectivity_filter(self.tiny(), io.BytesIO(), header=True, chunk_bytes=8, progress=progress, interval=0)
+        lines = progress.getvalue().split('\r')
+        self.assertGreater(len(lines), 2)
+        self.assertTrue(lines[-1].startswith('100.0%  11 pairs read, 8 kept'))
+        self.assertIn('pairs/s', lines[-1])
+        self.assertIn('MiB/s', lines[-1])
+
+    def test_main(self):
+        output = os.path.join(self.directory.name, 'kept.txt')
+        with mock.patch('sys.stderr', io.StringIO()) as stderr:
+            self.assertEqual(main([self.tiny(), '--header', '-o', output]), 0)
+        self.assertIn('8 kept', stderr.getvalue())
+        with open(output, 'rb') as f:
+            self.assertEqual(text_pairs(f.read()), TINY_KEPT)
+        with mock.patch('sys.stderr', io.StringIO()) as stderr:
+            self.assertEqual(main([self.tiny(), '-n', '3', '-q', '-o', output]), 1)
+        self.assertIn('error', stderr.getvalue())
+
+    def test_main_keeps_output_on_invalid_input(self):
+        output = self.write('kept.txt', b'0 1\n')
+        for argv in (['missing.txt'], [self.tiny(), '--dtype', 'i4'], [self.tiny(header=False), '-n', '5']):
+            with self.subTest(argv=argv), mock.patch('sys.stderr', io.StringIO()):
+                self.assertEqual(main(argv + ['-q', '-o', output]), 1)
+                with open(output, 'rb') as f:
+                    self.assertEqual(f.read(), b'0 1\n')
+        empty = self.write('empty.txt', b'')
+        self.assertEqual(main([empty, '-n', '3', '-q', '-o', output]), 0)
+        self.assertEqual(os.path.getsize(output), 0)
+
+    def test_run_module(self):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(connectivityfilter.__file__))))
+        result = subprocess.run([sys.executable, '-W', 'error::RuntimeWarning', '-m', 'congeries.src.connectivityfilter',
+                                 self.tiny(), '--header', '-q'], cwd=root, capture_output=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(text_pairs(result.stdout), TINY_KEPT)
+        with mock.patch('sys.stderr', io.StringIO()) as stderr:
+            self.assertEqual(main([self.tiny(header=False), '-n', '3', '-q'], prog='congeries-filter'), 1)
+        self.assertIn('congeries-filter: error: site 9 out of range', stderr.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import random
+import unittest
+
+from congeries.src import WeightedQuickUnionPathCompressionUF
+from congeries.src import offline_dynamic_connectivity
+
+
+def brute_force(n, operations):
+    """answers each query with a new union-find over the edges present"""
+    edges, answers = [], []
+    for operation in operations:
+        if operation[0] == 'add':
+            edges.append(tuple(operation[1:]))
+        elif operation[0] == 'remove':
+            p, q = operation[1:]
+            edges.remove((p, q) if (p, q) in edges else (q, p))
+        else:
+            uf = WeightedQuickUnionPathCompressionUF(n)
+            for p, q in edges:
+                uf.union(p, q)
+            answers.append(uf.components_count if operation[0] == 'count' else uf.connected(*operation[1:]))
+    return answers
+
+
+class TestOfflineDynamicConnectivity(unittest.TestCase):
+
+    def test_small(self):
+        operations = [('add', 0, 1), ('add', 1, 2), ('connected', 0, 2), ('count',),
+                      ('remove', 2, 1), ('connected', 0, 2), ('add', 2, 3), ('add', 0, 3),
+                      ('connected', 0, 2), ('count',)]
+        self.assertEqual(offline_dynamic_connectivity(4, operations), [True, 2, False, True, 1])
+
+    def test_multigraph(self):
+        operations = [('add', 0, 1), ('add', 1, 0), ('remove', 0, 1), ('connected', 0, 1),
+                      ('remove', 0, 1), ('connected', 0, 1)]
+        self.assertEqual(offline_dynamic_connectivity(2, operations), [True, False])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(45)
+        for n in (1, 5, 30):
+            edges, operations = [], []
+            for _ in range(400):
+                roll = rng.random()
+                if edges and roll < 0.3:
+                    p, q = edges.pop(rng.randrange(len(edges)))
+                    operations.append(('remove', q, p) if rng.random() < 0.5 else ('remove', p, q))
+                elif roll < 0.6:
+                    edges.append((rng.randrange(n), rng.randrange(n)))
+                    operations.append(('add', *edges[-1]))
+                elif roll < 0.9:
+                    operations.append(('connected', rng.randrange(n), rng.randrange(n)))
+                else:
+                    operations.append(('count',))
+            self.assertEqual(offline_dynamic_connectivity(n, operations), brute_force(n, operations))
+
+    def test_no_queries(self):
+        self.assertEqual(offline_dynamic_connectivity(3, [('add', 0, 1), ('remove', 0, 1)]), [])
+        self.assertEqual(offline_dynamic_connectivity(3, []), [])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            offline_dynamic_connectivity(3, [('add', 0, 1), ('remove', 0, 2)])
+        with self.assertRaises(ValueError):
+            offline_dynamic_connectivity(3, [('union', 0, 1)])
+        with self.assertRaises(IndexError):
+            offline_dynamic_connectivity(3, [('add', 0, 3)])
+        for query in (('connected', -1, 0), ('connected', 0, 3), ('add', -1, 2)):
+            with self.subTest(query=query), self.assertRaises(IndexError):
+                offline_dynamic_connectivity(3, [('add', 0, 2), query, ('count',)])
+
+
+if __name__ == '__main__':
+    unittest.main()
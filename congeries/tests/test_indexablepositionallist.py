@@ -0,0 +1,162 @@
+import random
+import unittest
+
+from congeries.src import IndexablePositionalList
+from congeries.src import PositionalList
+
+
+class TestIndexablePositionalList(unittest.TestCase):
+
+    def assertLanesConsistent(self, ipl):
+        ranks, node, rank = {}, ipl._header, 0
+        while node is not None:
+            ranks[id(node)] = rank
+            node, rank = node.suiv, rank + 1
+        node = ipl._header
+        while node is not ipl._trailer:
+            for lane, succ in enumerate(node.lanes_suiv):
+                self.assertIs(succ.lanes_prev[lane], node)
+                self.assertEqual(node.lanes_width[lane], ranks[id(succ)] - ranks[id(node)])
+            node = node.suiv
+
+    def test_type(self):
+        ipl = IndexablePositionalList()
+        self.assertIsInstance(ipl, PositionalList)
+
+    def test_from_iterable(self):
+        expected = IndexablePositionalList.from_iterable('abcde')
+        ipl = IndexablePositionalList()
+        for elt in 'abcde':
+            ipl.add_last(elt)
+        self.assertEqual(ipl, expected)
+
+    def test_at(self):
+        ipl = IndexablePositionalList.from_iterable(range(100))
+        for idx in range(100):
+            self.assertEqual(ipl.at(idx).payload(), idx)
+
+    def test_at_negative(self):
+        ipl = IndexablePositionalList.from_iterable('abc')
+        self.assertEqual(ipl.at(-1), ipl.last())
+        self.assertEqual(ipl.at(-3), ipl.first())
+
+    def test_at_out_of_range(self):
+        ipl = IndexablePositionalList.from_iterable('abc')
+        with self.assertRaises(IndexError):
+            ipl.at(3)
+        with self.assertRaises(IndexError):
+            ipl.at(-4)
+        with self.assertRaises(IndexError):
+            IndexablePositionalList().at(0)
+
+    def test_at_type_error(self):
+        ipl = IndexablePositionalList.from_iterable('abc')
+        with self.assertRaises(TypeError):
+            ipl.at('a')
+
+    def test_index(self):
+        ipl = IndexablePositionalList.from_iterable(range(100))
+        pos = ipl.first()
+        for idx in range(100):
+            self.assertEqual(ipl.index(pos), idx)
+            pos = ipl.after(pos)
+
+    def test_index_deleted(self):
+        ipl = IndexablePositionalList.from_iterable('abc')
+        a = ipl.first()
+        ipl.delete(a)
+        with self.assertRaises(ValueError):
+            ipl.index(a)
+
+    def test_delete_at(self):
+        expected = IndexablePositionalList.from_iterable('ace')
+        ipl = IndexablePositionalList.from_iterable('abcde')
+        self.assertEqual(ipl.delete_at(1), 'b')
+        self.assertEqual(ipl.delete_at(-2), 'd')
+        self.assertEqual(ipl, expected)
+        self.assertEqual(len(ipl), 3)
+
+    def test_add_before_after_ranks(self):
+        ipl = IndexablePositionalList()
+        b = ipl.add_first('b')
+        a = ipl.add_before(b, 'a')
+        c = ipl.add_after(b, 'c')
+        self.assertEqual([ipl.index(a), ipl.index(b), ipl.index(c)], [0, 1, 2])
+
+    def test_sort_keeps_ranks(self):
+        ipl = IndexablePositionalList.from_iterable([4, 3, 8, 0, 1, 9, 7, 2, 6, 5])
+        ipl.sort()
+        self.assertEqual([ipl.at(idx).payload() for idx in range(10)], list(range(10)))
+
+    def test_random_operations(self):
+        rng = random.Random(42)
+        ipl, model = IndexablePositionalList(), []
+        for step in range(2000):
+            if not model or rng.random() < 0.6:
+                if not model:
+                    model.append(ipl.add_first(step))
+                else:
+                    idx = rng.randrange(len(model))
+                    model.insert(idx + 1, ipl.add_after(model[idx], step))
+            elif rng.random() < 0.3:
+                pos = model.pop(rng.randrange(len(model)))
+                if not model:
+                    model.append(ipl.move_to_back(pos))
+                else:
+                    target = model[rng.randrange(len(model))]
+                    ipl.move_before(pos, target)
+                    model.insert(model.index(target), pos)
+            elif rng.random() < 0.5:
+                ipl.delete(model.pop(rng.randrange(len(model))))
+            else:
+                idx = rng.randrange(len(model))
+                model.pop(idx)
+                ipl.delete_at(idx)
+        self.assertEqual([ipl.index(pos) for pos in model], list(range(len(model))))
+        self.assertEqual([ipl.at(idx) for idx in range(len(model))], model)
+        self.assertLanesConsistent(ipl)
+
+    def test_add_many_after_ranks(self):
+        ipl = IndexablePositionalList.from_iterable(range(10))
+        positions = list(ipl.add_many_after(ipl.at(4), range(100, 200)))
+        self.assertEqual(len(ipl), 110)
+        self.assertEqual([ipl.index(pos) for pos in positions], list(range(5, 105)))
+        self.assertEqual(ipl.at(105).payload(), 5)
+        self.assertEqual(ipl.at(-1).payload(), 9)
+
+    def test_move_ranks(self):
+        ipl = IndexablePositionalList.from_iterable(range(50))
+        pos = ipl.at(10)
+        ipl.move_to_back(pos)
+        self.assertEqual(ipl.index(pos), 49)
+        ipl.move_to_front(pos)
+        self.assertEqual(ipl.index(pos), 0)
+        ipl.move_after(pos, ipl.at(20))
+        self.assertEqual(ipl.index(pos), 20)
+        self.assertEqual([ipl.at(idx).payload() for idx in range(50)],
+                         list(range(10)) + list(range(11, 21)) + [10] + list(range(21, 50)))
+        self.assertLanesConsistent(ipl)
+
+    def test_merge_all_ranks(self):
+        ipl = IndexablePositionalList.from_iterable(range(0, 300, 3))
+        others = [IndexablePositionalList.from_iterable(range(start, 300, 3)) for start in (1, 2)]
+        ipl.merge_all(others)
+        self.assertEqual([ipl.at(idx).payload() for idx in range(300)], list(range(300)))
+        self.assertEqual(ipl.index(ipl.last()), 299)
+        self.assertLanesConsistent(ipl)
+        for other in others:
+            self.assertLanesConsistent(other)
+            other.add_last('x')
+            self.assertEqual(other.index(other.last()), 0)
+        ipl.add_many_after(ipl.at(10), range(5))
+        self.assertLanesConsistent(ipl)
+
+    def test_delete_range_ranks(self):
+        ipl = IndexablePositionalList.from_iterable(range(200))
+        self.assertEqual(ipl.delete_range(ipl.at(10), ipl.at(189)), list(range(10, 190)))
+        self.assertEqual([ipl.at(idx).payload() for idx in range(20)], list(range(10)) + list(range(190, 200)))
+        self.assertEqual(ipl.index(ipl.last()), 19)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import os
+import random
+import tempfile
+import unittest
+
+from array import array
+from unittest import mock
+
+from congeries.src import QuickFindUF
+from congeries.src import minimum_spanning_forest
+from congeries.src import single_linkage
+from congeries.src import streaming_minimum_spanning_forest
+from congeries.src import kruskal
+from congeries.src.kruskal import sorted_edges
+from congeries.src.numpyunionfind import np
+
+
+# tinyEWG.txt, from Algorithms, 4th edition
+TINY = [(4, 5, .35), (4, 7, .37), (5, 7, .28), (0, 7, .16), (1, 5, .32), (0, 4, .38), (2, 3, .17), (1, 7, .19),
+        (0, 2, .26), (1, 2, .36), (1, 3, .29), (2, 7, .34), (6, 2, .40), (3, 6, .52), (6, 0, .58), (6, 4, .93)]
+TINY_MST = [(0, 7, .16), (2, 3, .17), (1, 7, .19), (0, 2, .26), (5, 7, .28), (4, 5, .35), (6, 2, .40)]
+
+
+def prim_weight(n, edges):
+    """the weight of a minimum spanning forest, with an O(n^2) Prim from every unreached site"""
+    inf = float('inf')
+    cost = [[inf] * n for _ in range(n)]
+    for p, q, weight in edges:
+        cost[p][q] = cost[q][p] = min(cost[p][q], weight)
+    reached, total = [False] * n, 0
+    for source in range(n):
+        if reached[source]:
+            continue
+        best = [inf] * n
+        best[source] = 0
+        while True:
+            site = min((s for s in range(n) if not reached[s] and best[s] < inf), key=best.__getitem__, default=None)
+            if site is None:
+                break
+            reached[site] = True
+            total += best[site]
+            for other in range(n):
+                if not reached[other] and cost[site][other] < best[other]:
+                    best[other] = cost[site][other]
+    return total
+
+
+def random_graph(seed, n, m):
+    rng = random.Random(seed)
+    return [(rng.randrange(n), rng.randrange(n), rng.randrange(1000)) for _ in range(m)]
+
+
+class TestMinimumSpanningForest(unittest.TestCase):
+
+    def test_tiny(self):
+        forest, total = minimum_spanning_forest(8, *zip(*TINY))
+        self.assertEqual(forest, TINY_MST)
+        self.assertAlmostEqual(total, 1.81)
+
+    def test_arrays(self):
+        p, q, weights = zip(*TINY)
+        for arrays in ((array('q', p), array('q', q), array('d', weights)),
+                       (list(p), list(q), list(weights))):
+            self.assertEqual(minimum_spanning_forest(8, *arrays)[0], TINY_MST)
+
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_ndarrays(self):
+        p, q, weights = (np.array(values) for values in zip(*TINY))
+        forest, total = minimum_spanning_forest(8, p, q, weights)
+        self.assertEqual(forest, TINY_MST)
+        self.assertIsInstance(forest[0][0], int)
+
+    def test_without_numpy(self):
+        with mock.patch.object(kruskal, 'np', None):
+            self.assertEqual(minimum_spanning_forest(8, *zip(*TINY))[0], TINY_MST)
+
+    def test_matches_prim(self):
+        for seed, (n, m) in enumerate([(1, 3), (10, 5), (30, 60), (50, 400)]):
+            edges = random_graph(seed, n, m)
+            forest, total = minimum_spanning_forest(n, *zip(*edges)) if edges else ([], 0)
+            self.assertEqual(total, prim_weight(n, edges))
+            self.assertEqual(sum(weight for _, _, weight in forest), total)
+            weights = [weight for _, _, weight in forest]
+            self.assertEqual(weights, sorted(weights))
+
+    def test_forest(self):
+        # two components, and a self-loop
+        forest, total = minimum_spanning_forest(5, [0, 1, 3, 2], [1, 2, 4, 2], [3, 1, 2, 0])
+        self.assertEqual(forest, [(1, 2, 1), (3, 4, 2), (0, 1, 3)])
+        self.assertEqual(total, 6)
+
+    def test_stop_at_k(self):
+        forest, total = minimum_spanning_forest(8, *zip(*TINY), k=3)
+        self.assertEqual(forest, TINY_MST[:5])
+        self.assertEqual(minimum_spanning_forest(8, *zip(*TINY), k=8), ([], 0))
+
+    def test_uf_class(self):
+        self.assertEqual(minimum_spanning_forest(8, *zip(*TINY), uf_class=QuickFindUF)[0], TINY_MST)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            minimum_spanning_forest(3, [0, 1], [1], [1, 2])
+        with self.assertRaises(IndexError):
+            minimum_spanning_forest(3, [0], [3], [1])
+
+    def test_negative_sites(self):
+        # -1 would wrap around to site 2, and join it to the forest with the lightest edge
+        with self.assertRaisesRegex(IndexError, r'\(0, -1\)'):
+            minimum_spanning_forest(3, [0, 0], [1, -1], [2, 1])
+        with self.assertRaises(IndexError):
+            minimum_spanning_forest(3, array('q', [0, -2]), array('q', [1, 2]), array('d', [1, 2]), k=2)
+
+
+class TestSingleLinkage(unittest.TestCase):
+
+    def test_points_on_a_line(self):
+        points = [0, 1, 2, 10, 11, 20, 21, 22, 23]
+        pairs = [(i, j) for i in range(len(points)) for j in range(i + 1, len(points))]
+        p, q = zip(*pairs)
+        distances = [abs(points[i] - points[j]) for i, j in pairs]
+        clusters = single_linkage(len(points), p, q, distances, k=3)
+        self.assertEqual(sorted(sorted(cluster) for cluster in clusters), [[0, 1, 2], [3, 4], [5, 6, 7, 8]])
+        self.assertEqual(len(single_linkage(len(points), p, q, distances, k=1)), 1)
+        self.assertEqual(len(single_linkage(len(points), p, q, distances, k=len(points))), len(points))
+
+    def test_not_enough_edges(self):
+        self.assertEqual(sorted(single_linkage(4, [0], [1], [5], k=2)), [[0, 1], [2], [3]])
+        with self.assertRaises(ValueError):
+            single_linkage(4, [0], [1], [5], k=0)
+        with self.assertRaises(IndexError):
+            single_linkage(4, [0, -1], [1, 2], [5, 1], k=2)
+
+
+class TestStreamingMinimumSpanningForest(unittest.TestCase):
+
+    def test_matches_in_memory(self):
+        n = 60
+        edges = random_graph(49, n, 700)
+        expected = minimum_spanning_forest(n, *zip(*edges))
+        for chunk_size in (1, 7, 100, 700, 10_000):
+            self.assertEqual(streaming_minimum_spanning_forest(n, iter(edges), chunk_size=chunk_size), expected)
+
+    def test_sorted_edges(self):
+        edges = random_graph(50, 20, 300)
+        with tempfile.TemporaryDirectory() as directory:
+            for chunk_size in (1, 16, 299, 300, 301):
+                self.assertEqual(list(sorted_edges(edges, chunk_size, directory)), sorted(edges, key=lambda e: e[2]))
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_runs_are_removed_when_stopped_early(self):
+        with tempfile.TemporaryDirectory() as directory:
+            forest, _ = streaming_minimum_spanning_forest(8, TINY, k=4, chunk_size=3, directory=directory)
+            self.assertEqual(forest, TINY_MST[:4])
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_blocks(self):
+        edges = random_graph(51, 20, 50)
+        with mock.patch.object(kruskal, '_BLOCK', 4):
+            self.assertEqual(list(sorted_edges(edges, 10)), sorted(edges, key=lambda e: e[2]))
+
+    def test_sites_out_of_range(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for edges in (TINY + [(-1, 0, .01)], TINY + [(8, 0, .99)]):
+                for chunk_size in (3, 100):
+                    with self.subTest(edges=edges[-1], chunk_size=chunk_size), self.assertRaises(IndexError):
+                        streaming_minimum_spanning_forest(8, iter(edges), chunk_size=chunk_size, directory=directory)
+            self.assertEqual(os.listdir(directory), [])
+
+    def test_empty(self):
+        self.assertEqual(streaming_minimum_spanning_forest(3, []), ([], 0))
+        with self.assertRaises(ValueError):
+            list(sorted_edges([], chunk_size=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
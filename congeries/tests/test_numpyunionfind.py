@@ -0,0 +1,163 @@
+import json
+import math
+import os
+import random
+import tempfile
+import unittest
+
+from congeries.src import NumPyUF
+from congeries.src import WeightedQuickUnionPathCompressionUF
+from congeries.src.numpyunionfind import np
+
+
+def partition(find, n):
+    """the partition of range(n) induced by find, as a set of frozensets"""
+    components = {}
+    for site in range(n):
+        components.setdefault(int(find(site)), set()).add(site)
+    return {frozenset(component) for component in components.values()}
+
+
+@unittest.skipIf(np is None, 'requires numpy')
+class TestNumPyUF(unittest.TestCase):
+
+    def test_type(self):
+        self.assertIsInstance(NumPyUF(10), WeightedQuickUnionPathCompressionUF)
+
+    def test_arrays(self):
+        uf = NumPyUF(10)
+        self.assertEqual(uf.id.dtype, np.int32)
+        self.assertEqual(uf.id.tolist(), list(range(10)))
+        self.assertEqual(uf.sz.tolist(), [1] * 10)
+
+    def test_union_many(self):
+        uf = NumPyUF(10)
+        uf.union_many([4, 3, 6, 9, 2, 8, 5, 7, 6, 1, 6], [3, 8, 5, 4, 1, 9, 0, 2, 1, 0, 7])
+        self.assertEqual(uf.components_count, 2)
+        self.assertEqual(uf.connected_many([0, 3, 0], [7, 9, 9]).tolist(), [True, True, False])
+        roots = uf.find_many(range(10))
+        self.assertEqual(sorted(uf.sz[np.unique(roots)].tolist()), [4, 6])
+
+    def test_matches_weighted_quick_union(self):
+        rng = random.Random(40)
+        n = 500
+        uf, reference = NumPyUF(n), WeightedQuickUnionPathCompressionUF(n)
+        for _ in range(5):
+            p = [rng.randrange(n) for _ in range(150)]
+            q = [rng.randrange(n) for _ in range(150)]
+            uf.union_many(p, q)
+            for p_site, q_site in zip(p, q):
+                reference.union(p_site, q_site)
+            self.assertEqual(uf.components_count, reference.components_count)
+            self.assertEqual(partition(lambda site: uf.find_many([site])[0], n),
+                             partition(reference._find, n))
+
+    def test_sizes(self):
+        rng = random.Random(40)
+        n = 300
+        uf = NumPyUF(n)
+        uf.union_many([rng.randrange(n) for _ in range(200)], [rng.randrange(n) for _ in range(200)])
+        roots = uf.find_many(np.arange(n))
+        counts = np.bincount(roots, minlength=n)
+        self.assertTrue(np.array_equal(uf.sz[np.unique(roots)], counts[np.unique(roots)]))
+
+    def test_path_graph(self):
+        n = 1000
+        uf = NumPyUF(n)
+        uf.union_many(np.arange(n - 1), np.arange(1, n))
+        self.assertEqual(uf.components_count, 1)
+        self.assertLessEqual(uf.max_depth(), int(math.log2(n)))
+
+    def test_depth_is_logarithmic(self):
+        rng = np.random.default_rng(40)
+        n = 1 << 12
+        uf = NumPyUF(n)
+        for _ in range(8):
+            uf.union_many(rng.integers(n, size=n // 4), rng.integers(n, size=n // 4))
+        self.assertLessEqual(uf.max_depth(), int(math.log2(n)))
+        self.assertLessEqual(uf.average_path_length(), uf.max_depth())
+
+    def test_membership(self):
+        rng = random.Random(42)
+        n = 400
+        uf, reference = NumPyUF(n), WeightedQuickUnionPathCompressionUF(n)
+        for _ in range(4):
+            p = [rng.randrange(n) for _ in range(120)]
+            q = [rng.randrange(n) for _ in range(120)]
+            uf.union_many(p, q)
+            for p_site, q_site in zip(p, q):
+                reference.union(p_site, q_site)
+            self.assertEqual({frozenset(members) for members in uf.components()},
+                             {frozenset(members) for members in reference.components()})
+            for site in range(0, n, 7):
+                self.assertEqual(sorted(uf.members(site)), sorted(reference.members(site)))
+                self.assertEqual(uf.size(site), reference.size(site))
+
+    def test_scalar_membership(self):
+        uf = NumPyUF(5)
+        uf.union(0, 1)
+        uf.union_many([1, 3], [2, 4])
+        self.assertEqual(sorted(uf.members(2)), [0, 1, 2])
+        self.assertEqual(uf.size(4), 2)
+        self.assertEqual(sorted(sorted(members) for members in uf.components()), [[0, 1, 2], [3, 4]])
+
+    def test_scalar_operations(self):
+        uf = NumPyUF(10)
+        uf.union(1, 2)
+        uf.union_many([2], [3])
+        self.assertTrue(uf.connected(1, 3))
+        self.assertFalse(uf.connected(1, 4))
+        self.assertEqual(uf.components_count, 8)
+
+    def test_scalar_results_are_python_types(self):
+        uf = NumPyUF(10)
+        uf.union(1, 2)
+        uf.union_many([2, 5], [3, 6])
+        self.assertIs(uf.connected(1, 3), True)
+        self.assertIs(uf.connected(np.int64(1), 4), False)
+        self.assertIs(type(uf.size(3)), int)
+        self.assertIs(type(uf._find(np.int32(3))), int)
+        self.assertEqual(json.dumps([uf.size(1), uf._find(6), uf.connected(5, 6)]), f'[3, {uf._find(5)}, true]')
+
+    def test_empty_batches(self):
+        uf = NumPyUF(5)
+        uf.union_many([], [])
+        self.assertEqual(uf.find_many([]).tolist(), [])
+        self.assertEqual(uf.components_count, 5)
+
+    def test_save_load(self):
+        rng = random.Random(46)
+        n = 300
+        uf = NumPyUF(n)
+        uf.union_many([rng.randrange(n) for _ in range(200)], [rng.randrange(n) for _ in range(200)])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'uf.bin')
+            uf.save(path)
+            for mmap in (True, False):
+                loaded = NumPyUF.load(path, mmap=mmap)
+                self.assertEqual(loaded.id.dtype, np.int32)
+                self.assertTrue(np.array_equal(loaded.id, uf.id))
+                self.assertTrue(np.array_equal(loaded.ring, uf.ring))
+                self.assertEqual(loaded.components_count, uf.components_count)
+                loaded.union_many([0], [1])
+                del loaded
+            reference = WeightedQuickUnionPathCompressionUF.load(path)
+            self.assertEqual({frozenset(members) for members in reference.components()},
+                             {frozenset(members) for members in uf.components()})
+            reference.save(path)
+            self.assertTrue(np.array_equal(NumPyUF.load(path).sz, uf.sz))
+
+    def test_errors(self):
+        uf = NumPyUF(5)
+        with self.assertRaises(IndexError):
+            uf.union_many([0], [5])
+        with self.assertRaises(IndexError):
+            uf.find_many([-1])
+        with self.assertRaises(ValueError):
+            uf.union_many([0, 1], [2])
+        with self.assertRaises(TypeError):
+            uf.instrument()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+
+from array import array
+from unittest import mock
+
+from congeries.src import NumPyUF
+from congeries.src import QuickUnionUF
+from congeries.src import WeightedQuickUnionPathCompressionUF
+from congeries.src import parallel_union_find
+from congeries.src import parallelunionfind
+from congeries.src.numpyunionfind import np
+
+
+def partition(uf):
+    return {frozenset(members) for members in uf.components()}
+
+
+class TestParallelUnionFind(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(43)
+        self.n = 300
+        self.edges = [(rng.randrange(self.n), rng.randrange(self.n)) for _ in range(250)]
+        self.sequential = WeightedQuickUnionPathCompressionUF(self.n)
+        for p, q in self.edges:
+            self.sequential.union(p, q)
+
+    def test_matches_sequential(self):
+        for chunk_size in (1, 7, 64, 1000):
+            uf = parallel_union_find(self.n, self.edges, workers=2, chunk_size=chunk_size)
+            self.assertIsInstance(uf, WeightedQuickUnionPathCompressionUF)
+            self.assertEqual(uf.components_count, self.sequential.components_count)
+            self.assertEqual(partition(uf), partition(self.sequential))
+
+    def test_stream(self):
+        uf = parallel_union_find(self.n, iter(self.edges), workers=1, chunk_size=50)
+        self.assertEqual(partition(uf), partition(self.sequential))
+
+    def test_uf_class(self):
+        uf = parallel_union_find(self.n, self.edges, workers=2, chunk_size=40, uf_class=QuickUnionUF)
+        self.assertIsInstance(uf, QuickUnionUF)
+        self.assertEqual(partition(uf), partition(self.sequential))
+
+    @unittest.skipIf(np is None, 'requires numpy')
+    def test_numpy_uf_class(self):
+        uf = parallel_union_find(self.n, self.edges, workers=2, chunk_size=40, uf_class=NumPyUF)
+        self.assertEqual(partition(uf), partition(self.sequential))
+
+    def test_forest_without_numpy(self):
+        ps, qs = array('q', [p for p, _ in self.edges]), array('q', [q for _, q in self.edges])
+        with mock.patch.object(parallelunionfind, 'np', None):
+            sites, roots = parallelunionfind._chunk_forest(ps, qs)
+        uf = WeightedQuickUnionPathCompressionUF(self.n)
+        for site, root in zip(sites, roots):
+            uf.union(site, root)
+        self.assertEqual(len(sites), self.n - self.sequential.components_count)
+        self.assertEqual(partition(uf), partition(self.sequential))
+
+    def test_no_edges(self):
+        uf = parallel_union_find(5, [], workers=2)
+        self.assertEqual(uf.components_count, 5)
+
+    def test_sites_out_of_range(self):
+        for edges in ([(0, 1), (2, -1)], [(0, 1), (1, 2), (5, 3)]):
+            with self.subTest(edges=edges), self.assertRaisesRegex(IndexError, rf'\({edges[-1][0]}, {edges[-1][1]}\)'):
+                parallel_union_find(5, edges, workers=1, chunk_size=2)
+
+    def test_chunk_size(self):
+        with self.assertRaises(ValueError):
+            parallel_union_find(5, [(0, 1)], chunk_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
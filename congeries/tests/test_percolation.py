@@ -0,0 +1,133 @@
+import io
+import math
+import os
+import subprocess
+import sys
+import unittest
+
+from unittest import mock
+
+from congeries.src import percolation
+from congeries.src import QuickFindUF
+from congeries.src import QuickUnionUF
+from congeries.src import WeightedQuickUnionUF
+from congeries.src import WeightedQuickUnionPathCompressionUF
+from congeries.src.percolation import Percolation
+from congeries.src.percolation import ThresholdEstimate
+from congeries.src.percolation import main
+from congeries.src.percolation import percolation_threshold
+from congeries.src.percolation import percolation_trial
+
+
+class TestPercolation(unittest.TestCase):
+
+    def test_single_site(self):
+        grid = Percolation(1)
+        self.assertFalse(grid.percolates())
+        grid.open(0, 0)
+        self.assertTrue(grid.percolates())
+        self.assertTrue(grid.is_full(0, 0))
+
+    def test_column(self):
+        grid = Percolation(3)
+        for row in range(3):
+            self.assertFalse(grid.percolates())
+            grid.open(row, 1)
+            self.assertTrue(grid.is_full(row, 1))
+        self.assertTrue(grid.percolates())
+        self.assertEqual(grid.open_count, 3)
+
+    def test_row_does_not_percolate(self):
+        grid = Percolation(3)
+        for col in range(3):
+            grid.open(1, col)
+        self.assertFalse(grid.percolates())
+        self.assertFalse(grid.is_full(1, 0))
+        self.assertTrue(grid.is_open(1, 2))
+        self.assertFalse(grid.is_open(0, 2))
+
+    def test_no_backwash(self):
+        grid = Percolation(3)
+        for row in range(3):
+            grid.open(row, 0)
+        grid.open(2, 2)
+        self.assertTrue(grid.percolates())
+        self.assertTrue(grid.uf.connected(grid._site(2, 2), grid.top))    # through the bottom site
+        self.assertFalse(grid.is_full(2, 2))
+
+    def test_open_twice(self):
+        grid = Percolation(4)
+        grid.open(2, 3)
+        grid.open(2, 3)
+        self.assertEqual(grid.open_count, 1)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            Percolation(0)
+        grid = Percolation(3, full=False)
+        for row, col in ((-1, 0), (3, 0), (0, 3)):
+            with self.assertRaises(IndexError):
+                grid.open(row, col)
+        with self.assertRaises(ValueError):
+            grid.is_full(0, 0)
+
+
+class TestPercolationThreshold(unittest.TestCase):
+
+    def test_trial(self):
+        threshold = percolation_trial(10, seed=50)
+        self.assertEqual(percolation_trial(10, seed=50), threshold)
+        self.assertTrue(0.1 <= threshold <= 1)
+        self.assertEqual(percolation_trial(1, seed=50), 1)
+
+    def test_classes_agree(self):
+        # the threshold depends on the order of the sites only
+        for seed in range(5):
+            thresholds = {percolation_trial(8, seed, cls) for cls in
+                          (QuickFindUF, QuickUnionUF, WeightedQuickUnionUF, WeightedQuickUnionPathCompressionUF)}
+            self.assertEqual(len(thresholds), 1)
+
+    def test_estimate(self):
+        estimate = percolation_threshold(20, 40, workers=1, seed=50)
+        self.assertEqual(len(estimate.thresholds), 40)
+        self.assertTrue(0.5 < estimate.mean < 0.7)
+        low, high = estimate.confidence
+        self.assertTrue(low < estimate.mean < high)
+        self.assertAlmostEqual(high - estimate.mean, 1.96 * estimate.stddev / math.sqrt(40))
+
+    def test_pool_is_reproducible(self):
+        sequential = percolation_threshold(8, 12, workers=1, seed=51)
+        pooled = percolation_threshold(8, 12, workers=2, seed=51)
+        self.assertEqual(pooled.thresholds, sequential.thresholds)
+        self.assertNotEqual(percolation_threshold(8, 12, workers=1, seed=52).thresholds, sequential.thresholds)
+
+    def test_single_trial(self):
+        estimate = ThresholdEstimate(5, [0.6])
+        self.assertEqual(estimate.mean, 0.6)
+        self.assertTrue(math.isnan(estimate.stddev))
+        with self.assertRaises(ValueError):
+            percolation_threshold(5, 0)
+
+    def test_main(self):
+        with mock.patch('sys.stdout', io.StringIO()) as stdout:
+            self.assertEqual(main(['8', '12', '1', '--seed', '51']), 0)
+        mean = percolation_threshold(8, 12, workers=1, seed=51).mean
+        self.assertIn(f'mean                    = {mean}', stdout.getvalue())
+        self.assertIn('95% confidence interval = [', stdout.getvalue())
+        for argv in (['8'], ['8', 'x'], ['8', '0'], ['0', '12'], ['8', '12', '0']):
+            with self.subTest(argv=argv), mock.patch('sys.stderr', io.StringIO()) as stderr:
+                with self.assertRaises(SystemExit) as context:
+                    main(argv, prog='percolation')
+                self.assertEqual(context.exception.code, 2)
+                self.assertIn('percolation: error:', stderr.getvalue())
+
+    def test_run_module(self):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(percolation.__file__))))
+        result = subprocess.run([sys.executable, '-W', 'error::RuntimeWarning', '-m', 'congeries.src.percolation',
+                                 '8', '4', '1', '--seed', '51'], cwd=root, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertIn('mean', result.stdout)
+
+
+if __name__ == '__main__':
+    unittest.main()
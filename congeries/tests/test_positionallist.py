@@ -427,5 +427,370 @@ class TestPositionalList(unittest.TestCase):
         self.assertFalse(pl)
 
 
+class TestPositionalListInterning(unittest.TestCase):
+
+    def test_same_position_object(self):
+        pl = PositionalList.from_iterable('abc')
+        a = pl.first()
+        self.assertIs(pl.first(), a)
+        self.assertIs(pl.before(pl.after(a)), a)
+
+    def test_add_returns_interned_position(self):
+        pl = PositionalList()
+        a = pl.add_first('a')
+        b = pl.add_after(a, 'b')
+        self.assertIs(pl.first(), a)
+        self.assertIs(pl.last(), b)
+
+    def test_equality_unchanged(self):
+        pl = PositionalList.from_iterable('abc')
+        a = pl.first()
+        other = PositionalList.Position(pl, a.record)
+        self.assertEqual(a, other)
+        self.assertNotEqual(a, pl.last())
+
+    def test_deleted_position_invalid(self):
+        pl = PositionalList.from_iterable('abc')
+        b = pl.after(pl.first())
+        pl.delete(b)
+        with self.assertRaises(ValueError):
+            pl.after(b)
+
+
+class TestPositionalListOrder(unittest.TestCase):
+
+    def assertLabelsIncrease(self, pl):
+        labels = []
+        pos = pl.first()
+        while pos is not None:
+            labels.append(pos.record.label)
+            pos = pl.after(pos)
+        self.assertEqual(labels, sorted(set(labels)))
+
+    def test_precedes(self):
+        pl = PositionalList()
+        b = pl.add_first('b')
+        a = pl.add_before(b, 'a')
+        c = pl.add_after(b, 'c')
+        self.assertTrue(pl.precedes(a, b))
+        self.assertTrue(pl.precedes(a, c))
+        self.assertFalse(pl.precedes(c, b))
+        self.assertFalse(pl.precedes(b, b))
+
+    def test_comparison_operators(self):
+        pl = PositionalList.from_iterable('abc')
+        a, c = pl.first(), pl.last()
+        b = pl.after(a)
+        self.assertTrue(a < b < c)
+        self.assertTrue(c > b > a)
+        self.assertTrue(a <= a <= b)
+        self.assertTrue(c >= c >= b)
+        self.assertFalse(b < a)
+
+    def test_compare_other_container(self):
+        pl1 = PositionalList.from_iterable('ab')
+        pl2 = PositionalList.from_iterable('ab')
+        with self.assertRaises(ValueError):
+            pl1.first() < pl2.last()
+
+    def test_compare_deleted(self):
+        pl = PositionalList.from_iterable('abc')
+        a = pl.first()
+        pl.delete(a)
+        with self.assertRaises(ValueError):
+            a < pl.last()
+
+    def test_relabel_dense_inserts(self):
+        pl = PositionalList()
+        a = pl.add_first('a')
+        z = pl.add_last('z')
+        positions = [pl.add_after(a, idx) for idx in range(200)]
+        self.assertLabelsIncrease(pl)
+        self.assertTrue(a < positions[-1] < positions[0] < z)
+
+    def test_relabel_mixed_inserts(self):
+        pl = PositionalList.from_iterable(range(10))
+        pos = pl.after(pl.first())
+        for idx in range(300):
+            pos = pl.add_before(pos, idx) if idx % 3 else pl.add_after(pos, idx)
+        self.assertLabelsIncrease(pl)
+
+
+class TestPositionalListBulk(unittest.TestCase):
+
+    def test_add_many_after(self):
+        expected = PositionalList.from_iterable('abcdef')
+        pl = PositionalList.from_iterable('abf')
+        b = pl.after(pl.first())
+        positions = list(pl.add_many_after(b, 'cde'))
+        self.assertEqual(pl, expected)
+        self.assertEqual(len(pl), 6)
+        self.assertEqual([pos.payload() for pos in positions], list('cde'))
+        self.assertEqual(pl.after(b), positions[0])
+        self.assertEqual(pl.before(pl.last()), positions[-1])
+
+    def test_add_many_before(self):
+        expected = PositionalList.from_iterable('abcdef')
+        pl = PositionalList.from_iterable('def')
+        positions = list(pl.add_many_before(pl.first(), 'abc'))
+        self.assertEqual(pl, expected)
+        self.assertEqual(pl.first(), positions[0])
+        self.assertEqual(list(reversed(pl)), list('fedcba'))
+
+    def test_add_many_empty(self):
+        pl = PositionalList.from_iterable('ab')
+        self.assertEqual(list(pl.add_many_after(pl.first(), [])), [])
+        self.assertEqual(pl, PositionalList.from_iterable('ab'))
+
+    def test_add_many_is_eager(self):
+        pl = PositionalList.from_iterable('a')
+        pl.add_many_after(pl.first(), 'bc')
+        self.assertEqual(len(pl), 3)
+
+    def test_add_many_keeps_order(self):
+        pl = PositionalList.from_iterable('az')
+        a, z = pl.first(), pl.last()
+        positions = list(pl.add_many_after(a, range(500)))
+        self.assertTrue(a < positions[0] < positions[250] < positions[-1] < z)
+        more = list(pl.add_many_before(positions[1], range(100)))
+        self.assertTrue(positions[0] < more[0] < more[-1] < positions[1])
+
+    def test_add_many_from_itself(self):
+        expected = PositionalList.from_iterable('abab')
+        pl = PositionalList.from_iterable('ab')
+        pl.add_many_after(pl.last(), pl)
+        self.assertEqual(pl, expected)
+
+    def test_delete_range(self):
+        expected = PositionalList.from_iterable('af')
+        pl = PositionalList.from_iterable('abcdef')
+        b = pl.after(pl.first())
+        e = pl.before(pl.last())
+        self.assertEqual(pl.delete_range(b, e), list('bcde'))
+        self.assertEqual(pl, expected)
+        self.assertEqual(len(pl), 2)
+        with self.assertRaises(ValueError):
+            pl.after(b)
+
+    def test_delete_range_single(self):
+        pl = PositionalList.from_iterable('abc')
+        b = pl.after(pl.first())
+        self.assertEqual(pl.delete_range(b, b), ['b'])
+        self.assertEqual(pl, PositionalList.from_iterable('ac'))
+
+    def test_delete_range_all(self):
+        pl = PositionalList.from_iterable('abc')
+        self.assertEqual(pl.delete_range(pl.first(), pl.last()), list('abc'))
+        self.assertFalse(pl)
+        self.assertIsNone(pl.first())
+
+    def test_delete_range_reversed(self):
+        pl = PositionalList.from_iterable('abc')
+        with self.assertRaises(ValueError):
+            pl.delete_range(pl.last(), pl.first())
+
+
+class TestPositionalListMove(unittest.TestCase):
+
+    def test_move_to_front(self):
+        pl = PositionalList.from_iterable('abcd')
+        c = pl.before(pl.last())
+        self.assertIs(pl.move_to_front(c), c)
+        self.assertEqual(pl, PositionalList.from_iterable('cabd'))
+        self.assertIs(pl.first(), c)
+        self.assertEqual(c.payload(), 'c')
+
+    def test_move_to_back(self):
+        pl = PositionalList.from_iterable('abcd')
+        a = pl.first()
+        pl.move_to_back(a)
+        self.assertEqual(pl, PositionalList.from_iterable('bcda'))
+        self.assertIs(pl.last(), a)
+        self.assertEqual(list(reversed(pl)), list('adcb'))
+
+    def test_move_before(self):
+        pl = PositionalList.from_iterable('abcd')
+        a, d = pl.first(), pl.last()
+        pl.move_before(d, pl.after(a))
+        self.assertEqual(pl, PositionalList.from_iterable('adbc'))
+        self.assertTrue(a < d < pl.last())
+
+    def test_move_after(self):
+        pl = PositionalList.from_iterable('abcd')
+        a, d = pl.first(), pl.last()
+        pl.move_after(a, pl.before(d))
+        self.assertEqual(pl, PositionalList.from_iterable('bcad'))
+        self.assertTrue(pl.first() < a < d)
+
+    def test_move_in_place(self):
+        pl = PositionalList.from_iterable('abc')
+        a, b = pl.first(), pl.after(pl.first())
+        pl.move_to_front(a)
+        pl.move_after(b, a)
+        pl.move_before(a, b)
+        self.assertEqual(pl, PositionalList.from_iterable('abc'))
+        self.assertEqual(len(pl), 3)
+
+    def test_move_relative_to_itself(self):
+        pl = PositionalList.from_iterable('abc')
+        with self.assertRaises(ValueError):
+            pl.move_after(pl.first(), pl.first())
+
+    def test_move_keeps_positions_valid(self):
+        pl = PositionalList.from_iterable(range(10))
+        positions = []
+        pos = pl.first()
+        while pos is not None:
+            positions.append(pos)
+            pos = pl.after(pos)
+        for pos in positions[::2]:
+            pl.move_to_back(pos)
+        self.assertEqual(list(pl), [1, 3, 5, 7, 9, 0, 2, 4, 6, 8])
+        self.assertEqual([pos.payload() for pos in positions], list(range(10)))
+        self.assertTrue(positions[9] < positions[0])
+
+
+class TestPositionalListMerge(unittest.TestCase):
+
+    def test_merge(self):
+        expected = PositionalList.from_iterable([0, 1, 2, 3, 4, 5, 6, 8])
+        pl = PositionalList.from_iterable([0, 2, 4, 6, 8])
+        other = PositionalList.from_iterable([1, 3, 5])
+        pl.merge(other)
+        self.assertEqual(pl, expected)
+        self.assertEqual(len(pl), 8)
+        self.assertEqual(list(reversed(pl)), [8, 6, 5, 4, 3, 2, 1, 0])
+        self.assertFalse(other)
+        self.assertIsNone(other.first())
+
+    def test_merge_into_empty(self):
+        pl = PositionalList()
+        other = PositionalList.from_iterable('abc')
+        pl.merge(other)
+        self.assertEqual(pl, PositionalList.from_iterable('abc'))
+        self.assertFalse(other)
+
+    def test_merge_transfers_positions(self):
+        pl = PositionalList.from_iterable([0, 2])
+        other = PositionalList()
+        one = other.add_last(1)
+        three = other.add_last(3)
+        pl.merge(other)
+        self.assertIs(one.container, pl)
+        self.assertEqual(pl.after(one).payload(), 2)
+        self.assertEqual(pl.last(), three)
+        self.assertTrue(pl.first() < one < three)
+        with self.assertRaises(ValueError):
+            other.after(one)
+        other.add_last('x')
+        self.assertEqual(list(other), ['x'])
+
+    def test_merge_stable_with_key(self):
+        pl = PositionalList.from_iterable([(1, 'a'), (2, 'a')])
+        other = PositionalList.from_iterable([(1, 'b'), (2, 'b')])
+        pl.merge(other, key=lambda item: item[0])
+        self.assertEqual(list(pl), [(1, 'a'), (1, 'b'), (2, 'a'), (2, 'b')])
+
+    def test_merge_all(self):
+        pl = PositionalList.from_iterable([0, 5, 10])
+        others = [PositionalList.from_iterable(range(start, 12, 3)) for start in range(3)]
+        pl.merge_all(others)
+        self.assertEqual(list(pl), sorted([0, 5, 10] + list(range(12))))
+        self.assertTrue(all(not other for other in others))
+
+    def test_merge_all_descending_key(self):
+        pl = PositionalList.from_iterable([9, 4])
+        pl.merge_all([PositionalList.from_iterable([8, 1]), PositionalList()], key=lambda x: -x)
+        self.assertEqual(list(pl), [9, 8, 4, 1])
+
+    def test_merge_self(self):
+        pl = PositionalList.from_iterable('abc')
+        with self.assertRaises(ValueError):
+            pl.merge(pl)
+
+    def test_merge_other_type(self):
+        pl = PositionalList.from_iterable('abc')
+        with self.assertRaises(TypeError):
+            pl.merge(['d'])
+
+    def test_add_after_merge(self):
+        pl = PositionalList.from_iterable([1, 3])
+        pl.merge(PositionalList.from_iterable([2]))
+        four = pl.add_last(4)
+        zero = pl.add_first(0)
+        self.assertEqual(list(pl), [0, 1, 2, 3, 4])
+        self.assertTrue(zero < pl.after(zero) < four)
+
+
+class TestPositionalListTraversal(unittest.TestCase):
+
+    def test_positions(self):
+        pl = PositionalList.from_iterable('abc')
+        expected = [pl.first(), pl.after(pl.first()), pl.last()]
+        self.assertEqual(list(pl.positions()), expected)
+        self.assertEqual(list(pl.positions(reverse=True)), expected[::-1])
+
+    def test_positions_from_start(self):
+        pl = PositionalList.from_iterable('abcd')
+        start = pl.after(pl.first())
+        self.assertEqual([pos.payload() for pos in pl.positions(start)], list('bcd'))
+        self.assertEqual([pos.payload() for pos in pl.positions(start, reverse=True)], list('ba'))
+
+    def test_positions_empty(self):
+        self.assertEqual(list(PositionalList().positions()), [])
+        self.assertEqual(list(PositionalList().positions(reverse=True)), [])
+
+    def test_positions_are_interned(self):
+        pl = PositionalList.from_iterable('abc')
+        for pos, other in zip(pl.positions(), pl.positions()):
+            self.assertIs(pos, other)
+
+    def test_positions_validates_start(self):
+        pl = PositionalList.from_iterable('abc')
+        other = PositionalList.from_iterable('abc')
+        with self.assertRaises(ValueError):
+            next(pl.positions(other.first()))
+        with self.assertRaises(TypeError):
+            next(pl.positions('a'))
+
+    def test_positions_validates_start_when_called(self):
+        pl = PositionalList.from_iterable('abc')
+        first = pl.first()
+        pl.delete(first)
+        with self.assertRaises(ValueError):
+            pl.positions(first)
+        with self.assertRaises(ValueError):
+            pl.positions(PositionalList.from_iterable('abc').first(), reverse=True)
+        with self.assertRaises(TypeError):
+            pl.positions('a')
+
+    def test_unchecked(self):
+        pl = PositionalList.from_iterable('abc')
+        other = PositionalList.from_iterable('abc')
+        with pl.unchecked() as same:
+            self.assertIs(same, pl)
+            self.assertEqual(pl.after(pl.first()).payload(), 'b')
+            pl.after(other.first())    # not checked
+        with self.assertRaises(ValueError):
+            pl.after(other.first())
+
+    def test_unchecked_nested(self):
+        pl = PositionalList.from_iterable('abc')
+        with pl.unchecked():
+            with pl.unchecked():
+                pass
+            self.assertEqual(pl.after(pl.first()).payload(), 'b')
+        with self.assertRaises(TypeError):
+            pl.after('a')
+
+    def test_unchecked_restored_on_error(self):
+        pl = PositionalList.from_iterable('abc')
+        with self.assertRaises(KeyError):
+            with pl.unchecked():
+                raise KeyError
+        with self.assertRaises(TypeError):
+            pl.after('a')
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,184 @@
+import random
+import threading
+import unittest
+
+from congeries.src import PositionalList
+from congeries.src import SnapshotPositionalList
+
+
+class TestSnapshotPositionalList(unittest.TestCase):
+
+    def test_type(self):
+        self.assertIsInstance(SnapshotPositionalList(), PositionalList)
+
+    def test_snapshot_of_empty(self):
+        with SnapshotPositionalList().snapshot() as snap:
+            self.assertEqual(list(snap), [])
+            self.assertEqual(len(snap), 0)
+
+    def test_snapshot_is_frozen(self):
+        spl = SnapshotPositionalList.from_iterable('abcd')
+        with spl.snapshot() as snap:
+            spl.delete(spl.first())
+            spl.add_last('e')
+            spl.replace(spl.first(), 'B')
+            spl.add_after(spl.first(), 'x')
+            self.assertEqual(list(spl), list('Bxcde'))
+            self.assertEqual(list(snap), list('abcd'))
+            self.assertEqual(list(reversed(snap)), list('dcba'))
+            self.assertEqual(len(snap), 4)
+
+    def test_snapshot_survives_bulk_operations(self):
+        spl = SnapshotPositionalList.from_iterable(range(10))
+        with spl.snapshot() as snap:
+            spl.delete_range(spl.after(spl.first()), spl.last())
+            spl.add_many_after(spl.first(), range(5))
+            spl.move_to_front(spl.last())
+            spl.sort()
+            self.assertEqual(list(snap), list(range(10)))
+
+    def test_snapshot_survives_merge(self):
+        spl = SnapshotPositionalList.from_iterable([1, 3, 5])
+        other = SnapshotPositionalList.from_iterable([2, 4])
+        with spl.snapshot() as snap:
+            spl.merge(other)
+            self.assertEqual(list(spl), [1, 2, 3, 4, 5])
+            self.assertEqual(list(snap), [1, 3, 5])
+            self.assertEqual(list(other), [])
+
+    def test_merge_refuses_others_with_snapshots(self):
+        spl = SnapshotPositionalList.from_iterable([1, 3, 5])
+        other = SnapshotPositionalList.from_iterable([2, 4])
+        with other.snapshot() as other_snap:
+            with self.assertRaises(ValueError):
+                spl.merge(other)
+            self.assertEqual(list(spl), [1, 3, 5])
+            self.assertEqual(list(other), [2, 4])
+            self.assertEqual(list(other_snap), [2, 4])
+        spl.merge(other)
+        self.assertEqual(list(spl), [1, 2, 3, 4, 5])
+
+    def test_snapshot_after_merge(self):
+        spl = SnapshotPositionalList.from_iterable([1, 3])
+        other = SnapshotPositionalList.from_iterable([2, 4])
+        with other.snapshot():
+            other.replace(other.first(), 2)    # logs a state in the clock of other
+        spl.merge(other)
+        self.assertEqual(other._clock.logged, [])
+        self.assertTrue(all(record.clock is spl._clock for record in (pos.record for pos in spl.positions())))
+        with spl.snapshot() as snap:
+            spl.replace(spl.after(spl.first()), 99)
+            spl.delete(spl.last())
+            self.assertEqual(list(snap), [1, 2, 3, 4])
+            self.assertEqual(list(reversed(snap)), [4, 3, 2, 1])
+            self.assertEqual(list(spl), [1, 99, 3])
+        with other.snapshot() as other_snap:
+            other.add_last(5)
+            self.assertEqual(list(other_snap), [])
+
+    def test_successive_snapshots(self):
+        spl = SnapshotPositionalList()
+        snaps, expected = [], []
+        for step in range(50):
+            spl.add_last(step)
+            if step % 3 == 0:
+                spl.delete(spl.first())
+            snaps.append(spl.snapshot())
+            expected.append(list(spl))
+        for snap, payloads in zip(snaps, expected):
+            self.assertEqual(list(snap), payloads)
+        for snap in snaps:
+            snap.close()
+
+    def test_random_operations(self):
+        rng = random.Random(36)
+        spl = SnapshotPositionalList.from_iterable(range(20))
+        held = []
+        for step in range(500):
+            op = rng.random()
+            if op < 0.3 or len(spl) < 2:
+                spl.add_last(step)
+            elif op < 0.5:
+                spl.delete(spl.first())
+            elif op < 0.6:
+                spl.replace(spl.last(), -step)
+            elif op < 0.7:
+                spl.move_to_front(spl.last())
+            elif op < 0.8:
+                held.append((spl.snapshot(), list(spl)))
+            elif held:
+                snap, payloads = held.pop(rng.randrange(len(held)))
+                self.assertEqual(list(snap), payloads)
+                snap.close()
+        for snap, payloads in held:
+            self.assertEqual(list(snap), payloads)
+            snap.close()
+
+    def test_writes_are_not_logged_without_snapshots(self):
+        spl = SnapshotPositionalList.from_iterable('abc')
+        spl.add_last('d')
+        spl.delete(spl.first())
+        self.assertEqual(spl._clock.logged, [])
+        self.assertIsNone(spl.first().record.history)
+
+    def test_snapshots_are_per_list(self):
+        a = SnapshotPositionalList.from_iterable('abc')
+        b = SnapshotPositionalList.from_iterable(range(100))
+        with a.snapshot() as snap:
+            for pos in b.positions():
+                b.replace(pos, -pos.payload())
+            a.add_last('d')
+            self.assertEqual(b._clock.logged, [])
+            self.assertTrue(all(record.history is None for record in (b._header, b.first().record)))
+            self.assertEqual(len(a._clock.logged), 2)
+            self.assertEqual(list(snap), ['a', 'b', 'c'])
+        self.assertEqual(list(b), [-value for value in range(100)])
+
+    def test_released_states_are_collected(self):
+        spl = SnapshotPositionalList.from_iterable('abc')
+        snap = spl.snapshot()
+        spl.delete(spl.first())
+        self.assertIsNotNone(spl._header.history)
+        del snap
+        spl.add_last('d')
+        self.assertIsNone(spl._header.history)
+        self.assertEqual(spl._clock.logged, [])
+
+    def test_collect_keeps_states_of_live_snapshots(self):
+        spl = SnapshotPositionalList.from_iterable('abc')
+        old = spl.snapshot()
+        spl.delete(spl.first())
+        newer = spl.snapshot()
+        spl.delete(spl.first())
+        old.close()
+        spl.add_last('d')
+        self.assertEqual(list(newer), list('bc'))
+        self.assertEqual(list(spl), list('cd'))
+        newer.close()
+
+    def test_concurrent_reader(self):
+        spl = SnapshotPositionalList.from_iterable(range(100))
+        lock, done, errors = threading.Lock(), threading.Event(), []
+
+        def reader():
+            while not done.is_set():
+                with lock:
+                    snap, size = spl.snapshot(), len(spl)
+                with snap:
+                    payloads = list(snap)
+                if len(payloads) != size or payloads != sorted(payloads):
+                    errors.append(payloads)
+
+        thread = threading.Thread(target=reader)
+        thread.start()
+        for step in range(100, 3000):
+            with lock:
+                spl.add_last(step)
+                spl.delete(spl.first())
+        done.set()
+        thread.join()
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
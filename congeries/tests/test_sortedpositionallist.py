@@ -0,0 +1,110 @@
+import bisect
+import random
+import unittest
+
+from congeries.src import IndexablePositionalList
+from congeries.src import SortedPositionalList
+
+
+class TestSortedPositionalList(unittest.TestCase):
+
+    def test_type(self):
+        self.assertIsInstance(SortedPositionalList(), IndexablePositionalList)
+
+    def test_from_iterable_sorts(self):
+        spl = SortedPositionalList.from_iterable([3, 1, 2, 1])
+        self.assertEqual(list(spl), [1, 1, 2, 3])
+
+    def test_add(self):
+        spl = SortedPositionalList()
+        pos = spl.add(5)
+        spl.add(1)
+        spl.add(9)
+        self.assertEqual(list(spl), [1, 5, 9])
+        self.assertEqual(pos.payload(), 5)
+        self.assertEqual(spl.index(pos), 1)
+
+    def test_add_is_stable(self):
+        spl = SortedPositionalList.from_iterable([1, 2, 3])
+        first = spl.find(2)
+        second = spl.add(2)
+        self.assertLess(first, second)
+        self.assertEqual(spl.after(first), second)
+
+    def test_bisect(self):
+        spl = SortedPositionalList.from_iterable([1, 2, 2, 2, 5])
+        self.assertEqual(spl.bisect_left(2), 1)
+        self.assertEqual(spl.bisect_right(2), 4)
+        self.assertEqual(spl.bisect_left(0), 0)
+        self.assertEqual(spl.bisect_right(9), 5)
+        self.assertEqual(SortedPositionalList().bisect_left(1), 0)
+
+    def test_irange(self):
+        spl = SortedPositionalList.from_iterable(range(10))
+        self.assertEqual([pos.payload() for pos in spl.irange(3, 6)], [3, 4, 5, 6])
+        self.assertEqual([pos.payload() for pos in spl.irange(hi=1)], [0, 1])
+        self.assertEqual([pos.payload() for pos in spl.irange(8)], [8, 9])
+        self.assertEqual(list(spl.irange(6, 3)), [])
+
+    def test_find_and_contains(self):
+        spl = SortedPositionalList.from_iterable('bdf')
+        self.assertEqual(spl.find('d'), spl.after(spl.first()))
+        self.assertIsNone(spl.find('c'))
+        self.assertIn('f', spl)
+        self.assertNotIn('z', spl)
+
+    def test_remove_and_discard(self):
+        spl = SortedPositionalList.from_iterable([1, 2, 2, 3])
+        last_two = spl.before(spl.last())
+        spl.remove(2)
+        self.assertEqual(list(spl), [1, 2, 3])
+        self.assertEqual(spl.find(2), last_two)
+        self.assertTrue(spl.discard(3))
+        self.assertFalse(spl.discard(3))
+        with self.assertRaises(ValueError):
+            spl.remove(3)
+
+    def test_positional_updates_are_unsupported(self):
+        spl = SortedPositionalList.from_iterable([1, 2])
+        with self.assertRaises(TypeError):
+            spl.add_first(0)
+        with self.assertRaises(TypeError):
+            spl.add_after(spl.first(), 0)
+        with self.assertRaises(TypeError):
+            spl.replace(spl.first(), 3)
+        with self.assertRaises(TypeError):
+            spl.move_to_back(spl.first())
+        for name in ('add_last', 'add_before', 'add_many_after', 'add_many_before',
+                     'move_to_front', 'move_before', 'move_after'):
+            with self.subTest(name=name), self.assertRaises(TypeError):
+                getattr(spl, name)(spl.first(), 0)
+        self.assertEqual(list(spl), [1, 2])
+
+    def test_merge(self):
+        spl = SortedPositionalList.from_iterable([1, 4])
+        spl.merge(SortedPositionalList.from_iterable([2, 3, 5]))
+        self.assertEqual(list(spl), [1, 2, 3, 4, 5])
+        self.assertEqual(spl.bisect_left(4), 3)
+        with self.assertRaises(ValueError):
+            spl.merge(SortedPositionalList(), key=abs)
+
+    def test_random_operations(self):
+        rng = random.Random(37)
+        spl, model = SortedPositionalList(), []
+        for _ in range(2000):
+            value = rng.randrange(100)
+            if rng.random() < 0.6:
+                spl.add(value)
+                bisect.insort(model, value)
+            else:
+                self.assertEqual(spl.discard(value), value in model)
+                if value in model:
+                    model.remove(value)
+            self.assertEqual(spl.bisect_left(value), bisect.bisect_left(model, value))
+            self.assertEqual(spl.bisect_right(value), bisect.bisect_right(model, value))
+        self.assertEqual(list(spl), model)
+        self.assertEqual([spl.at(idx).payload() for idx in range(len(model))], model)
+
+
+if __name__ == '__main__':
+    unittest.main()
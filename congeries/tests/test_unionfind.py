@@ -1,9 +1,19 @@
+import math
+import os
+import random
+import tempfile
 import unittest
 
+from array import array
+from unittest import mock
+
+from congeries.src import KeyedUF
 from congeries.src import QuickFindUF
 from congeries.src import QuickUnionUF
+from congeries.src import RollbackUF
 from congeries.src import WeightedQuickUnionUF
 from congeries.src import WeightedQuickUnionPathCompressionUF
+from congeries.src.unionfind import _typecode
 
 
 class TestQuickFind(unittest.TestCase):
@@ -20,30 +30,49 @@ class TestQuickFind(unittest.TestCase):
         uf = QuickFindUF(10)
         union_seq = [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1), (8, 9),
                      (5, 0), (7, 2), (6, 1), (1, 0), (6, 7)]
+        # the smaller component is relabelled, p's on a tie
         expected_ids = [
             [0, 1, 2, 3, 3, 5, 6, 7, 8, 9],
-            [0, 1, 2, 8, 8, 5, 6, 7, 8, 9],
-            [0, 1, 2, 8, 8, 5, 5, 7, 8, 9],
-            [0, 1, 2, 8, 8, 5, 5, 7, 8, 8],
-            [0, 1, 1, 8, 8, 5, 5, 7, 8, 8],
-            [0, 1, 1, 8, 8, 5, 5, 7, 8, 8],
-            [0, 1, 1, 8, 8, 0, 0, 7, 8, 8],
-            [0, 1, 1, 8, 8, 0, 0, 1, 8, 8],
-            [1, 1, 1, 8, 8, 1, 1, 1, 8, 8],
-            [1, 1, 1, 8, 8, 1, 1, 1, 8, 8],
-            [1, 1, 1, 8, 8, 1, 1, 1, 8, 8],
+            [0, 1, 2, 3, 3, 5, 6, 7, 3, 9],
+            [0, 1, 2, 3, 3, 5, 5, 7, 3, 9],
+            [0, 1, 2, 3, 3, 5, 5, 7, 3, 3],
+            [0, 1, 1, 3, 3, 5, 5, 7, 3, 3],
+            [0, 1, 1, 3, 3, 5, 5, 7, 3, 3],
+            [5, 1, 1, 3, 3, 5, 5, 7, 3, 3],
+            [5, 1, 1, 3, 3, 5, 5, 1, 3, 3],
+            [1, 1, 1, 3, 3, 1, 1, 1, 3, 3],
+            [1, 1, 1, 3, 3, 1, 1, 1, 3, 3],
+            [1, 1, 1, 3, 3, 1, 1, 1, 3, 3],
         ]
         for (p, q), expected in zip(union_seq, expected_ids):
             uf.union(p, q)
             self.assertEqual(uf.id, expected)
 
+    def test_relabels_smaller_component(self):
+        n = 1024
+        uf = QuickFindUF(n).instrument()
+        for site in range(1, n):
+            uf.union(0, site)    # the growing component of 0 is never relabelled
+        self.assertEqual(len(set(uf.id)), 1)
+        self.assertEqual(uf.accesses_per_operation()['union'], 8)
+        uf = QuickFindUF(n).instrument()
+        width = 1
+        while width < n:
+            # merges components of equal sizes: half of the sites are relabelled on each level
+            for site in range(0, n, 2 * width):
+                uf.union(site, site + width)
+            width *= 2
+        self.assertEqual(uf.components_count, 1)
+        # 7 accesses per union, besides the relabelling of n / 2 sites on each of the lg n levels
+        self.assertEqual(uf.array_accesses['union'], 7 * (n - 1) + n // 2 * 10)
+
     def test_components_count_10(self):
         uf = QuickFindUF(10)
         self.assertEqual(uf.components_count, 10)
 
     def test_components_count_7(self):
         """
-        [0, 1, 2, 8, 8, 5, 5, 7, 8, 9]
+        [0, 1, 2, 3, 3, 5, 5, 7, 3, 9]
         """
         uf = QuickFindUF(10)
         union_seq = [(4, 3), (3, 8), (6, 5)]
@@ -53,7 +82,7 @@ class TestQuickFind(unittest.TestCase):
 
     def test_components_count_5(self):
         """
-        [0, 1, 1, 8, 8, 5, 5, 7, 8, 8]
+        [0, 1, 1, 3, 3, 5, 5, 7, 3, 3]
         """
         uf = QuickFindUF(10)
         union_seq = [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1)]
@@ -63,7 +92,7 @@ class TestQuickFind(unittest.TestCase):
 
     def test_components_count_also_5(self):
         """
-        [0, 1, 1, 8, 8, 5, 5, 7, 8, 8]
+        [0, 1, 1, 3, 3, 5, 5, 7, 3, 3]
         """
         uf = QuickFindUF(10)
         union_seq = [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1), (8, 9)]
@@ -73,7 +102,7 @@ class TestQuickFind(unittest.TestCase):
 
     def test_components_count_2(self):
         """
-        [1, 1, 1, 8, 8, 1, 1, 1, 8, 8]
+        [1, 1, 1, 3, 3, 1, 1, 1, 3, 3]
         """
         uf = QuickFindUF(10)
         union_seq = [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1), (8, 9),
@@ -266,5 +295,418 @@ class TestWeightedQuickUnionPathCompression(unittest.TestCase):
         self.assertEqual(uf.components_count, 2)
 
 
+class TestWeightedUnionSize(unittest.TestCase):
+
+    def test_sizes_are_component_sizes(self):
+        rng = random.Random(39)
+        for cls in (WeightedQuickUnionUF, WeightedQuickUnionPathCompressionUF):
+            uf = cls(200)
+            for _ in range(150):
+                uf.union(rng.randrange(200), rng.randrange(200))
+            roots = [uf._find(site) for site in range(200)]
+            for root in set(roots):
+                self.assertEqual(uf.sz[root], roots.count(root))
+
+    def test_depth_is_logarithmic(self):
+        n = 1 << 10
+        uf = WeightedQuickUnionUF(n)
+        # merging equal sized trees, pairwise, reaches the lg n bound
+        step = 1
+        while step < n:
+            for site in range(0, n, 2 * step):
+                uf.union(site, site + step)
+            step *= 2
+        self.assertEqual(uf.max_depth(), int(math.log2(n)))
+        rng = random.Random(39)
+        uf = WeightedQuickUnionUF(n)
+        for _ in range(4 * n):
+            uf.union(rng.randrange(n), rng.randrange(n))
+        self.assertLessEqual(uf.max_depth(), int(math.log2(n)))
+
+
+class TestUnionFindInstrumentation(unittest.TestCase):
+
+    def test_max_depth(self):
+        uf = QuickUnionUF(5)
+        self.assertEqual(uf.max_depth(), 0)
+        for site in range(4):
+            uf.union(site, site + 1)
+        self.assertEqual(uf.max_depth(), 4)
+        self.assertEqual(uf.average_path_length(), (4 + 3 + 2 + 1 + 0) / 5)
+
+    def test_quick_find_depth(self):
+        uf = QuickFindUF(10)
+        for p, q in [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1)]:
+            uf.union(p, q)
+        self.assertEqual(uf.max_depth(), 1)
+        self.assertEqual(uf.average_path_length(), 0.5)
+
+    def test_empty(self):
+        uf = WeightedQuickUnionUF(0)
+        self.assertEqual(uf.max_depth(), 0)
+        self.assertEqual(uf.average_path_length(), 0.0)
+
+    def test_array_accesses(self):
+        uf = QuickFindUF(10).instrument()
+        uf.union(0, 1)    # 2 finds, 2 size reads, 1 write while relabelling, 3 to update the size
+        self.assertTrue(uf.connected(0, 1))
+        self.assertEqual(uf.accesses_per_operation(), {'union': 8, 'connected': 2})
+
+    def test_instrumented_behaviour(self):
+        union_seq = [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1), (8, 9),
+                     (5, 0), (7, 2), (6, 1), (1, 0), (6, 7)]
+        for cls in (QuickFindUF, QuickUnionUF, WeightedQuickUnionUF, WeightedQuickUnionPathCompressionUF):
+            uf, instrumented = cls(10), cls(10).instrument()
+            for p, q in union_seq:
+                uf.union(p, q)
+                instrumented.union(p, q)
+            self.assertEqual(instrumented.id, uf.id)
+            self.assertEqual(instrumented.operations['union'], len(union_seq))
+            self.assertGreater(instrumented.array_accesses['union'], 0)
+            self.assertEqual(instrumented.max_depth(), uf.max_depth())
+
+
+class TestUnionFindMembership(unittest.TestCase):
+
+    classes = (QuickFindUF, QuickUnionUF, WeightedQuickUnionUF, WeightedQuickUnionPathCompressionUF)
+
+    def test_initial(self):
+        for cls in self.classes:
+            uf = cls(4)
+            self.assertEqual(uf.size(2), 1)
+            self.assertEqual(uf.members(2), [2])
+            self.assertEqual(sorted(uf.components()), [[0], [1], [2], [3]])
+            self.assertEqual(list(cls(0).components()), [])
+
+    def test_union(self):
+        union_seq = [(4, 3), (3, 8), (6, 5), (9, 4), (2, 1), (8, 9),
+                     (5, 0), (7, 2), (6, 1), (1, 0), (6, 7)]
+        for cls in self.classes:
+            uf = cls(10)
+            for p, q in union_seq:
+                uf.union(p, q)
+            self.assertEqual(uf.size(0), 6)
+            self.assertEqual(uf.size(9), 4)
+            self.assertEqual(uf.members(3)[0], 3)
+            self.assertEqual(sorted(uf.members(3)), [3, 4, 8, 9])
+            self.assertEqual(sorted(sorted(members) for members in uf.components()),
+                             [[0, 1, 2, 5, 6, 7], [3, 4, 8, 9]])
+
+    def test_random_unions(self):
+        rng = random.Random(42)
+        for cls in self.classes:
+            uf = cls(60)
+            for _ in range(40):
+                uf.union(rng.randrange(60), rng.randrange(60))
+                components = list(uf.components())
+                self.assertEqual(len(components), uf.components_count)
+                self.assertEqual(sorted(site for members in components for site in members), list(range(60)))
+                for members in components:
+                    self.assertTrue(all(uf.connected(members[0], site) for site in members))
+                    self.assertEqual(uf.size(members[-1]), len(members))
+
+
+class TestKeyedUF(unittest.TestCase):
+
+    def test_type(self):
+        self.assertIsInstance(KeyedUF(), WeightedQuickUnionPathCompressionUF)
+
+    def test_init_and_add(self):
+        uf = KeyedUF(['a.example.com', 'b.example.com', 'a.example.com'])
+        self.assertEqual(len(uf), 2)
+        self.assertEqual(uf.components_count, 2)
+        self.assertEqual(uf.add('c.example.com'), 2)
+        self.assertEqual(uf.make_set('a.example.com'), 0)
+        self.assertEqual(uf.components_count, 3)
+        self.assertIn('c.example.com', uf)
+        self.assertNotIn('d.example.com', uf)
+
+    def test_union_adds_keys(self):
+        uf = KeyedUF()
+        uf.union('a', 'b')
+        uf.union('c', 'd')
+        self.assertEqual(uf.components_count, 2)
+        uf.union('b', 'c')
+        self.assertTrue(uf.connected('a', 'd'))
+        self.assertEqual(uf.components_count, 1)
+        self.assertEqual(uf.find('d'), uf.find('a'))
+
+    def test_unknown_key(self):
+        uf = KeyedUF('ab')
+        with self.assertRaises(KeyError):
+            uf.connected('a', 'z')
+        with self.assertRaises(KeyError):
+            uf.find('z')
+
+    def test_matches_integer_sites(self):
+        rng = random.Random(41)
+        keys = [f'host-{idx}' for idx in range(100)]
+        uf, reference = KeyedUF(keys), WeightedQuickUnionPathCompressionUF(100)
+        for _ in range(80):
+            p, q = rng.randrange(100), rng.randrange(100)
+            uf.union(keys[p], keys[q])
+            reference.union(p, q)
+        self.assertEqual(uf.id, reference.id)
+        self.assertEqual(uf.components_count, reference.components_count)
+        for _ in range(100):
+            p, q = rng.randrange(100), rng.randrange(100)
+            self.assertEqual(uf.connected(keys[p], keys[q]), reference.connected(p, q))
+
+    def test_membership(self):
+        uf = KeyedUF()
+        uf.union('a', 'b')
+        uf.union('c', 'b')
+        uf.add('d')
+        self.assertEqual(uf.size('c'), 3)
+        self.assertEqual(sorted(uf.members('a')), ['a', 'b', 'c'])
+        self.assertEqual(sorted(sorted(members) for members in uf.components()), [['a', 'b', 'c'], ['d']])
+
+    def test_instrumented(self):
+        uf = KeyedUF('abc').instrument()
+        uf.union('a', 'b')
+        self.assertTrue(uf.connected('a', 'b'))
+        self.assertEqual(uf.operations['union'], 1)
+
+
+class TestRollbackUF(unittest.TestCase):
+
+    def state(self, uf):
+        return list(uf.id), list(uf.sz), list(uf.ring), uf.components_count
+
+    def test_type(self):
+        uf = RollbackUF(10)
+        self.assertIsInstance(uf, WeightedQuickUnionUF)
+        self.assertNotIsInstance(uf, WeightedQuickUnionPathCompressionUF)
+
+    def test_rollback(self):
+        uf = RollbackUF(10)
+        for p, q in [(4, 3), (3, 8), (6, 5)]:
+            uf.union(p, q)
+        mark, before = uf.checkpoint(), self.state(uf)
+        for p, q in [(9, 4), (2, 1), (8, 9), (5, 0), (7, 2), (6, 1)]:
+            uf.union(p, q)
+        self.assertEqual(uf.components_count, 2)
+        self.assertTrue(uf.connected(0, 7))
+        uf.rollback(mark)
+        self.assertEqual(self.state(uf), before)
+        self.assertFalse(uf.connected(0, 7))
+        self.assertEqual(sorted(uf.members(3)), [3, 4, 8])
+        uf.rollback()
+        self.assertEqual(self.state(uf), self.state(RollbackUF(10)))
+
+    def test_redundant_unions_are_not_logged(self):
+        uf = RollbackUF(5)
+        uf.union(0, 1)
+        uf.union(1, 0)
+        uf.union(2, 2)
+        self.assertEqual(uf.checkpoint(), 1)
+        self.assertTrue(uf.undo())
+        self.assertFalse(uf.undo())
+
+    def test_random_backtracking(self):
+        rng = random.Random(45)
+        n = 60
+        uf, marks = RollbackUF(n), []
+        for _ in range(300):
+            if marks and rng.random() < 0.3:
+                mark, state = marks.pop()
+                uf.rollback(mark)
+                self.assertEqual(self.state(uf), state)
+            else:
+                marks.append((uf.checkpoint(), self.state(uf)))
+                for _ in range(rng.randrange(1, 6)):
+                    uf.union(rng.randrange(n), rng.randrange(n))
+            self.assertLessEqual(uf.max_depth(), int(math.log2(n)))
+            self.assertEqual(sum(len(members) for members in uf.components()), n)
+
+    def test_invalid_checkpoint(self):
+        uf = RollbackUF(5)
+        uf.union(0, 1)
+        for to in (-1, 2):
+            with self.assertRaises(ValueError):
+                uf.rollback(to)
+
+
+class TestUnionFindPersistence(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, 'uf.bin')
+        rng = random.Random(46)
+        self.n = 200
+        self.pairs = [(rng.randrange(self.n), rng.randrange(self.n)) for _ in range(150)]
+
+    def build(self, cls):
+        uf = cls(self.n)
+        for p, q in self.pairs:
+            uf.union(p, q)
+        return uf
+
+    def assertSameState(self, uf, other):
+        self.assertEqual(list(uf.id), list(other.id))
+        self.assertEqual(list(uf.sz), list(other.sz))
+        self.assertEqual(list(uf.ring), list(other.ring))
+        self.assertEqual(uf.components_count, other.components_count)
+
+    def test_round_trip(self):
+        for cls in (QuickFindUF, QuickUnionUF, WeightedQuickUnionUF, WeightedQuickUnionPathCompressionUF, RollbackUF):
+            uf = self.build(cls)
+            uf.save(self.path)
+            self.assertEqual(os.path.getsize(self.path), 32 + 3 * 4 * self.n)
+            for mmap in (True, False):
+                loaded = cls.load(self.path, mmap=mmap)
+                self.assertIs(type(loaded), cls)
+                self.assertSameState(loaded, uf)
+                self.assertIsInstance(loaded.id, memoryview if mmap else list)
+                self.assertEqual({frozenset(members) for members in loaded.components()},
+                                 {frozenset(members) for members in uf.components()})
+
+    def test_mapped_file_is_not_modified(self):
+        uf = self.build(WeightedQuickUnionPathCompressionUF)
+        uf.save(self.path)
+        with open(self.path, 'rb') as f:
+            saved = f.read()
+        loaded = WeightedQuickUnionPathCompressionUF.load(self.path)
+        for site in range(self.n):
+            loaded.union(site, (site * 7) % self.n)
+        self.assertLess(loaded.components_count, uf.components_count)
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), saved)
+        self.assertSameState(WeightedQuickUnionPathCompressionUF.load(self.path), uf)
+        # saved over while mapped: the map keeps the former file
+        loaded.save(self.path)
+        self.assertSameState(WeightedQuickUnionPathCompressionUF.load(self.path, mmap=False), loaded)
+        self.assertEqual(sum(len(members) for members in loaded.components()), self.n)
+
+    def test_load_into_another_class(self):
+        self.build(QuickFindUF).save(self.path)
+        uf = WeightedQuickUnionUF.load(self.path)
+        reference = self.build(WeightedQuickUnionUF)
+        for p in range(0, self.n, 3):
+            self.assertEqual(uf.size(p), reference.size(p))
+        self.build(QuickUnionUF).save(self.path)
+        with self.assertRaises(ValueError):
+            QuickFindUF.load(self.path)
+
+    def test_rollback_after_load(self):
+        self.build(RollbackUF).save(self.path)
+        uf = RollbackUF.load(self.path)
+        count, mark = uf.components_count, uf.checkpoint()
+        uf.union(0, 1)
+        uf.rollback(mark)
+        self.assertEqual(uf.components_count, count)
+
+    def test_invalid_files(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a union-find file, at all..')
+            f.write(b'.')
+        with self.assertRaises(ValueError):
+            WeightedQuickUnionUF.load(self.path)
+        self.build(WeightedQuickUnionUF).save(self.path)
+        with open(self.path, 'r+b') as f:
+            f.truncate(100)
+        with self.assertRaises(ValueError):
+            WeightedQuickUnionUF.load(self.path)
+
+    def test_short_file(self):
+        for size in (0, 10):
+            with self.subTest(size=size):
+                with open(self.path, 'wb') as f:
+                    f.write(b'CGUF' + b'\0' * (size - 4) if size else b'')
+                with self.assertRaises(ValueError):
+                    WeightedQuickUnionUF.load(self.path)
+                with self.assertRaises(ValueError):
+                    WeightedQuickUnionUF.load(self.path, mmap=False)
+
+    def test_empty(self):
+        WeightedQuickUnionUF(0).save(self.path)
+        uf = WeightedQuickUnionUF.load(self.path)
+        self.assertEqual(uf.components_count, 0)
+        self.assertEqual(list(uf.components()), [])
+
+    @unittest.skipIf(os.name == 'nt', 'POSIX permissions')
+    def test_file_mode(self):
+        umask = os.umask(0o027)
+        self.addCleanup(os.umask, umask)
+        with mock.patch('os.umask', side_effect=AssertionError('the umask is process wide')):
+            self.build(WeightedQuickUnionUF).save(self.path)
+        self.assertEqual(os.stat(self.path).st_mode & 0o7777, 0o640)
+        os.chmod(self.path, 0o604)
+        self.build(QuickFindUF).save(self.path)
+        self.assertEqual(os.stat(self.path).st_mode & 0o7777, 0o604)
+        self.assertSameState(QuickFindUF.load(self.path), self.build(QuickFindUF))
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['uf.bin'])
+
+    def test_keyed(self):
+        with self.assertRaises(TypeError):
+            KeyedUF('abc').save(self.path)
+        with self.assertRaises(TypeError):
+            KeyedUF.load(self.path)
+
+
+class TestUnionFindTypedStorage(unittest.TestCase):
+
+    classes = (QuickFindUF, QuickUnionUF, WeightedQuickUnionUF, WeightedQuickUnionPathCompressionUF, RollbackUF)
+
+    def test_arrays(self):
+        for cls in self.classes:
+            uf = cls(10, typed=True)
+            for name in ('id', 'sz', 'ring'):
+                values = getattr(uf, name)
+                self.assertIsInstance(values, array)
+                self.assertEqual(values.typecode, 'i')
+            self.assertEqual(list(uf.id), list(range(10)))
+            self.assertEqual(list(uf.sz), [1] * 10)
+            self.assertIsInstance(cls(10).id, list)
+
+    def test_typecode(self):
+        self.assertEqual(_typecode(0), 'i')
+        self.assertEqual(_typecode(2 ** 31 - 1), 'i')
+        self.assertEqual(_typecode(2 ** 31), 'q')
+
+    def test_matches_lists(self):
+        rng = random.Random(47)
+        n = 300
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(250)]
+        for cls in self.classes:
+            lists, arrays = cls(n), cls(n, typed=True)
+            for p, q in pairs:
+                lists.union(p, q)
+                arrays.union(p, q)
+            self.assertEqual(list(arrays.id), lists.id)
+            self.assertEqual(list(arrays.sz), lists.sz)
+            self.assertEqual(list(arrays.ring), lists.ring)
+            self.assertEqual(arrays.components_count, lists.components_count)
+            self.assertEqual(list(arrays.components()), list(lists.components()))
+            self.assertEqual(arrays.max_depth(), lists.max_depth())
+
+    def test_rollback(self):
+        uf = RollbackUF(10, typed=True)
+        uf.union(0, 1)
+        mark = uf.checkpoint()
+        uf.union(1, 2)
+        uf.rollback(mark)
+        self.assertEqual(sorted(uf.members(0)), [0, 1])
+        self.assertEqual(uf.size(2), 1)
+
+    def test_instrument(self):
+        uf = WeightedQuickUnionUF(10, typed=True).instrument()
+        uf.union(0, 1)
+        self.assertGreater(uf.accesses_per_operation()['union'], 0)
+
+    def test_save_load(self):
+        uf = WeightedQuickUnionPathCompressionUF(50, typed=True)
+        for site in range(0, 50, 2):
+            uf.union(site, (site * 3) % 50)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'uf.bin')
+            uf.save(path)
+            loaded = WeightedQuickUnionPathCompressionUF.load(path)
+            self.assertEqual(list(loaded.id), list(uf.id))
+            self.assertEqual(loaded.components_count, uf.components_count)
+            del loaded
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+
+from congeries.src import PositionalList
+from congeries.src import ValueIndexedPositionalList
+
+
+class TestValueIndexedPositionalList(unittest.TestCase):
+
+    def test_type(self):
+        self.assertIsInstance(ValueIndexedPositionalList(), PositionalList)
+
+    def test_contains(self):
+        vpl = ValueIndexedPositionalList.from_iterable('abc')
+        self.assertIn('b', vpl)
+        self.assertNotIn('z', vpl)
+        self.assertNotIn([], vpl)
+
+    def test_find(self):
+        vpl = ValueIndexedPositionalList()
+        a = vpl.add_first('a')
+        b = vpl.add_after(a, 'b')
+        self.assertEqual(vpl.find('b'), b)
+        self.assertIsNone(vpl.find('z'))
+
+    def test_find_all(self):
+        vpl = ValueIndexedPositionalList()
+        a1 = vpl.add_last('a')
+        vpl.add_last('b')
+        a2 = vpl.add_last('a')
+        self.assertEqual(vpl.find_all('a'), [a1, a2])
+        self.assertEqual(vpl.find_all('z'), [])
+        self.assertEqual(vpl.count('a'), 2)
+
+    def test_find_follows_list_order(self):
+        vpl = ValueIndexedPositionalList.from_iterable('ab')
+        a3 = vpl.add_last('a')
+        a1 = vpl.add_first('a')
+        a2 = vpl.find_all('a')[1]
+        self.assertEqual(vpl.find('a'), a1)
+        self.assertEqual(vpl.find_all('a'), [a1, a2, a3])
+        vpl.move_to_back(a1)
+        self.assertEqual(vpl.find('a'), a2)
+        self.assertEqual(vpl.find_all('a'), [a2, a3, a1])
+        vpl.remove('a')
+        self.assertEqual(list(vpl), ['b', 'a', 'a'])
+        self.assertEqual(vpl.find_all('a'), [a3, a1])
+
+    def test_unhashable_queries(self):
+        vpl = ValueIndexedPositionalList.from_iterable('abc')
+        self.assertIsNone(vpl.find([]))
+        self.assertEqual(vpl.find_all([]), [])
+        self.assertEqual(vpl.count([]), 0)
+        with self.assertRaises(ValueError):
+            vpl.remove([])
+
+    def test_delete_updates_index(self):
+        vpl = ValueIndexedPositionalList.from_iterable('abca')
+        vpl.delete(vpl.find('a'))
+        self.assertEqual(vpl.count('a'), 1)
+        self.assertEqual(vpl.find('a'), vpl.last())
+        vpl.delete(vpl.last())
+        self.assertNotIn('a', vpl)
+
+    def test_replace_updates_index(self):
+        vpl = ValueIndexedPositionalList.from_iterable('abc')
+        b = vpl.find('b')
+        self.assertEqual(vpl.replace(b, 'B'), 'b')
+        self.assertNotIn('b', vpl)
+        self.assertEqual(vpl.find('B'), b)
+
+    def test_remove(self):
+        expected = ValueIndexedPositionalList.from_iterable('bca')
+        vpl = ValueIndexedPositionalList.from_iterable('abca')
+        vpl.remove('a')
+        self.assertEqual(vpl, expected)
+        with self.assertRaises(ValueError):
+            vpl.remove('z')
+
+    def test_bulk_operations_update_index(self):
+        vpl = ValueIndexedPositionalList.from_iterable('az')
+        vpl.add_many_after(vpl.first(), 'bcd')
+        self.assertEqual(vpl.find('c'), vpl.after(vpl.after(vpl.first())))
+        vpl.delete_range(vpl.find('b'), vpl.find('d'))
+        self.assertEqual([value in vpl for value in 'abcdz'], [True, False, False, False, True])
+
+    def test_merge_moves_index(self):
+        vpl = ValueIndexedPositionalList.from_iterable([1, 3])
+        other = ValueIndexedPositionalList.from_iterable([2, 3])
+        vpl.merge(other)
+        self.assertEqual(vpl.count(3), 2)
+        self.assertEqual(vpl.find(2), vpl.after(vpl.first()))
+        self.assertNotIn(2, other)
+        vpl.remove(2)
+        self.assertEqual(list(vpl), [1, 3, 3])
+
+    def test_unhashable(self):
+        vpl = ValueIndexedPositionalList()
+        with self.assertRaises(TypeError):
+            vpl.add_first([])
+        with self.assertRaises(TypeError):
+            vpl.add_many_before(vpl.add_first('a'), ['b', []])
+        self.assertEqual(len(vpl), 1)
+
+    def test_sort_keeps_index(self):
+        vpl = ValueIndexedPositionalList.from_iterable([3, 1, 2])
+        vpl.sort()
+        self.assertEqual(vpl.find(3), vpl.last())
+        self.assertEqual(vpl.find(1), vpl.first())
+
+
+if __name__ == '__main__':
+    unittest.main()
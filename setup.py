@@ -5,4 +5,10 @@ setup(
     name='congeries',
     version='0.0.1',
     packages=find_packages(),
+    extras_require={
+        'numpy': ['numpy'],
+    },
+    entry_points={
+        'console_scripts': ['congeries-filter = congeries.src.connectivityfilter:main'],
+    },
 )
\ No newline at end of file